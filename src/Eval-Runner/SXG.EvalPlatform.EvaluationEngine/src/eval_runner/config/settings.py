@@ -2,14 +2,23 @@
 Configuration management for the evaluation runner.
 """
 
+import atexit
 import json
 import os
+import queue
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 import logging
+import logging.handlers
 
 from ..exceptions import ConfigurationError
 
+# Log formats are resolved once and the Formatter instances shared by all handlers
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_LOG_FORMAT_NO_TIMESTAMP = '%(name)s - %(levelname)s - %(message)s'
+_FORMATTER = logging.Formatter(_LOG_FORMAT)
+_FORMATTER_NO_TIMESTAMP = logging.Formatter(_LOG_FORMAT_NO_TIMESTAMP)
+
 @dataclass
 class ManagedIdentityConfig:
     """Configuration for Managed Identity authentication."""
@@ -79,16 +88,46 @@ class EvaluationConfig:
     queue_polling_interval_seconds: int = 30
     queue_visibility_timeout_seconds: int = 300
     max_message_retries: int = 2  # Maximum retries for failed queue messages
+    max_concurrent_evaluations: int = 4  # Eval runs processed at the same time by one worker
+    metrics_config_cache_ttl_seconds: int = 300  # Reuse a parsed metrics configuration for this long (0 disables)
+    metrics_config_cache_size: int = 128  # Most recently used metrics configurations kept in the cache
+    queue_batch_size: int = 8  # Most messages received per poll, further limited by free evaluation slots (Azure caps this at 32)
+    queue_batch_timeout_ms: int = 500  # Stop requesting more pages this long after the first message of a poll arrived
+    max_parallel_local_metrics: int = 16  # Concurrent evaluations of locally computed (text_similarity) metrics
+    deduplicate_items: bool = False  # Score identical items once and share the scores (model-judged metrics then get one sample instead of several)
+    max_metric_threads: int = 32  # Threads running the synchronous metric evaluators, shared by all eval runs
     
     def validate(self) -> None:
         """Validate evaluation configuration."""
+        if self.max_concurrent_evaluations <= 0:
+            raise ConfigurationError("max_concurrent_evaluations must be positive")
+        if not 1 <= self.queue_batch_size <= 32:
+            raise ConfigurationError("queue_batch_size must be between 1 and 32")
         if self.max_parallel_metrics <= 0:
             raise ConfigurationError("max_parallel_metrics must be positive")
+        if self.max_parallel_local_metrics <= 0:
+            raise ConfigurationError("max_parallel_local_metrics must be positive")
+        if self.max_metric_threads <= 0:
+            raise ConfigurationError("max_metric_threads must be positive")
+        if self.metrics_config_cache_size <= 0:
+            raise ConfigurationError("metrics_config_cache_size must be positive")
         if self.timeout_seconds <= 0:
             raise ConfigurationError("timeout_seconds must be positive")
         if self.retry_attempts < 0:
             raise ConfigurationError("retry_attempts must be non-negative")
 
+@dataclass
+class DiagnosticsConfig:
+    """Configuration for startup and on-demand diagnostics."""
+    check_timeout_seconds: float = 5.0  # Budget for checks without a specific timeout below
+    auth_timeout_seconds: float = 10.0  # Token acquisition / auth header checks
+    storage_timeout_seconds: float = 15.0  # Whole storage connectivity check (initialize + peek)
+    storage_peek_timeout_seconds: float = 5.0  # Queue peek operation only
+    api_timeout_seconds: float = 20.0  # Default configuration endpoint call
+    tcp_probe_timeout_seconds: float = 0.3  # Quick TCP connect before the API call (0 disables)
+    cache_ttl_seconds: float = 10.0  # Reuse the last summary for probes within this window (0 disables)
+    background_interval_seconds: float = 60.0  # Refresh period of the background health snapshot (0 disables)
+
 @dataclass
 class AzureAIConfig:
     """Configuration for Azure AI services (both OpenAI and AI Foundry)."""
@@ -140,6 +179,9 @@ class LoggingConfig:
     azure_core_level: str = "Warning"
     azure_monitor_level: str = "Warning"
     azure_identity_level: str = "Warning"
+    include_timestamps: bool = True  # Disable when the host (e.g. container runtime) already timestamps lines
+    async_console: bool = True  # Write console records from a background thread instead of the event loop
+    log_operation_start: bool = False  # Emit "Starting operation" records for each processed eval run
 
 class AppSettings:
     """Application settings manager."""
@@ -165,6 +207,7 @@ class AppSettings:
         self.api_endpoints = self._load_api_endpoints_config()
         self.api_authentication = self._load_api_authentication_config()
         self.evaluation = self._load_evaluation_config()
+        self.diagnostics = self._load_diagnostics_config()
         self.application_insights = self._load_application_insights_config()
         self.logging = self._load_logging_config()
         self.azure_ai = self._load_azure_ai_config()
@@ -389,6 +432,92 @@ class AppSettings:
                 eval_config.get('QueueVisibilityTimeoutSeconds'),
                 'Evaluation__QueueVisibilityTimeoutSeconds',
                 300
+            )),
+            max_concurrent_evaluations=int(self._get_config_value(
+                eval_config.get('MaxConcurrentEvaluations'),
+                'Evaluation__MaxConcurrentEvaluations',
+                4
+            )),
+            metrics_config_cache_ttl_seconds=int(self._get_config_value(
+                eval_config.get('MetricsConfigCacheTtlSeconds'),
+                'Evaluation__MetricsConfigCacheTtlSeconds',
+                300
+            )),
+            metrics_config_cache_size=int(self._get_config_value(
+                eval_config.get('MetricsConfigCacheSize'),
+                'Evaluation__MetricsConfigCacheSize',
+                128
+            )),
+            queue_batch_size=int(self._get_config_value(
+                eval_config.get('QueueBatchSize'),
+                'Evaluation__QueueBatchSize',
+                8
+            )),
+            queue_batch_timeout_ms=int(self._get_config_value(
+                eval_config.get('QueueBatchTimeoutMs'),
+                'Evaluation__QueueBatchTimeoutMs',
+                500
+            )),
+            max_parallel_local_metrics=int(self._get_config_value(
+                eval_config.get('MaxParallelLocalMetrics'),
+                'Evaluation__MaxParallelLocalMetrics',
+                16
+            )),
+            deduplicate_items=str(self._get_config_value(
+                eval_config.get('DeduplicateItems'),
+                'Evaluation__DeduplicateItems',
+                'False'
+            )).lower() in ('true', '1', 'yes'),
+            max_metric_threads=int(self._get_config_value(
+                eval_config.get('MaxMetricThreads'),
+                'Evaluation__MaxMetricThreads',
+                32
+            ))
+        )
+    
+    def _load_diagnostics_config(self) -> DiagnosticsConfig:
+        """Load diagnostics configuration with environment variable fallback."""
+        diag_config = self._config_data.get('Diagnostics', {})
+        return DiagnosticsConfig(
+            check_timeout_seconds=float(self._get_config_value(
+                diag_config.get('CheckTimeoutSeconds'),
+                'Diagnostics__CheckTimeoutSeconds',
+                5.0
+            )),
+            auth_timeout_seconds=float(self._get_config_value(
+                diag_config.get('AuthTimeoutSeconds'),
+                'Diagnostics__AuthTimeoutSeconds',
+                10.0
+            )),
+            storage_timeout_seconds=float(self._get_config_value(
+                diag_config.get('StorageTimeoutSeconds'),
+                'Diagnostics__StorageTimeoutSeconds',
+                15.0
+            )),
+            storage_peek_timeout_seconds=float(self._get_config_value(
+                diag_config.get('StoragePeekTimeoutSeconds'),
+                'Diagnostics__StoragePeekTimeoutSeconds',
+                5.0
+            )),
+            api_timeout_seconds=float(self._get_config_value(
+                diag_config.get('ApiTimeoutSeconds'),
+                'Diagnostics__ApiTimeoutSeconds',
+                20.0
+            )),
+            tcp_probe_timeout_seconds=float(self._get_config_value(
+                diag_config.get('TcpProbeTimeoutSeconds'),
+                'Diagnostics__TcpProbeTimeoutSeconds',
+                0.3
+            )),
+            cache_ttl_seconds=float(self._get_config_value(
+                diag_config.get('CacheTtlSeconds'),
+                'Diagnostics__CacheTtlSeconds',
+                10.0
+            )),
+            background_interval_seconds=float(self._get_config_value(
+                diag_config.get('BackgroundIntervalSeconds'),
+                'Diagnostics__BackgroundIntervalSeconds',
+                60.0
             ))
         )
     
@@ -424,7 +553,22 @@ class AppSettings:
             microsoft_level=log_levels.get('Microsoft', 'Warning'),
             azure_core_level=log_levels.get('azure.core.pipeline.policies.http_logging_policy', 'Warning'),
             azure_monitor_level=log_levels.get('azure.monitor.opentelemetry.exporter', 'Warning'),
-            azure_identity_level=log_levels.get('azure.identity', 'Warning')
+            azure_identity_level=log_levels.get('azure.identity', 'Warning'),
+            include_timestamps=str(self._get_config_value(
+                logging_config.get('IncludeTimestamps'),
+                'Logging__IncludeTimestamps',
+                'True'
+            )).lower() in ('true', '1', 'yes'),
+            async_console=str(self._get_config_value(
+                logging_config.get('AsyncConsole'),
+                'Logging__AsyncConsole',
+                'True'
+            )).lower() in ('true', '1', 'yes'),
+            log_operation_start=str(self._get_config_value(
+                logging_config.get('LogOperationStart'),
+                'Logging__LogOperationStart',
+                'False'
+            )).lower() in ('true', '1', 'yes')
         )
     
     def _load_azure_ai_config(self) -> AzureAIConfig:
@@ -502,13 +646,19 @@ class AppSettings:
         
         # Clear any existing handlers to avoid duplicates
         logger = logging.getLogger()
+        self._stop_console_listener()
         for handler in logger.handlers[:]:
             logger.removeHandler(handler)
         
+        if self.logging.include_timestamps:
+            log_format, formatter = _LOG_FORMAT, _FORMATTER
+        else:
+            log_format, formatter = _LOG_FORMAT_NO_TIMESTAMP, _FORMATTER_NO_TIMESTAMP
+        
         # Configure root logger with empty handlers (we'll add specific ones)
         logging.basicConfig(
             level=default_level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            format=log_format,
             handlers=[],
             force=True
         )
@@ -519,9 +669,20 @@ class AppSettings:
         if self.application_insights.enable_console_logging:
             console_handler = logging.StreamHandler()
             console_handler.setLevel(default_level)
-            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
             console_handler.setFormatter(formatter)
-            handlers.append(console_handler)
+            if self.logging.async_console:
+                # Records are queued by the logging thread and written to stderr by a listener thread
+                log_queue = queue.SimpleQueue()
+                queue_handler = logging.handlers.QueueHandler(log_queue)
+                queue_handler.setLevel(default_level)
+                self._console_listener = logging.handlers.QueueListener(
+                    log_queue, console_handler, respect_handler_level=True
+                )
+                self._console_listener.start()
+                atexit.register(self._stop_console_listener)
+                handlers.append(queue_handler)
+            else:
+                handlers.append(console_handler)
             print(f"Console logging enabled with level: {self.logging.default_level}")
         
         # Configure OpenTelemetry if enabled
@@ -565,6 +726,13 @@ class AppSettings:
         logging.getLogger('azure.identity').setLevel(
             level_map.get(self.logging.azure_identity_level.upper(), logging.WARNING))
     
+    def _stop_console_listener(self) -> None:
+        """Flush queued console records and stop the listener thread, if one is running."""
+        listener = getattr(self, '_console_listener', None)
+        if listener is not None:
+            self._console_listener = None
+            listener.stop()
+    
     def shutdown_telemetry(self):
         """Shutdown telemetry providers gracefully."""
         try:
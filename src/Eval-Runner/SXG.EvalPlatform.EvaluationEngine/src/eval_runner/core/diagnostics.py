@@ -3,18 +3,29 @@ Diagnostics module for validating external dependencies and application health.
 """
 
 import asyncio
+import hashlib
 import logging
 import time
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from functools import partial
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple
 from enum import Enum
+from urllib.parse import urlparse
 
 from eval_runner.config.settings import app_settings
 from eval_runner.services.auth_token_provider import AuthTokenProvider
-# Note: Import actual service classes when available - using dynamic imports for now
+from eval_runner.services.azure_storage import AzureQueueService
+from eval_runner.services.http_client import get_api_client
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_CONFIG_ENDPOINT = "/api/v1/eval/configurations/defaultconfiguration"
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+_SUMMARY_CACHE_SIZE = 4
+# Lower-case substrings identifying a storage permission failure in an exception message
+_PERM_ERROR_MARKERS = ("authorizationpermissionmismatch", "not authorized")
+
 
 class HealthStatus(Enum):
     """Health check status enumeration."""
@@ -23,7 +34,7 @@ class HealthStatus(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class DiagnosticResult:
     """Result of a diagnostic check."""
     service_name: str
@@ -34,7 +45,7 @@ class DiagnosticResult:
     error: Optional[Exception] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DiagnosticSummary:
     """Summary of all diagnostic checks."""
     overall_status: HealthStatus
@@ -45,14 +56,148 @@ class DiagnosticSummary:
     timestamp: float
 
 
+class _Timer:
+    """Monotonic stopwatch that starts on creation."""
+    __slots__ = ('_start_ns',)
+    
+    def __init__(self):
+        self._start_ns = time.perf_counter_ns()
+    
+    @property
+    def ms(self) -> float:
+        """Milliseconds elapsed since the timer was created."""
+        return (time.perf_counter_ns() - self._start_ns) / 1e6
+
+
+class _RunToken:
+    """AAD token shared by the checks of one diagnostics run, acquired on first use."""
+    __slots__ = ('_future',)
+    
+    def __init__(self):
+        self._future: Optional[asyncio.Future] = None
+    
+    async def get(self, auth_provider: AuthTokenProvider) -> str:
+        """
+        Return the run's token, starting the acquisition on the first call.
+        
+        The acquisition is shielded so a timeout in one check does not cancel it for the others.
+        """
+        if self._future is None:
+            self._future = asyncio.ensure_future(auth_provider.get_token())
+        return await asyncio.shield(self._future)
+    
+    def discard(self) -> None:
+        """Cancel a pending acquisition when the run ends."""
+        token_future, self._future = self._future, None
+        if token_future is None:
+            return
+        if not token_future.done():
+            token_future.cancel()
+        elif not token_future.cancelled():
+            # Mark any failure as retrieved; it has already been reported by the checks
+            token_future.exception()
+
+
 class DiagnosticsService:
     """Service for validating application dependencies and health."""
     
-    def __init__(self):
-        """Initialize the diagnostics service."""
-        self._auth_provider: Optional[AuthTokenProvider] = None
-        self._storage_service: Optional[Any] = None
-        self._http_client: Optional[Any] = None
+    def __init__(self, auth_provider: Optional[AuthTokenProvider] = None, http_client: Optional[Any] = None):
+        """
+        Initialize the diagnostics service.
+        
+        Args:
+            auth_provider: Existing auth provider to reuse instead of creating one
+            http_client: Existing API client to reuse instead of resolving get_api_client()
+        """
+        self._auth_provider: Optional[AuthTokenProvider] = auth_provider
+        self._http_client: Optional[Any] = http_client
+        # Injected dependencies are owned (and closed) by the caller
+        self._owns_auth_provider = auth_provider is None
+        self._owns_http_client = http_client is None
+        # LRU of recent summaries keyed by (mode, settings signature) with their monotonic expiry time
+        self._cached_summaries: "OrderedDict[tuple, Tuple[DiagnosticSummary, float]]" = OrderedDict()
+        # Latest deep-check snapshot published by the background loop, with its monotonic time
+        self._latest: Optional[Tuple[DiagnosticSummary, float]] = None
+        self._background_task: Optional[asyncio.Task] = None
+        self._background_interval: float = 0.0
+        # Results of checks that only read app_settings, keyed by the settings each check read
+        self._config_check_results: Dict[str, Tuple[tuple, DiagnosticResult]] = {}
+    
+    async def start(self, interval_seconds: Optional[float] = None) -> None:
+        """
+        Start the background loop that keeps a fresh diagnostics snapshot.
+        
+        Args:
+            interval_seconds: Refresh period; defaults to Diagnostics:BackgroundIntervalSeconds
+        """
+        if self._background_task and not self._background_task.done():
+            return
+        
+        interval = interval_seconds if interval_seconds is not None else app_settings.diagnostics.background_interval_seconds
+        if interval <= 0:
+            logger.info("[DIAGNOSTICS_BACKGROUND] Background health updates disabled")
+            return
+        
+        self._background_interval = interval
+        self._background_task = asyncio.create_task(self._background_loop(interval))
+        logger.info("[DIAGNOSTICS_BACKGROUND] Refreshing diagnostics every %.0fs", interval)
+    
+    async def stop(self) -> None:
+        """Stop the background loop if it is running."""
+        task, self._background_task = self._background_task, None
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+    
+    async def _background_loop(self, interval: float) -> None:
+        """Re-run deep checks every interval and publish the result."""
+        while True:
+            # Sleep first: start() is called right after the startup diagnostics run
+            await asyncio.sleep(interval)
+            try:
+                summary = await self._execute_checks(include_deep_checks=True)
+                self._publish(summary)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("[DIAGNOSTICS_BACKGROUND] Background diagnostics run failed: %s", e)
+    
+    def _publish(self, summary: DiagnosticSummary) -> None:
+        """Swap in the latest deep-check snapshot (single assignment, safe for reader threads)."""
+        self._latest = (summary, time.monotonic())
+    
+    def get_latest(self) -> Optional[DiagnosticSummary]:
+        """
+        Return the latest background snapshot without running any checks.
+        
+        Returns:
+            The latest summary, an UNHEALTHY summary if the snapshot is older than
+            twice the refresh interval, or None if no deep run has completed yet
+        """
+        latest = self._latest
+        if latest is None:
+            return None
+        
+        summary, published_at = latest
+        age_seconds = time.monotonic() - published_at
+        if self._background_interval > 0 and age_seconds > 2 * self._background_interval:
+            stale_check = DiagnosticResult(
+                service_name="Diagnostics Freshness",
+                status=HealthStatus.UNHEALTHY,
+                message=f"Diagnostics snapshot is stale ({age_seconds:.0f}s old)",
+                details={"age_seconds": round(age_seconds), "interval_seconds": self._background_interval},
+                duration_ms=0
+            )
+            return replace(
+                summary,
+                overall_status=HealthStatus.UNHEALTHY,
+                checks=summary.checks + [stale_check],
+                unhealthy_count=summary.unhealthy_count + 1
+            )
+        return summary
     
     async def run_all_checks(self, include_deep_checks: bool = True) -> DiagnosticSummary:
         """
@@ -64,37 +209,154 @@ class DiagnosticsService:
         Returns:
             DiagnosticSummary with results of all checks
         """
-        logger.info("[DIAGNOSTICS_START] Starting comprehensive diagnostics...")
-        start_time = time.time()
+        cache_key = self._summary_cache_key(include_deep_checks)
+        cached = self._cached_summaries.get(cache_key)
+        if cached:
+            if time.monotonic() < cached[1]:
+                self._cached_summaries.move_to_end(cache_key)
+                logger.debug("[DIAGNOSTICS_CACHE] Returning cached diagnostics summary")
+                return cached[0]
+            del self._cached_summaries[cache_key]
         
-        checks = []
+        summary = await self._execute_checks(include_deep_checks)
+        if include_deep_checks:
+            self._publish(summary)
         
-        # Basic configuration checks (fast)
-        checks.append(await self._check_configuration())
+        cache_ttl = app_settings.diagnostics.cache_ttl_seconds
+        if cache_ttl > 0:
+            self._cached_summaries[cache_key] = (summary, time.monotonic() + cache_ttl)
+            self._cached_summaries.move_to_end(cache_key)
+            while len(self._cached_summaries) > _SUMMARY_CACHE_SIZE:
+                self._cached_summaries.popitem(last=False)
+        return summary
+    
+    @staticmethod
+    def _summary_cache_key(include_deep_checks: bool) -> tuple:
+        """
+        Key a cached summary by check mode and the settings the checks depend on.
         
-        # Authentication checks
-        checks.append(await self._check_authentication_setup())
-        if include_deep_checks:
-            checks.append(await self._check_token_acquisition())
+        A changed setting produces a different key, so a stale summary is never reused.
+        """
+        return (
+            include_deep_checks,
+            app_settings.api_endpoints.base_url,
+            app_settings.api_authentication.enable_authentication,
+            app_settings.api_authentication.tenant_id,
+            app_settings.api_authentication.scope,
+            app_settings.managed_identity.use_managed_identity,
+            app_settings.azure_storage.account_name,
+            app_settings.azure_storage.queue_name,
+            app_settings.azure_openai.endpoint,
+            app_settings.azure_openai.deployment_name,
+        )
+    
+    def _plan_checks(self, include_deep_checks: bool, run_token: _RunToken) -> Tuple[List[tuple], List[tuple]]:
+        """
+        Build the check schedule as (service_name, check coroutine function, timeout_seconds).
         
-        # Storage checks
-        checks.append(await self._check_storage_configuration())
-        if include_deep_checks:
-            checks.append(await self._check_storage_connectivity())
+        Args:
+            include_deep_checks: Whether to include slower, more comprehensive checks
+            run_token: Token shared by the checks of this run
         
-        # API endpoint checks
-        if include_deep_checks:
-            checks.append(await self._check_api_connectivity())
-            checks.append(await self._check_default_configuration_endpoint())
+        Returns:
+            (first_wave, second_wave) - second-wave checks need the auth provider created
+            by the first-wave "Authentication Setup" check
+        """
+        timeouts = app_settings.diagnostics
         
-        # Azure OpenAI checks
+        # Configuration and client setup (initializes _auth_provider); storage builds
+        # its own client, so it also starts immediately
+        first_wave = [
+            ("Configuration", self._check_configuration, timeouts.check_timeout_seconds),
+            ("Authentication Setup", self._check_authentication_setup, timeouts.auth_timeout_seconds),
+        ]
+        second_wave = []
         if include_deep_checks:
-            checks.append(await self._check_azure_openai_config())
+            first_wave.append(("Azure OpenAI Config", self._check_azure_openai_config, timeouts.check_timeout_seconds))
+            # Fused configuration + connectivity check
+            first_wave.append(("Storage Connectivity", self._check_storage, timeouts.storage_timeout_seconds))
+            
+            # Network checks that depend on the auth provider
+            second_wave = [
+                ("Token Acquisition", partial(self._check_token_acquisition, run_token), timeouts.auth_timeout_seconds),
+                ("API Connectivity", partial(self._check_api_connectivity, run_token), timeouts.auth_timeout_seconds),
+                ("Default Config Endpoint", partial(self._check_default_configuration_endpoint, run_token), timeouts.api_timeout_seconds),
+            ]
+        else:
+            first_wave.append(("Storage Configuration", self._check_storage_configuration, timeouts.check_timeout_seconds))
+        return first_wave, second_wave
+    
+    async def iter_checks(self, include_deep_checks: bool = True) -> AsyncIterator[DiagnosticResult]:
+        """
+        Run the checks concurrently and yield each result as soon as it completes.
+        
+        Args:
+            include_deep_checks: Whether to include slower, more comprehensive checks
+            
+        Yields:
+            DiagnosticResult in completion order
+        """
+        # Each run owns its token, so overlapping runs (background loop, /diagnostics thread)
+        # never share or cancel each other's acquisition
+        run_token = _RunToken()
+        first_wave, second_wave = self._plan_checks(include_deep_checks, run_token)
+        
+        def spawn(named_checks: List[tuple]) -> set:
+            return {
+                asyncio.ensure_future(self._run_named_check(name, check, timeout))
+                for name, check, timeout in named_checks
+            }
+        
+        pending = spawn(first_wave)
+        auth_setup_done = False
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    if result.service_name == "Authentication Setup":
+                        auth_setup_done = True
+                    yield result
+                
+                if auth_setup_done and second_wave:
+                    pending |= spawn(second_wave)
+                    second_wave = []
+        finally:
+            for task in pending:
+                task.cancel()
+            run_token.discard()
+    
+    async def _execute_checks(self, include_deep_checks: bool) -> DiagnosticSummary:
+        """Run the checks, bypassing any cached summary."""
+        logger.info("[DIAGNOSTICS_START] Starting comprehensive diagnostics...")
+        timer = _Timer()
+        
+        results: Dict[str, DiagnosticResult] = {}
+        async for result in self.iter_checks(include_deep_checks):
+            results[result.service_name] = result
+        
+        # Report in the same order as the sequential implementation
+        check_order = [
+            "Configuration",
+            "Authentication Setup",
+            "Token Acquisition",
+            "Storage Configuration",
+            "Storage Connectivity",
+            "API Connectivity",
+            "Default Config Endpoint",
+            "Azure OpenAI Config",
+        ]
+        checks = [results[name] for name in check_order if name in results]
         
         # Calculate summary
-        total_duration = (time.time() - start_time) * 1000
-        healthy_count = sum(1 for check in checks if check.status == HealthStatus.HEALTHY)
-        unhealthy_count = sum(1 for check in checks if check.status == HealthStatus.UNHEALTHY)
+        total_duration = timer.ms
+        healthy_count = 0
+        unhealthy_count = 0
+        for check in checks:
+            if check.status is HealthStatus.HEALTHY:
+                healthy_count += 1
+            elif check.status is HealthStatus.UNHEALTHY:
+                unhealthy_count += 1
         
         overall_status = (
             HealthStatus.HEALTHY if unhealthy_count == 0 
@@ -113,9 +375,69 @@ class DiagnosticsService:
         self._log_summary(summary)
         return summary
     
+    async def _run_check(self, name: str, check, timeout: float) -> DiagnosticResult:
+        """
+        Run a single check within its time budget.
+        
+        Args:
+            name: Service name reported if the check times out
+            check: Check coroutine function
+            timeout: Maximum seconds to wait for the check
+            
+        Returns:
+            The check result, or an UNHEALTHY result if the budget is exceeded
+        """
+        try:
+            return await asyncio.wait_for(check(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning("[DIAGNOSTICS_TIMEOUT] %s did not complete within %.1fs", name, timeout)
+            return DiagnosticResult(
+                service_name=name,
+                status=HealthStatus.UNHEALTHY,
+                message=f"Check timed out after {timeout:.1f} seconds",
+                details={"timeout_seconds": timeout},
+                duration_ms=timeout * 1000
+            )
+    
+    async def _run_named_check(self, name: str, check, timeout: float) -> DiagnosticResult:
+        """Run a check within its budget, converting an unexpected exception into an UNHEALTHY result."""
+        try:
+            return await self._run_check(name, check, timeout)
+        except Exception as e:
+            logger.error("[DIAGNOSTICS_CHECK] %s raised unexpectedly: %s", name, e)
+            return DiagnosticResult(
+                service_name=name,
+                status=HealthStatus.UNHEALTHY,
+                message=f"{name} check failed: {str(e)}",
+                error=e,
+                duration_ms=0
+            )
+    
+    @property
+    def _default_config_url(self) -> str:
+        """Full URL of the default configuration endpoint, built from the current base URL."""
+        return f"{app_settings.api_endpoints.base_url.rstrip('/')}{_DEFAULT_CONFIG_ENDPOINT}"
+    
+    def _get_http_client(self) -> Any:
+        """Resolve the API client once and share it between the API checks."""
+        if self._http_client is None:
+            self._http_client = get_api_client()
+        return self._http_client
+    
     async def _check_configuration(self) -> DiagnosticResult:
-        """Check basic application configuration."""
-        start_time = time.time()
+        """Check basic application configuration (memoized until one of the checked settings changes)."""
+        settings_key = (
+            app_settings.azure_storage.account_name,
+            app_settings.azure_storage.queue_name,
+            app_settings.api_endpoints.base_url,
+            app_settings.api_authentication.tenant_id,
+            app_settings.api_authentication.scope,
+        )
+        cached = self._config_check_results.get("Configuration")
+        if cached and cached[0] == settings_key:
+            return cached[1]
+        
+        timer = _Timer()
         
         try:
             errors = []
@@ -136,28 +458,31 @@ class DiagnosticsService:
             if not app_settings.api_authentication.scope:
                 errors.append("API scope not configured")
             
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = timer.ms
             
             if errors:
-                logger.error(f"[DIAGNOSTICS_CHECK] Configuration errors found: {'; '.join(errors)}")
-                return DiagnosticResult(
+                logger.error("[DIAGNOSTICS_CHECK] Configuration errors found: %s", '; '.join(errors))
+                result = DiagnosticResult(
                     service_name="Configuration",
                     status=HealthStatus.UNHEALTHY,
                     message=f"Configuration errors: {'; '.join(errors)}",
                     details={"errors": errors},
                     duration_ms=duration_ms
                 )
+            else:
+                logger.info("[DIAGNOSTICS_CHECK] All required configuration present - validated in %.1fms", duration_ms)
+                result = DiagnosticResult(
+                    service_name="Configuration",
+                    status=HealthStatus.HEALTHY,
+                    message="All required configuration present",
+                    duration_ms=duration_ms
+                )
             
-            logger.info(f"[DIAGNOSTICS_CHECK] All required configuration present - validated in {duration_ms:.1f}ms")
-            return DiagnosticResult(
-                service_name="Configuration",
-                status=HealthStatus.HEALTHY,
-                message="All required configuration present",
-                duration_ms=duration_ms
-            )
+            self._config_check_results["Configuration"] = (settings_key, result)
+            return result
             
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = timer.ms
             return DiagnosticResult(
                 service_name="Configuration",
                 status=HealthStatus.UNHEALTHY,
@@ -168,20 +493,21 @@ class DiagnosticsService:
     
     async def _check_authentication_setup(self) -> DiagnosticResult:
         """Check authentication provider initialization."""
-        start_time = time.time()
+        timer = _Timer()
         
         try:
-            # Always initialize auth provider (just stores config, no token acquisition)
-            self._auth_provider = AuthTokenProvider(
-                client_id=app_settings.api_authentication.client_id,
-                tenant_id=app_settings.api_authentication.tenant_id,
-                scope=app_settings.api_authentication.scope,
-                use_managed_identity=app_settings.managed_identity.use_managed_identity,
-                enable_caching=app_settings.api_authentication.enable_token_caching,
-                refresh_buffer_seconds=app_settings.api_authentication.token_refresh_buffer_seconds
-            )
+            # Reuse the injected (or previously created) provider; creating one just stores config
+            if self._auth_provider is None:
+                self._auth_provider = AuthTokenProvider(
+                    client_id=app_settings.api_authentication.client_id,
+                    tenant_id=app_settings.api_authentication.tenant_id,
+                    scope=app_settings.api_authentication.scope,
+                    use_managed_identity=app_settings.managed_identity.use_managed_identity,
+                    enable_caching=app_settings.api_authentication.enable_token_caching,
+                    refresh_buffer_seconds=app_settings.api_authentication.token_refresh_buffer_seconds
+                )
             
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = timer.ms
             
             auth_type = "managed identity" if app_settings.managed_identity.use_managed_identity else "service principal"
             auth_enabled = app_settings.api_authentication.enable_authentication
@@ -190,7 +516,7 @@ class DiagnosticsService:
             if not auth_enabled:
                 status_msg += " (authentication disabled - no tokens will be acquired)"
             
-            logger.info(f"[DIAGNOSTICS_CHECK] {status_msg} in {duration_ms:.1f}ms")
+            logger.info("[DIAGNOSTICS_CHECK] %s in %.1fms", status_msg, duration_ms)
             return DiagnosticResult(
                 service_name="Authentication Setup",
                 status=HealthStatus.HEALTHY,
@@ -205,7 +531,7 @@ class DiagnosticsService:
             )
             
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = timer.ms
             return DiagnosticResult(
                 service_name="Authentication Setup",
                 status=HealthStatus.UNHEALTHY,
@@ -214,9 +540,9 @@ class DiagnosticsService:
                 duration_ms=duration_ms
             )
     
-    async def _check_token_acquisition(self) -> DiagnosticResult:
+    async def _check_token_acquisition(self, run_token: _RunToken) -> DiagnosticResult:
         """Check if we can acquire authentication tokens."""
-        start_time = time.time()
+        timer = _Timer()
         
         # Check if authentication is enabled
         if not app_settings.api_authentication.enable_authentication:
@@ -229,7 +555,7 @@ class DiagnosticsService:
                     "authentication_enabled": False,
                     "reason": "Feature flag disabled"
                 },
-                duration_ms=(time.time() - start_time) * 1000
+                duration_ms=timer.ms
             )
         
         try:
@@ -242,23 +568,24 @@ class DiagnosticsService:
                 )
             
             # Try to acquire a token
-            token = await self._auth_provider.get_token()
-            duration_ms = (time.time() - start_time) * 1000
+            token = await run_token.get(self._auth_provider)
+            duration_ms = timer.ms
             
             if token and len(token) > 50:  # Basic token validation
-                logger.info(f"[DIAGNOSTICS_CHECK] Successfully acquired token in {duration_ms:.1f}ms")
+                logger.info("[DIAGNOSTICS_CHECK] Successfully acquired token in %.1fms", duration_ms)
                 return DiagnosticResult(
                     service_name="Token Acquisition",
                     status=HealthStatus.HEALTHY,
                     message="Successfully acquired authentication token",
                     details={
                         "token_length": len(token),
-                        "token_preview": token[:20] + "..."
+                        # Fingerprint identifies the token in logs without exposing any of it
+                        "token_fingerprint": hashlib.sha256(token.encode()).hexdigest()[:16]
                     },
                     duration_ms=duration_ms
                 )
             else:
-                logger.error(f"[DIAGNOSTICS_CHECK] Invalid token received in {duration_ms:.1f}ms")
+                logger.error("[DIAGNOSTICS_CHECK] Invalid token received in %.1fms", duration_ms)
                 return DiagnosticResult(
                     service_name="Token Acquisition",
                     status=HealthStatus.UNHEALTHY,
@@ -267,7 +594,7 @@ class DiagnosticsService:
                 )
             
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = timer.ms
             return DiagnosticResult(
                 service_name="Token Acquisition",
                 status=HealthStatus.UNHEALTHY,
@@ -278,23 +605,13 @@ class DiagnosticsService:
     
     async def _check_storage_configuration(self) -> DiagnosticResult:
         """Check storage service configuration."""
-        start_time = time.time()
+        timer = _Timer()
         
         try:
-            # Initialize storage service (dynamic import to avoid circular dependencies)
-            try:
-                from eval_runner.services.azure_storage import AzureQueueService
-                self._storage_service = AzureQueueService()
-            except ImportError as import_error:
-                return DiagnosticResult(
-                    service_name="Storage Configuration",
-                    status=HealthStatus.UNHEALTHY,
-                    message=f"Failed to import storage service: {str(import_error)}",
-                    error=import_error,
-                    duration_ms=(time.time() - start_time) * 1000
-                )
+            # Build a storage service (configuration only, no network - nothing to close)
+            AzureQueueService()
             
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = timer.ms
             
             return DiagnosticResult(
                 service_name="Storage Configuration",
@@ -309,7 +626,7 @@ class DiagnosticsService:
             )
             
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = timer.ms
             return DiagnosticResult(
                 service_name="Storage Configuration",
                 status=HealthStatus.UNHEALTHY,
@@ -318,26 +635,24 @@ class DiagnosticsService:
                 duration_ms=duration_ms
             )
     
-    async def _check_storage_connectivity(self) -> DiagnosticResult:
-        """Check actual connectivity and queue operations for Azure Storage."""
-        start_time = time.time()
+    async def _check_storage(self) -> DiagnosticResult:
+        """Configure the storage service, connect, and verify queue operations in one pass."""
+        timer = _Timer()
+        # Owned by this check only, so an overlapping run can't close it mid-check
+        storage_service = None
         
         try:
-            if not self._storage_service:
-                return DiagnosticResult(
-                    service_name="Storage Connectivity",
-                    status=HealthStatus.UNHEALTHY,
-                    message="Storage service not initialized",
-                    duration_ms=0
-                )
+            # Step 1: Build the storage service (configuration only, no network)
+            storage_service = AzureQueueService()
+            config_ms = timer.ms
             
-            # Test 1: Initialize the service (basic connectivity)
-            await self._storage_service.initialize()
-            init_time = time.time()
+            # Step 2: Initialize the service (basic connectivity)
+            await storage_service.initialize()
+            init_ms = timer.ms
             
             # Ensure queue client is available
-            if not hasattr(self._storage_service, 'queue_client') or not self._storage_service.queue_client:
-                duration_ms = (time.time() - start_time) * 1000
+            if not hasattr(storage_service, 'queue_client') or not storage_service.queue_client:
+                duration_ms = timer.ms
                 return DiagnosticResult(
                     service_name="Storage Connectivity",
                     status=HealthStatus.UNHEALTHY,
@@ -345,30 +660,46 @@ class DiagnosticsService:
                     duration_ms=duration_ms
                 )
             
-            # Test 2: Test queue read permissions (non-destructive peek operation)
+            # Step 3: Test queue read permissions (non-destructive peek operation)
             try:
                 # Use peek_messages - this is non-destructive and tests the same permissions
                 # Peek doesn't remove messages from queue, just reads them
                 # Note: peek_messages is async and returns a list, not an iterator
-                messages = await self._storage_service.queue_client.peek_messages(max_messages=1)
+                messages = await asyncio.wait_for(
+                    storage_service.queue_client.peek_messages(max_messages=1),
+                    timeout=app_settings.diagnostics.storage_peek_timeout_seconds
+                )
                 
                 # Check if we got any messages (tests permissions)
                 message_count = len(messages) if messages else 0
                 
-                queue_ops_time = time.time()
+                peek_done_ms = timer.ms
                 
                 # Log result with clear messaging about empty vs populated queue
                 if message_count > 0:
-                    logger.info(f"[DIAGNOSTICS_CHECK] Successfully tested queue read permissions with peek operation (found {message_count} messages)")
+                    logger.info("[DIAGNOSTICS_CHECK] Successfully tested queue read permissions with peek operation (found %s messages)", message_count)
                 else:
-                    logger.info(f"[DIAGNOSTICS_CHECK] Successfully tested queue read permissions with peek operation (queue is empty - this is normal)")
+                    logger.info("[DIAGNOSTICS_CHECK] Successfully tested queue read permissions with peek operation (queue is empty - this is normal)")
                 
+            except asyncio.TimeoutError:
+                peek_timeout = app_settings.diagnostics.storage_peek_timeout_seconds
+                logger.error("[DIAGNOSTICS_TIMEOUT] Queue peek did not complete within %.1fs", peek_timeout)
+                return DiagnosticResult(
+                    service_name="Storage Connectivity",
+                    status=HealthStatus.UNHEALTHY,
+                    message=f"Queue peek timed out after {peek_timeout:.1f} seconds",
+                    details={
+                        "queue_name": app_settings.azure_storage.queue_name,
+                        "timeout_seconds": peek_timeout
+                    },
+                    duration_ms=timer.ms
+                )
             except Exception as queue_error:
                 # Check if it's a permission error
-                error_msg = str(queue_error).lower()
-                if "authorizationpermissionmismatch" in error_msg or "not authorized" in error_msg:
-                    duration_ms = (time.time() - start_time) * 1000
-                    logger.error(f"[DIAGNOSTICS_CHECK] Permission denied for queue operations - PIM likely expired")
+                error_msg = str(queue_error).casefold()
+                if any(marker in error_msg for marker in _PERM_ERROR_MARKERS):
+                    duration_ms = timer.ms
+                    logger.error("[DIAGNOSTICS_CHECK] Permission denied for queue operations - PIM likely expired")
                     return DiagnosticResult(
                         service_name="Storage Connectivity",
                         status=HealthStatus.UNHEALTHY,
@@ -388,17 +719,20 @@ class DiagnosticsService:
                     # Re-raise if it's not a permission issue
                     raise queue_error
             
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = timer.ms
             
-            logger.info(f"[DIAGNOSTICS_CHECK] Connected and verified queue operations in {duration_ms:.1f}ms")
+            logger.info("[DIAGNOSTICS_CHECK] Connected and verified queue operations in %.1fms", duration_ms)
             return DiagnosticResult(
                 service_name="Storage Connectivity",
                 status=HealthStatus.HEALTHY,
                 message="Successfully connected to Azure Storage with queue read permissions",
                 details={
-                    "init_time_ms": round((init_time - start_time) * 1000),
-                    "queue_test_time_ms": round((queue_ops_time - init_time) * 1000),
+                    "config_ms": round(config_ms),
+                    "init_ms": round(init_ms - config_ms),
+                    "peek_ms": round(peek_done_ms - init_ms),
+                    "account_name": app_settings.azure_storage.account_name,
                     "queue_name": app_settings.azure_storage.queue_name,
+                    "use_managed_identity": app_settings.managed_identity.use_managed_identity,
                     "test_method": "peek_messages (non-destructive)",
                     "messages_in_queue": message_count,
                     "queue_status": "populated" if message_count > 0 else "empty"
@@ -407,13 +741,13 @@ class DiagnosticsService:
             )
             
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = timer.ms
             error_msg = str(e)
-            logger.error(f"[DIAGNOSTICS_CHECK] Failed connectivity test: {error_msg}")
+            logger.error("[DIAGNOSTICS_CHECK] Failed connectivity test: %s", error_msg)
             
             # Add specific error context for common async issues
             if "coroutine" in error_msg.lower():
-                logger.error(f"[DIAGNOSTICS_CHECK] Detected async/await issue - this should not crash the application")
+                logger.error("[DIAGNOSTICS_CHECK] Detected async/await issue - this should not crash the application")
                 return DiagnosticResult(
                     service_name="Storage Connectivity",
                     status=HealthStatus.UNHEALTHY,
@@ -435,10 +769,16 @@ class DiagnosticsService:
                 error=e,
                 duration_ms=duration_ms
             )
+        finally:
+            if storage_service:
+                try:
+                    await storage_service.close()
+                except Exception as close_error:
+                    logger.warning("[DIAGNOSTICS_CHECK] Error closing storage service: %s", close_error)
     
-    async def _check_api_connectivity(self) -> DiagnosticResult:
+    async def _check_api_connectivity(self, run_token: _RunToken) -> DiagnosticResult:
         """Check connectivity to the Eval API."""
-        start_time = time.time()
+        timer = _Timer()
         
         try:
             # Test basic connectivity - auth provider check only needed if auth enabled
@@ -452,30 +792,20 @@ class DiagnosticsService:
                     duration_ms=0
                 )
             
-            try:
-                from eval_runner.services.http_client import get_api_client
-                self._http_client = get_api_client()
-            except ImportError as import_error:
-                return DiagnosticResult(
-                    service_name="API Connectivity",
-                    status=HealthStatus.UNHEALTHY,
-                    message=f"Failed to import HTTP client: {str(import_error)}",
-                    error=import_error,
-                    duration_ms=(time.time() - start_time) * 1000
-                )
+            self._get_http_client()
             
             # Get auth headers (will be empty if auth disabled)
             auth_header = {}
             if auth_enabled and self._auth_provider:
-                auth_header = await self._auth_provider.get_auth_header()
+                auth_header = {"Authorization": f"Bearer {await run_token.get(self._auth_provider)}"}
             
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = timer.ms
             
             if auth_enabled:
-                logger.info(f"[DIAGNOSTICS_CHECK] API client configured with authentication in {duration_ms:.1f}ms")
+                logger.info("[DIAGNOSTICS_CHECK] API client configured with authentication in %.1fms", duration_ms)
                 message = "API client configured with authentication"
             else:
-                logger.info(f"[DIAGNOSTICS_CHECK] API client configured without authentication in {duration_ms:.1f}ms")
+                logger.info("[DIAGNOSTICS_CHECK] API client configured without authentication in %.1fms", duration_ms)
                 message = "API client configured without authentication (feature flag disabled)"
             
             return DiagnosticResult(
@@ -491,7 +821,7 @@ class DiagnosticsService:
             )
             
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = timer.ms
             return DiagnosticResult(
                 service_name="API Connectivity",
                 status=HealthStatus.UNHEALTHY,
@@ -500,44 +830,47 @@ class DiagnosticsService:
                 duration_ms=duration_ms
             )
     
-    async def _check_default_configuration_endpoint(self) -> DiagnosticResult:
+    async def _check_default_configuration_endpoint(self, run_token: _RunToken) -> DiagnosticResult:
         """Check the default configuration endpoint specifically."""
-        start_time = time.time()
+        timer = _Timer()
         
         try:
-            # Initialize API client for this check
-            from eval_runner.services.http_client import get_api_client
-            api_client = get_api_client()
+            api_client = self._get_http_client()
+            
+            endpoint = _DEFAULT_CONFIG_ENDPOINT
+            url = self._default_config_url
             
-            endpoint = "/api/v1/eval/configurations/defaultconfiguration"
-            base_url = app_settings.api_endpoints.base_url
-            url = f"{base_url.rstrip('/')}{endpoint}"
+            # Fail fast when the host is unreachable instead of waiting for the full HTTP timeout
+            probe_timeout = app_settings.diagnostics.tcp_probe_timeout_seconds
+            if probe_timeout > 0:
+                probe_error = await self._probe_tcp(url, probe_timeout)
+                if probe_error:
+                    duration_ms = timer.ms
+                    logger.error("[DIAGNOSTICS_CHECK] Endpoint unreachable (%s) in %.1fms", probe_error, duration_ms)
+                    return DiagnosticResult(
+                        service_name="Default Config Endpoint",
+                        status=HealthStatus.UNHEALTHY,
+                        message=f"Endpoint unreachable: {probe_error}",
+                        details={
+                            "endpoint": endpoint,
+                            "probe_timeout_seconds": probe_timeout
+                        },
+                        duration_ms=duration_ms
+                    )
             
             # Add authentication headers
-            headers = {'Content-Type': 'application/json'}
-            auth_headers = await api_client._get_auth_headers()
-            headers.update(auth_headers)
+            if app_settings.api_authentication.enable_authentication and self._auth_provider:
+                headers = {**_JSON_HEADERS, 'Authorization': f"Bearer {await run_token.get(self._auth_provider)}"}
+            else:
+                headers = {**_JSON_HEADERS, **(await api_client._get_auth_headers())}
             
-            # Add timeout protection
-            try:
-                response_text, status, response_headers = await asyncio.wait_for(
-                    api_client._make_request('get', url, headers=headers),
-                    timeout=20.0
-                )
-            except asyncio.TimeoutError:
-                duration_ms = (time.time() - start_time) * 1000
-                return DiagnosticResult(
-                    service_name="Default Config Endpoint",
-                    status=HealthStatus.UNHEALTHY,
-                    message="API call timed out (20 seconds)",
-                    details={"endpoint": endpoint, "timeout_seconds": 20},
-                    duration_ms=duration_ms
-                )
+            # Bounded by the per-check API timeout applied in _run_check
+            response_text, status, response_headers = await api_client._make_request('get', url, headers=headers)
             
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = timer.ms
             
             if status == 200:
-                logger.info(f"[DIAGNOSTICS_CHECK] Retrieved successfully in {duration_ms:.1f}ms")
+                logger.info("[DIAGNOSTICS_CHECK] Retrieved successfully in %.1fms", duration_ms)
                 return DiagnosticResult(
                     service_name="Default Config Endpoint",
                     status=HealthStatus.HEALTHY,
@@ -550,7 +883,7 @@ class DiagnosticsService:
                     duration_ms=duration_ms
                 )
             else:
-                logger.error(f"[DIAGNOSTICS_CHECK] Failed with status {status} in {duration_ms:.1f}ms")
+                logger.error("[DIAGNOSTICS_CHECK] Failed with status %s in %.1fms", status, duration_ms)
                 return DiagnosticResult(
                     service_name="Default Config Endpoint",
                     status=HealthStatus.UNHEALTHY,
@@ -564,7 +897,7 @@ class DiagnosticsService:
                 )
             
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = timer.ms
             return DiagnosticResult(
                 service_name="Default Config Endpoint",
                 status=HealthStatus.UNHEALTHY,
@@ -573,9 +906,47 @@ class DiagnosticsService:
                 duration_ms=duration_ms
             )
     
+    @staticmethod
+    async def _probe_tcp(url: str, timeout: float) -> Optional[str]:
+        """
+        Open and close a bare TCP connection to the URL's host.
+        
+        Returns:
+            None if the connection succeeded, otherwise a short error description
+        """
+        parsed = urlparse(url)
+        host = parsed.hostname
+        if not host:
+            return f"invalid URL '{url}'"
+        port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+        
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=timeout)
+        except asyncio.TimeoutError:
+            return f"TCP connect to {host}:{port} timed out after {timeout:.1f}s"
+        except OSError as e:
+            return f"TCP connect to {host}:{port} failed: {e}"
+        
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return None
+    
     async def _check_azure_openai_config(self) -> DiagnosticResult:
-        """Check Azure OpenAI configuration."""
-        start_time = time.time()
+        """Check Azure OpenAI configuration (memoized until one of the checked settings changes)."""
+        settings_key = (
+            app_settings.azure_openai.endpoint,
+            app_settings.azure_openai.deployment_name,
+            app_settings.azure_openai.resource_name,
+            app_settings.managed_identity.use_managed_identity,
+        )
+        cached = self._config_check_results.get("Azure OpenAI Config")
+        if cached and cached[0] == settings_key:
+            return cached[1]
+        
+        timer = _Timer()
         
         try:
             errors = []
@@ -589,33 +960,36 @@ class DiagnosticsService:
             if not app_settings.azure_openai.resource_name:
                 errors.append("Azure OpenAI resource name not configured")
             
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = timer.ms
             
             if errors:
-                logger.error(f"[DIAGNOSTICS_CHECK] Configuration errors: {'; '.join(errors)}")
-                return DiagnosticResult(
+                logger.error("[DIAGNOSTICS_CHECK] Configuration errors: %s", '; '.join(errors))
+                result = DiagnosticResult(
                     service_name="Azure OpenAI Config",
                     status=HealthStatus.UNHEALTHY,
                     message=f"Azure OpenAI configuration errors: {'; '.join(errors)}",
                     details={"errors": errors},
                     duration_ms=duration_ms
                 )
+            else:
+                logger.info("[DIAGNOSTICS_CHECK] Configuration valid - checked in %.1fms", duration_ms)
+                result = DiagnosticResult(
+                    service_name="Azure OpenAI Config",
+                    status=HealthStatus.HEALTHY,
+                    message="Azure OpenAI configuration valid",
+                    details={
+                        "deployment_name": app_settings.azure_openai.deployment_name,
+                        "resource_name": app_settings.azure_openai.resource_name,
+                        "use_managed_identity": app_settings.managed_identity.use_managed_identity
+                    },
+                    duration_ms=duration_ms
+                )
             
-            logger.info(f"[DIAGNOSTICS_CHECK] Configuration valid - checked in {duration_ms:.1f}ms")
-            return DiagnosticResult(
-                service_name="Azure OpenAI Config",
-                status=HealthStatus.HEALTHY,
-                message="Azure OpenAI configuration valid",
-                details={
-                    "deployment_name": app_settings.azure_openai.deployment_name,
-                    "resource_name": app_settings.azure_openai.resource_name,
-                    "use_managed_identity": app_settings.managed_identity.use_managed_identity
-                },
-                duration_ms=duration_ms
-            )
+            self._config_check_results["Azure OpenAI Config"] = (settings_key, result)
+            return result
             
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = timer.ms
             return DiagnosticResult(
                 service_name="Azure OpenAI Config",
                 status=HealthStatus.UNHEALTHY,
@@ -625,59 +999,75 @@ class DiagnosticsService:
             )
     
     def _log_summary(self, summary: DiagnosticSummary) -> None:
-        """Log diagnostic summary with appropriate log levels."""
+        """Log diagnostic summary as at most two records: healthy lines at INFO, failures at ERROR."""
+        # Healthy lines are only formatted when the INFO record would be emitted
+        info_enabled = logger.isEnabledFor(logging.INFO)
+        info_lines = []
+        error_lines = []
         
         if summary.overall_status == HealthStatus.HEALTHY:
-            logger.info(
-                f"[DIAGNOSTICS_SUMMARY] ✅ PASSED - All {summary.healthy_count} checks successful "
-                f"({summary.total_duration_ms:.1f}ms total)"
-            )
+            if info_enabled:
+                info_lines.append(
+                    "[DIAGNOSTICS_SUMMARY] ✅ PASSED - All %s checks successful (%.1fms total)"
+                    % (summary.healthy_count, summary.total_duration_ms)
+                )
         else:
-            logger.error(
-                f"[DIAGNOSTICS_SUMMARY] ❌ FAILED - {summary.unhealthy_count}/{len(summary.checks)} checks failed "
-                f"({summary.total_duration_ms:.1f}ms total)"
+            error_lines.append(
+                "[DIAGNOSTICS_SUMMARY] ❌ FAILED - %s/%s checks failed (%.1fms total)"
+                % (summary.unhealthy_count, len(summary.checks), summary.total_duration_ms)
             )
         
-        # Log each check result
         for check in summary.checks:
             if check.status == HealthStatus.HEALTHY:
-                logger.info(
-                    f"[DIAGNOSTICS_CHECK] ✅ {check.service_name}: {check.message} "
-                    f"({check.duration_ms:.1f}ms)"
-                )
+                if info_enabled:
+                    info_lines.append(
+                        "[DIAGNOSTICS_CHECK] ✅ %s: %s (%.1fms)"
+                        % (check.service_name, check.message, check.duration_ms or 0.0)
+                    )
             else:
-                logger.error(
-                    f"[DIAGNOSTICS_CHECK] ❌ {check.service_name}: {check.message} "
-                    f"({check.duration_ms:.1f}ms)"
+                error_lines.append(
+                    "[DIAGNOSTICS_CHECK] ❌ %s: %s (%.1fms)"
+                    % (check.service_name, check.message, check.duration_ms or 0.0)
                 )
                 if check.error:
-                    logger.error(f"[DIAGNOSTICS_ERROR] {check.service_name} - {str(check.error)}")
+                    error_lines.append("[DIAGNOSTICS_ERROR] %s - %s" % (check.service_name, check.error))
                 if check.details:
-                    logger.error(f"[DIAGNOSTICS_DETAILS] {check.service_name} - {check.details}")
+                    error_lines.append("[DIAGNOSTICS_DETAILS] %s - %s" % (check.service_name, check.details))
+        
+        if info_lines:
+            logger.info("\n".join(info_lines))
+        if error_lines:
+            logger.error("\n".join(error_lines))
     
     async def close(self) -> None:
         """Clean up diagnostic service resources."""
+        await self.stop()
+        self._cached_summaries.clear()
+        self._latest = None
         try:
-            if self._auth_provider:
+            if self._auth_provider and self._owns_auth_provider:
                 await self._auth_provider.close()
             
-            if self._storage_service:
-                await self._storage_service.close()
-            
-            if self._http_client:
+            if self._http_client and self._owns_http_client:
                 await self._http_client.close()
                 
         except Exception as e:
-            logger.warning(f"[DIAGNOSTICS_CHECK] Error during cleanup: {e}")
+            logger.warning("[DIAGNOSTICS_CHECK] Error during cleanup: %s", e)
 
 
 # Global diagnostics instance
 _diagnostics_service: Optional[DiagnosticsService] = None
 
 
-def get_diagnostics_service() -> DiagnosticsService:
-    """Get or create the global diagnostics service instance."""
+def get_diagnostics_service(auth_provider: Optional[AuthTokenProvider] = None, http_client: Optional[Any] = None) -> DiagnosticsService:
+    """
+    Get or create the global diagnostics service instance.
+    
+    Args:
+        auth_provider: Auth provider to reuse when the instance is first created
+        http_client: API client to reuse when the instance is first created
+    """
     global _diagnostics_service
     if _diagnostics_service is None:
-        _diagnostics_service = DiagnosticsService()
+        _diagnostics_service = DiagnosticsService(auth_provider=auth_provider, http_client=http_client)
     return _diagnostics_service
\ No newline at end of file
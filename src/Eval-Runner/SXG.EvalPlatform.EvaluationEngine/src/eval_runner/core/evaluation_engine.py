@@ -3,14 +3,30 @@ Simplified evaluation engine for processing queue messages and running evaluatio
 """
 
 import asyncio
+import contextvars
+import hashlib
+import json
 import logging
+import random
 import time
-import traceback
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import aiohttp
+
+# Use numpy for large score reductions if available
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 from ..services.http_client import api_client
 from ..config.settings import app_settings
+from ..exceptions import ApiHttpError, EvaluationTimeoutError
 from ..models.eval_models import (
     QueueMessage, Dataset, EnrichedDatasetResponse, MetricsConfigurationResponse, EvaluationConfig,
     DatasetItem, MetricScore, DatasetItemResult, MetricSummary, EvaluationSummary
@@ -18,11 +34,62 @@ from ..models.eval_models import (
 from ..metrics.simple_interface import registry
 from ..utils.logging_helper import (
     log_operation_start, log_operation_success, log_operation_error, log_evaluation_result,
-    log_eval_run, set_eval_run_context, clear_eval_run_context, eval_workflow_step
+    log_eval_run, set_eval_run_context, clear_eval_run_context, eval_workflow_step,
+    lazy_traceback, start_workflow_timeline, flush_workflow_timeline, LazyValue
 )
 
 logger = logging.getLogger(__name__)
 
+# Below this many scores the builtin sum is faster than building a numpy array
+_NUMPY_MIN_SCORES = 1024
+
+# Default retry budget of _fetch_with_retry: attempts after the first, and the first backoff cap
+_FETCH_MAX_RETRIES = 3
+_FETCH_BASE_DELAY_SECONDS = 60
+
+# Registry categories computed locally (no model calls); they get their own worker pool
+_LOCAL_METRIC_CATEGORIES = frozenset({'text_similarity'})
+
+# (api_error_type, failure_category) for exception types whose category doesn't depend on the message
+_TIMEOUT_CATEGORY = ('timeout_error', 'api_timeout_error')
+_CONNECTION_CATEGORY = ('connection_error', 'api_connection_error')
+_ERROR_CATEGORIES: Dict[type, Tuple[str, str]] = {
+    asyncio.TimeoutError: _TIMEOUT_CATEGORY,
+    aiohttp.ServerTimeoutError: _TIMEOUT_CATEGORY,
+    ConnectionError: _CONNECTION_CATEGORY,
+    ConnectionResetError: _CONNECTION_CATEGORY,
+    ConnectionRefusedError: _CONNECTION_CATEGORY,
+    aiohttp.ClientConnectionError: _CONNECTION_CATEGORY,
+    aiohttp.ClientConnectorError: _CONNECTION_CATEGORY,
+    aiohttp.ClientOSError: _CONNECTION_CATEGORY,
+    aiohttp.ServerDisconnectedError: _CONNECTION_CATEGORY,
+}
+
+# Exception class names and message terms used to categorize exceptions that aren't in the table above
+_TIMEOUT_CLASS_NAMES = frozenset({'TimeoutError', 'ConnectTimeoutError', 'ReadTimeoutError'})
+_CONNECTION_CLASS_NAMES = frozenset({'ConnectionError', 'ConnectError'})
+_NETWORK_ERROR_TERMS = ('dns', 'network', 'host', 'resolve')
+
+# Longest a metric may run once a metric thread has picked it up
+_METRIC_TIMEOUT_SECONDS = 30.0
+
+# Constant parts of failed MetricScore details, shared so failures only add the per-error fields
+_METRIC_TIMEOUT_DETAILS = {
+    'error_type': 'TimeoutError',
+    'error_message': 'Metric evaluation exceeded 30 second timeout',
+    'evaluation_attempted': True,
+    'failure_category': 'metric_timeout_error',
+    'timeout_seconds': _METRIC_TIMEOUT_SECONDS
+}
+_METRIC_EXECUTION_ERROR_DETAILS = {
+    'evaluation_attempted': True,
+    'failure_category': 'metric_execution_error'
+}
+_METRIC_EVALUATION_ERROR_DETAILS = {
+    'failure_category': 'metric_evaluation_error',
+    'evaluation_attempted': True
+}
+
 
 class EvaluationEngine:
     """Main evaluation engine for processing queue messages and running evaluations."""
@@ -30,9 +97,27 @@ class EvaluationEngine:
     def __init__(self):
         """Initialize the evaluation engine."""
         self.api_client = api_client
-        self._processing_lock = asyncio.Lock()  # Ensure only one evaluation runs at a time
+        # Bound the number of eval runs in flight; each run keeps its own logging context
+        self._concurrency = asyncio.Semaphore(app_settings.evaluation.max_concurrent_evaluations)
+        # Parsed metrics configurations by metrics_configuration_id: (expires_at, raw_data, parsed_response),
+        # least recently used first
+        self._metrics_cfg_cache: "OrderedDict[str, Tuple[float, Any, MetricsConfigurationResponse]]" = OrderedDict()
+        # In-flight metrics configuration fetches, shared by runs in the same queue batch
+        self._metrics_cfg_inflight: Dict[str, asyncio.Future] = {}
+        # Flat registry snapshot: (registry version, metrics by name)
+        self._available_metrics_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        # Metric evaluators are synchronous (model calls, local scoring); they run here so the
+        # event loop keeps serving other pairs, runs and queue messages meanwhile
+        self._metric_executor = ThreadPoolExecutor(
+            max_workers=app_settings.evaluation.max_metric_threads,
+            thread_name_prefix="metric-eval"
+        )
+    
+    def close(self) -> None:
+        """Shut down the metric thread pool; metrics still waiting for a thread are cancelled."""
+        self._metric_executor.shutdown(wait=False, cancel_futures=True)
         
-    async def _fetch_with_retry(self, fetch_function, *args, operation_name: str, eval_run_id_for_logging: str, max_retries: int = 3, base_delay: int = 60):
+    async def _fetch_with_retry(self, fetch_function, *args, operation_name: str, eval_run_id_for_logging: str, max_retries: int = _FETCH_MAX_RETRIES, base_delay: int = _FETCH_BASE_DELAY_SECONDS):
         """
         Execute an API fetch operation with exponential backoff retry logic.
         
@@ -42,50 +127,59 @@ class EvaluationEngine:
             operation_name: Name of the operation for logging
             eval_run_id_for_logging: Eval run ID for logging context
             max_retries: Maximum number of retry attempts (default: 3)
-            base_delay: Base delay in seconds (default: 60), will be exponentially increased
+            base_delay: Base delay in seconds (default: 60), will be exponentially increased and jittered
             
         Returns:
             The result from the successful API call
             
         Raises:
-            Exception: If all retry attempts fail
+            Exception: If all retry attempts fail, or immediately for errors classified as
+                non-retryable (e.g. HTTP 400/401/403/404)
         """
-        last_exception = None
+        # Exponential backoff caps before each retry (60s, 120s, 240s by default). The actual delay is drawn
+        # from [cap / 2, cap] so workers that failed together don't all retry at the same moment.
+        retry_delay_caps = self._retry_delay_caps(max_retries, base_delay)
+        retry_history = []
+        
+        # Operation names used by the retry-path records
+        retry_operation = f"{operation_name}_retry"
+        attempt_operation = f"{operation_name}_attempt"
+        final_failure_operation = f"{operation_name}_final_failure"
+        
+        # Properties shared by every retry-path record, built once and reused across attempts
+        retry_log_properties = {
+            'eval_run_id': eval_run_id_for_logging,
+            'operation': operation_name,
+            'backoff_strategy': "exponential_jitter"
+        }
         
         for attempt in range(max_retries + 1):  # +1 for initial attempt
-            start_time = time.time()  # Initialize start_time for each attempt
+            start_time = time.monotonic()  # Initialize start_time for each attempt
             try:
                 if attempt > 0:
-                    # Calculate exponential backoff delay: 60s, 120s, 240s
-                    retry_delay = base_delay * (2 ** (attempt - 1))
-                    
                     log_operation_start(
                         logger,
-                        f"{operation_name}_retry",
-                        eval_run_id=eval_run_id_for_logging,
+                        retry_operation,
                         attempt=attempt,
                         max_attempts=max_retries,
-                        operation=operation_name,
                         retry_delay_seconds=retry_delay,
-                        backoff_strategy="exponential"
+                        **retry_log_properties
                     )
                 
                 # Execute the API call with telemetry
                 result = await fetch_function(*args)
-                call_duration = time.time() - start_time
+                call_duration = time.monotonic() - start_time
                 
                 if attempt > 0:
                     # Log successful retry with comprehensive telemetry
                     log_operation_success(
                         logger,
-                        f"{operation_name}_retry",
-                        eval_run_id=eval_run_id_for_logging,
+                        retry_operation,
                         attempt=attempt,
-                        operation=operation_name,
                         success_after_retries=True,
                         call_duration_seconds=call_duration,
                         result_received=True,
-                        backoff_strategy="exponential"
+                        **retry_log_properties
                     )
                 else:
                     # Log successful first attempt
@@ -102,94 +196,236 @@ class EvaluationEngine:
                 return result
                 
             except Exception as e:
-                last_exception = e
-                call_duration = time.time() - start_time
+                call_duration = time.monotonic() - start_time
                 
-                # Extract detailed error information for telemetry
-                error_details = self._extract_api_error_details(e)
+                # Extract detailed error information for telemetry in a worker thread so a failing
+                # fetch doesn't stall the other eval runs sharing the event loop
+                # Note: error_details dict is logged field by field to avoid clashing with error_type/error_message
+                error_details = await asyncio.to_thread(self._build_error_telemetry, e, attempt >= max_retries)
+                api_error_properties = {
+                    'api_error_type': error_details.get('error_type', 'unknown'),
+                    'api_status_code': error_details.get('api_status_code'),
+                    'api_response_body': error_details.get('api_response_body'),
+                    'is_retryable': error_details.get('is_retryable', True)
+                }
                 
-                if attempt < max_retries:
-                    # Calculate exponential backoff delay for next attempt
-                    retry_delay = base_delay * (2 ** attempt)
-                    
-                    # Extract detailed error information for telemetry
-                    error_details = self._extract_api_error_details(e)
+                if attempt < max_retries and api_error_properties['is_retryable']:
+                    retry_delay_cap = retry_delay_caps[attempt]
+                    retry_delay = random.uniform(retry_delay_cap / 2, retry_delay_cap)
+                    retry_history.append(f"{retry_delay:.1f}s")
                     
-                    # Log retry attempt with comprehensive telemetry
-                    # Note: error_details dict is logged separately to avoid KeyError from unpacking
+                    # Log retry attempt with comprehensive telemetry and exponential backoff info
                     log_operation_error(
                         logger,
-                        f"{operation_name}_attempt",
+                        attempt_operation,
                         e,
-                        eval_run_id=eval_run_id_for_logging,
-                        attempt=attempt + 1,
-                        max_attempts=max_retries,
-                        operation=operation_name,
-                        retry_delay_seconds=retry_delay,
-                        will_retry=True,
-                        error_details=str(e),
-                        call_duration_seconds=call_duration,
-                        backoff_strategy="exponential",
-                        api_error_type=error_details.get('error_type', 'unknown'),
-                        api_status_code=error_details.get('api_status_code'),
-                        api_response_body=error_details.get('api_response_body'),
-                        is_retryable=error_details.get('is_retryable', True)
-                    )
-                    
-                    # Enhanced logging with exponential backoff info
-                    log_eval_run(
-                        logger,
-                        logging.WARNING,
-                        f"{operation_name} attempt {attempt + 1} failed, retrying with exponential backoff",
-                        operation=operation_name,
                         attempt=attempt + 1,
                         max_attempts=max_retries + 1,
                         retry_delay_seconds=retry_delay,
-                        next_retry_in_seconds=retry_delay,
-                        backoff_pattern=f"Attempt {attempt + 2}: {retry_delay}s delay",
+                        retry_delay_cap_seconds=retry_delay_cap,
+                        backoff_pattern=f"Attempt {attempt + 2}: {retry_delay:.1f}s delay",
                         total_retries_remaining=max_retries - attempt,
-                        error_type=type(e).__name__,
-                        error_message=str(e),
+                        will_retry=True,
+                        error_details=str(e),
                         call_duration_seconds=call_duration,
-                        # Include API-specific error details
-                        **error_details
+                        failure_category=error_details.get('failure_category'),
+                        **retry_log_properties,
+                        **api_error_properties
                     )
                     
                     # Wait with exponential backoff
-                    logger.info(f"Waiting {retry_delay} seconds before retry attempt {attempt + 2}/{max_retries + 1} for {operation_name} (exponential backoff)")
+                    logger.info("Waiting %.1f seconds before retry attempt %s/%s for %s (exponential backoff)", retry_delay, attempt + 2, max_retries + 1, operation_name)
                     await asyncio.sleep(retry_delay)
                 else:
-                    # Extract detailed error information for telemetry
-                    error_details = self._extract_api_error_details(e)
-                    
                     # Log final failure with comprehensive telemetry
-                    # Note: error_details dict is logged separately to avoid KeyError from unpacking
                     log_operation_error(
                         logger,
-                        f"{operation_name}_final_failure",
+                        final_failure_operation,
                         e,
-                        eval_run_id=eval_run_id_for_logging,
                         attempt=attempt + 1,
                         max_attempts=max_retries,
-                        operation=operation_name,
-                        all_retries_exhausted=True,
+                        all_retries_exhausted=attempt >= max_retries,
+                        retry_skipped_non_retryable=attempt < max_retries,
                         error_details=str(e),
-                        stack_trace=traceback.format_exc(),
+                        stack_trace=lazy_traceback(e),
                         call_duration_seconds=call_duration,
-                        backoff_strategy="exponential",
-                        retry_history=[f"60s", f"120s", f"240s"][:max_retries],
-                        api_error_type=error_details.get('error_type', 'unknown'),
-                        api_status_code=error_details.get('api_status_code'),
-                        api_response_body=error_details.get('api_response_body'),
-                        is_retryable=error_details.get('is_retryable', True)
+                        retry_history=retry_history,
+                        **retry_log_properties,
+                        **api_error_properties
                     )
+                    
+                    # All retries exhausted (or the error is permanent, e.g. HTTP 400/401/404) -
+                    # re-raise the last exception with its original traceback
+                    raise
+
+    async def _get_metrics_config(
+        self,
+        metrics_configuration_id: str,
+        eval_run_id: str
+    ) -> Tuple[Any, Optional[MetricsConfigurationResponse]]:
+        """
+        Get a metrics configuration, serving it from the in-process cache when fresh.
         
-        # All retries exhausted, raise the last exception
-        if last_exception is not None:
-            raise last_exception
+        Args:
+            metrics_configuration_id: ID of the metrics configuration
+            eval_run_id: Eval run ID for logging context
+            
+        Returns:
+            Tuple of (raw configuration data, parsed response or None on a cache miss)
+        """
+        cached = self._metrics_cfg_cache.get(metrics_configuration_id)
+        if cached is not None:
+            expires_at, raw_data, parsed_response = cached
+            if time.monotonic() < expires_at:
+                self._metrics_cfg_cache.move_to_end(metrics_configuration_id)
+                log_eval_run(
+                    logger,
+                    logging.INFO,
+                    "Using cached metrics configuration",
+                    metricsConfigurationId=metrics_configuration_id,
+                    cacheTtlRemainingSeconds=round(expires_at - time.monotonic())
+                )
+                return raw_data, parsed_response
+            del self._metrics_cfg_cache[metrics_configuration_id]
+        
+        # Runs that share a configuration and miss the cache together wait on a single fetch
+        fetch = self._metrics_cfg_inflight.get(metrics_configuration_id)
+        if fetch is None:
+            fetch = asyncio.ensure_future(self._fetch_with_retry(
+                self.api_client.fetch_metrics_configuration,
+                metrics_configuration_id,
+                operation_name="fetch_metrics_configuration",
+                eval_run_id_for_logging=eval_run_id
+            ))
+            self._metrics_cfg_inflight[metrics_configuration_id] = fetch
+            
+            def _fetch_done(done: asyncio.Future) -> None:
+                if self._metrics_cfg_inflight.get(metrics_configuration_id) is done:
+                    del self._metrics_cfg_inflight[metrics_configuration_id]
+                # Mark the result as retrieved even if every waiter was cancelled
+                if not done.cancelled():
+                    done.exception()
+            
+            fetch.add_done_callback(_fetch_done)
         else:
-            raise Exception(f"All {max_retries} retry attempts failed for {operation_name}")
-
+            log_eval_run(
+                logger,
+                logging.INFO,
+                "Joining in-flight metrics configuration fetch",
+                metricsConfigurationId=metrics_configuration_id
+            )
+        
+        # Shield the shared fetch so cancelling one run does not fail the others
+        raw_data = await asyncio.shield(fetch)
+        return raw_data, None
+    
+    def _cache_metrics_config(
+        self,
+        metrics_configuration_id: str,
+        raw_data: Any,
+        parsed_response: MetricsConfigurationResponse
+    ) -> None:
+        """Store a successfully parsed metrics configuration for reuse by later eval runs."""
+        ttl = app_settings.evaluation.metrics_config_cache_ttl_seconds
+        if ttl > 0:
+            cache = self._metrics_cfg_cache
+            cache[metrics_configuration_id] = (time.monotonic() + ttl, raw_data, parsed_response)
+            cache.move_to_end(metrics_configuration_id)
+            while len(cache) > app_settings.evaluation.metrics_config_cache_size:
+                cache.popitem(last=False)
+    
+    @staticmethod
+    def _retry_delay_caps(max_retries: int, base_delay: int) -> List[int]:
+        """Upper bound in seconds of the jittered delay before each retry (doubling from base_delay)."""
+        return [base_delay * (1 << i) for i in range(max_retries)]
+    
+    @staticmethod
+    def _metrics_config_digest(raw_data: Any) -> str:
+        """
+        Short digest of a metrics configuration, so logs can tell configurations apart without the body.
+        
+        Args:
+            raw_data: Parsed metrics configuration
+            
+        Returns:
+            16-character hex digest that is equal for identical configurations
+        """
+        payload = json.dumps(raw_data, sort_keys=True, default=str, ensure_ascii=False)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=8).hexdigest()
+    
+    @staticmethod
+    def _apply_status_code(error_details: dict, status_code: int) -> None:
+        """Record an HTTP status code and categorize it as client/server error."""
+        error_details['api_status_code'] = status_code
+        if 400 <= status_code < 500:
+            error_details['api_error_type'] = 'client_error'
+            error_details['is_retryable'] = status_code in [408, 429, 502, 503, 504]  # Only retry specific 4xx codes
+        elif 500 <= status_code < 600:
+            error_details['api_error_type'] = 'server_error'
+            error_details['is_retryable'] = True  # Generally retry server errors
+        else:
+            error_details['api_error_type'] = 'http_error'
+    
+    @staticmethod
+    def _safe_response_headers(headers: Any) -> Dict[str, str]:
+        """Copy response headers, excluding potentially sensitive ones."""
+        return {
+            key: str(value) for key, value in headers.items()
+            if key.lower() not in ['authorization', 'cookie', 'set-cookie', 'x-api-key']
+        }
+    
+    def _extract_generic_response_details(self, exception: Exception, error_details: dict) -> None:
+        """Read status, body and headers from an exception of unknown type that carries a response."""
+        try:
+            response = getattr(exception, 'response', None)
+            if response is None:
+                return
+            
+            # Status code
+            status_code = getattr(response, 'status_code', None)
+            if status_code is not None:
+                self._apply_status_code(error_details, status_code)
+            
+            # Response body (truncate if too long)
+            try:
+                if hasattr(response, 'text'):
+                    response_text = str(response.text)
+                    if len(response_text) > 1000:  # Truncate long responses
+                        error_details['api_response_body'] = response_text[:1000] + "... (truncated)"
+                    else:
+                        error_details['api_response_body'] = response_text
+                elif hasattr(response, 'content'):
+                    error_details['api_response_body'] = str(response.content)[:1000]
+            except Exception:
+                error_details['api_response_body'] = "Could not read response body"
+            
+            # Response headers (exclude sensitive ones)
+            try:
+                headers = getattr(response, 'headers', None)
+                if headers is not None:
+                    error_details['api_response_headers'] = self._safe_response_headers(headers) if hasattr(headers, 'items') else {}
+            except Exception:
+                error_details['api_response_headers'] = {}
+        except Exception:
+            # If we can't read response details safely, just continue
+            pass
+    
+    def _build_error_telemetry(self, exception: Exception, include_traceback: bool) -> dict:
+        """
+        Build the expensive parts of a failure's telemetry off the event loop.
+        
+        Args:
+            exception: The exception from the API call
+            include_traceback: Also format the traceback (cached on the exception for later log records)
+            
+        Returns:
+            Dictionary with detailed error telemetry
+        """
+        error_details = self._extract_api_error_details(exception)
+        if include_traceback:
+            lazy_traceback(exception)()
+        return error_details
+    
     def _extract_api_error_details(self, exception: Exception) -> dict:
         """
         Extract detailed error information from API exceptions for telemetry.
@@ -198,11 +434,18 @@ class EvaluationEngine:
             exception: The exception from the API call
             
         Returns:
-            Dictionary with detailed error telemetry
+            Dictionary with detailed error telemetry (computed once and cached on the exception)
         """
+        cached_details = getattr(exception, '_api_error_details', None)
+        if cached_details is not None:
+            return cached_details
+        
+        error_message = str(exception)
+        exception_class = type(exception).__name__
+        
         error_details = {
-            'error_type': type(exception).__name__,
-            'error_message': str(exception),
+            'error_type': exception_class,
+            'error_message': error_message,
             'api_status_code': None,
             'api_response_body': None,
             'api_response_headers': None,
@@ -211,84 +454,62 @@ class EvaluationEngine:
             'failure_category': 'api_communication_error'
         }
         
-        # Check if it's an HTTP-related exception with response details
-        try:
-            if hasattr(exception, 'response') and getattr(exception, 'response', None) is not None:
-                response = getattr(exception, 'response')
-                
-                # Status code
-                if hasattr(response, 'status_code'):
-                    error_details['api_status_code'] = response.status_code
-                    
-                    # Categorize based on status code
-                    if 400 <= response.status_code < 500:
-                        error_details['api_error_type'] = 'client_error'
-                        error_details['is_retryable'] = response.status_code in [408, 429, 502, 503, 504]  # Only retry specific 4xx codes
-                    elif 500 <= response.status_code < 600:
-                        error_details['api_error_type'] = 'server_error'
-                        error_details['is_retryable'] = True  # Generally retry server errors
-                    else:
-                        error_details['api_error_type'] = 'http_error'
-                
-                # Response body (truncate if too long)
-                try:
-                    if hasattr(response, 'text'):
-                        response_text = str(response.text) if hasattr(response.text, '__call__') else str(response.text)
-                        if len(response_text) > 1000:  # Truncate long responses
-                            error_details['api_response_body'] = response_text[:1000] + "... (truncated)"
-                        else:
-                            error_details['api_response_body'] = response_text
-                    elif hasattr(response, 'content'):
-                        content = str(response.content)[:1000]
-                        error_details['api_response_body'] = content
-                except Exception:
-                    error_details['api_response_body'] = "Could not read response body"
-                
-                # Response headers (exclude sensitive ones)
-                try:
-                    if hasattr(response, 'headers'):
-                        safe_headers = {}
-                        headers = getattr(response, 'headers', {})
-                        if hasattr(headers, 'items'):
-                            for key, value in headers.items():
-                                # Exclude potentially sensitive headers
-                                if key.lower() not in ['authorization', 'cookie', 'set-cookie', 'x-api-key']:
-                                    safe_headers[key] = str(value)
-                        error_details['api_response_headers'] = safe_headers
-                except Exception:
-                    error_details['api_response_headers'] = {}
-        except Exception:
-            # If we can't read response details safely, just continue
-            pass
-        
-        # Handle timeout exceptions
-        if 'timeout' in str(exception).lower() or type(exception).__name__ in ['TimeoutError', 'ConnectTimeoutError', 'ReadTimeoutError']:
-            error_details['api_error_type'] = 'timeout_error'
-            error_details['is_retryable'] = True
-            error_details['failure_category'] = 'api_timeout_error'
+        # Typed fast path for the exceptions raised by the aiohttp API client
+        if isinstance(exception, aiohttp.ClientResponseError):
+            self._apply_status_code(error_details, exception.status)
+            error_details['api_response_body'] = exception.message
+            if exception.headers is not None:
+                error_details['api_response_headers'] = self._safe_response_headers(exception.headers)
+        elif isinstance(exception, ApiHttpError):
+            self._apply_status_code(error_details, exception.status_code)
+            error_details['api_response_body'] = exception.response_text
+        elif not isinstance(exception, (ValueError, asyncio.TimeoutError, aiohttp.ClientError)):
+            # Unknown exception types may still carry a response object
+            self._extract_generic_response_details(exception, error_details)
         
-        # Handle connection exceptions
-        elif 'connection' in str(exception).lower() or type(exception).__name__ in ['ConnectionError', 'ConnectError']:
-            error_details['api_error_type'] = 'connection_error'
+        # Known exception types are categorized by a single dict lookup; others by their message.
+        # An HTTP status code already decided retryability, so the message isn't scanned then.
+        category = _ERROR_CATEGORIES.get(type(exception))
+        if category is not None:
+            error_details['api_error_type'], error_details['failure_category'] = category
             error_details['is_retryable'] = True
-            error_details['failure_category'] = 'api_connection_error'
-        
-        # Handle DNS/network exceptions
-        elif any(term in str(exception).lower() for term in ['dns', 'network', 'host', 'resolve']):
-            error_details['api_error_type'] = 'network_error'
-            error_details['is_retryable'] = True
-            error_details['failure_category'] = 'api_network_error'
+        elif error_details['api_status_code'] is None:
+            error_message_lower = error_message.lower()
+            
+            # Handle timeout exceptions
+            if 'timeout' in error_message_lower or exception_class in _TIMEOUT_CLASS_NAMES:
+                error_details['api_error_type'] = 'timeout_error'
+                error_details['is_retryable'] = True
+                error_details['failure_category'] = 'api_timeout_error'
+            
+            # Handle connection exceptions
+            elif isinstance(exception, aiohttp.ClientConnectionError) or 'connection' in error_message_lower or exception_class in _CONNECTION_CLASS_NAMES:
+                error_details['api_error_type'] = 'connection_error'
+                error_details['is_retryable'] = True
+                error_details['failure_category'] = 'api_connection_error'
+            
+            # Handle DNS/network exceptions
+            elif any(term in error_message_lower for term in _NETWORK_ERROR_TERMS):
+                error_details['api_error_type'] = 'network_error'
+                error_details['is_retryable'] = True
+                error_details['failure_category'] = 'api_network_error'
         
         # Add additional context
         error_details['exception_module'] = getattr(type(exception), '__module__', 'unknown')
-        error_details['exception_class'] = type(exception).__name__
+        error_details['exception_class'] = exception_class
+        
+        try:
+            exception._api_error_details = error_details
+        except AttributeError:
+            # Some exception types don't accept new attributes
+            pass
         
         return error_details
         
     async def process_queue_message(self, queue_message: QueueMessage) -> bool:
         """
         Process a queue message by running evaluation and storing results.
-        Ensures only one evaluation runs at a time.
+        At most Evaluation:MaxConcurrentEvaluations runs are processed at the same time.
         Tracks all processing steps and only returns True if ALL steps succeed.
         
         Args:
@@ -297,16 +518,20 @@ class EvaluationEngine:
         Returns:
             bool: True if all steps completed successfully, False otherwise
         """
-        async with self._processing_lock:
+        async with self._concurrency:
             eval_run_id = queue_message.eval_run_id
             metrics_configuration_id = queue_message.metrics_configuration_id; 
-            start_time = time.time()
+            priority = queue_message.priority
+            requested_at = str(queue_message.requested_at)
+            start_time = time.perf_counter()
             
-            # Set eval run context for all subsequent logs
+            # Set eval run context for all subsequent logs; step timings are reported together at the end
             set_eval_run_context(eval_run_id)
+            start_workflow_timeline()
             
             # Step tracking
             steps_completed = []
+            started_status_task: Optional[asyncio.Future] = None
             
             try:
                 # Log evaluation start with complete context
@@ -315,48 +540,50 @@ class EvaluationEngine:
                     logging.INFO,
                     f"Starting evaluation processing for eval_run_id: {eval_run_id}",
                     metricsConfigurationId=metrics_configuration_id,
-                    priority=queue_message.priority,
-                    requestedAt=str(queue_message.requested_at),
-                    processingStartTime=start_time
+                    priority=priority,
+                    requestedAt=requested_at,
+                    processingStartTime=time.time()
                 )
                 
-                # Log evaluation start with complete context
-                log_operation_start(
-                    logger,
-                    "evaluation_processing",
-                    eval_run_id=eval_run_id,
-                    metrics_configuration_id=metrics_configuration_id,
-                    priority=queue_message.priority,
-                    requested_at=str(queue_message.requested_at)
-                )
+                # Log evaluation start with complete context (the record above already marks the start)
+                if app_settings.logging.log_operation_start:
+                    log_operation_start(
+                        logger,
+                        "evaluation_processing",
+                        eval_run_id=eval_run_id,
+                        metrics_configuration_id=metrics_configuration_id,
+                        priority=priority,
+                        requested_at=requested_at
+                    )
                 
                 # Step 1: Fetch dataset and metrics configuration
                 with eval_workflow_step("fetch_dataset_and_config", "1/7") as op_id:
                     
                     try:
-                        # Fetch data with retry logic - SEQUENTIAL to avoid session race conditions
-                        # Note: HTTP client methods now validate and raise exceptions on failures,
+                        # Fetch data with retry logic - the two requests are independent, so run them
+                        # concurrently over the HTTP client's shared keep-alive session, which pools
+                        # the connections they use.
+                        # Note: HTTP client methods validate and raise exceptions on failures,
                         # so retry logic will automatically trigger on empty/invalid responses
-                        # Changed from parallel (asyncio.gather) to sequential to eliminate
-                        # race condition where both requests share the same HTTP session
-                        
-                        logger.info("Fetching dataset and metrics configuration sequentially to avoid session conflicts")
-                        
-                        # Fetch dataset first
-                        dataset_data = await self._fetch_with_retry(
-                            self.api_client.fetch_enriched_dataset,
-                            eval_run_id,
-                            operation_name="fetch_enriched_dataset",
-                            eval_run_id_for_logging=eval_run_id
-                        )
-                        
-                        # Then fetch metrics configuration
-                        metrics_config_data = await self._fetch_with_retry(
-                            self.api_client.fetch_metrics_configuration,
-                            metrics_configuration_id,
-                            operation_name="fetch_metrics_configuration",
-                            eval_run_id_for_logging=eval_run_id
-                        )
+                        fetch_tasks = [
+                            asyncio.ensure_future(self._fetch_with_retry(
+                                self.api_client.fetch_enriched_dataset,
+                                eval_run_id,
+                                operation_name="fetch_enriched_dataset",
+                                eval_run_id_for_logging=eval_run_id
+                            )),
+                            asyncio.ensure_future(self._get_metrics_config(
+                                metrics_configuration_id,
+                                eval_run_id
+                            ))
+                        ]
+                        try:
+                            dataset_data, (metrics_config_data, cached_metrics_response) = await asyncio.gather(*fetch_tasks)
+                        except BaseException:
+                            # Don't leave the other fetch retrying in the background
+                            for task in fetch_tasks:
+                                task.cancel()
+                            raise
                         
                         # Validation is now handled inside HTTP client methods
                         # If we reach this point, both responses are valid and non-empty
@@ -365,15 +592,21 @@ class EvaluationEngine:
                         log_eval_run(
                             logger,
                             logging.INFO,
-                            f"Successfully fetched data from APIs (with exponential backoff retry logic)",
-                            datasetResponseSize=len(str(dataset_data)) if dataset_data else 0,
-                            metricsConfigResponseSize=len(str(metrics_config_data)) if metrics_config_data else 0,
-                            rawMetricsConfig=metrics_config_data,  # Log complete metrics config for debugging
+                            "Successfully fetched data from APIs (with exponential backoff retry logic)",
+                            datasetResponseSize=getattr(dataset_data, 'raw_size', 0),
+                            metricsConfigurationId=metrics_configuration_id,
+                            metricsConfigResponseSize=getattr(metrics_config_data, 'raw_size', 0),
+                            metricsConfigHash=LazyValue(lambda: self._metrics_config_digest(metrics_config_data)),
+                            # The full configuration body is only attached when debugging
+                            rawMetricsConfig=metrics_config_data if logger.isEnabledFor(logging.DEBUG) else None,
                             retryEnabled=True,
-                            maxRetries=3,
-                            baseRetryDelaySeconds=60,
-                            backoffStrategy="exponential",
-                            retryPattern="60s, 120s, 240s"
+                            maxRetries=_FETCH_MAX_RETRIES,
+                            baseRetryDelaySeconds=_FETCH_BASE_DELAY_SECONDS,
+                            backoffStrategy="exponential_jitter",
+                            retryPattern=", ".join(
+                                f"{cap // 2}-{cap}s"
+                                for cap in self._retry_delay_caps(_FETCH_MAX_RETRIES, _FETCH_BASE_DELAY_SECONDS)
+                            )
                         )
                         
                         steps_completed.append("fetch_data")
@@ -386,7 +619,7 @@ class EvaluationEngine:
                             f"Failed to fetch dataset and metrics configuration: {str(e)}",
                             errorType=type(e).__name__,
                             errorMessage=str(e),
-                            stackTrace=traceback.format_exc()
+                            stackTrace=lazy_traceback(e)
                         )
                         raise
                 
@@ -395,7 +628,11 @@ class EvaluationEngine:
                     try:
                         enriched_dataset_response = EnrichedDatasetResponse.from_json(dataset_data)
                         dataset = enriched_dataset_response.to_dataset()
-                        metrics_response = MetricsConfigurationResponse.from_json(metrics_config_data)
+                        if cached_metrics_response is not None:
+                            metrics_response = cached_metrics_response
+                        else:
+                            metrics_response = MetricsConfigurationResponse.from_json(metrics_config_data)
+                            self._cache_metrics_config(metrics_configuration_id, metrics_config_data, metrics_response)
                         
                         # Log detailed parsing results
                         parsed_metrics = []
@@ -411,7 +648,7 @@ class EvaluationEngine:
                         log_eval_run(
                             logger,
                             logging.INFO,
-                            f"Successfully parsed evaluation data",
+                            "Successfully parsed evaluation data",
                             step_number=2,
                             dataset_items_count=len(dataset.items),
                             metrics_count=len(metrics_response.metrics_configuration),
@@ -438,77 +675,34 @@ class EvaluationEngine:
                             step_number=2,
                             step_name="parse_dataset_and_metrics",
                             error_details=str(e),
-                            raw_dataset_sample=str(dataset_data)[:500] if dataset_data else "null",
-                            raw_metrics_config=metrics_config_data,
-                            stack_trace=traceback.format_exc()
+                            raw_dataset_sample=getattr(dataset_data, 'raw_preview', "null"),
+                            raw_metrics_config_sample=getattr(metrics_config_data, 'raw_preview', "null"),
+                            # The full configuration body is only attached when debugging
+                            raw_metrics_config=metrics_config_data if logger.isEnabledFor(logging.DEBUG) else None,
+                            stack_trace=lazy_traceback(e)
                         )
                         raise
                 
+                # The dataset items now hold the values they need; release the parsed response tree
+                # so it isn't kept alive alongside them for the rest of the run
+                dataset_data = None
+                
                 # Step 3: Update status to EvalRunStarted
+                # Best effort: the update runs in the background so it never delays Step 4.
+                # It is awaited before Step 7 so a late EvalRunStarted cannot overwrite EvalRunCompleted.
                 with eval_workflow_step("update_status_started", "3/7") as op_id:
-                    try:
-                        await self._fetch_with_retry(
-                            self._update_evaluation_status,
-                            eval_run_id,
-                            "EvalRunStarted",
-                            operation_name="update_status_started",
-                            eval_run_id_for_logging=eval_run_id
-                        )
-                        
-                        steps_completed.append("update_status_started")
-                        log_operation_success(
-                            logger, 
-                            "update_status_started_step", 
-                            eval_run_id=eval_run_id, 
-                            step_number=3,
-                            status_updated_to="EvalRunStarted"
-                        )
-                        
-                    except Exception as e:
-                        log_operation_error(
-                            logger,
-                            "update_status_started_step",
-                            e,
-                            eval_run_id=eval_run_id,
-                            step_number=3,
-                            step_name="update_status_started",
-                            target_status="EvalRunStarted",
-                            error_details=str(e),
-                            stack_trace=traceback.format_exc()
-                        )
-                        raise
+                    started_status_task = asyncio.ensure_future(self._mark_run_started(eval_run_id))
                 
                 # Step 4: Run evaluations
                 with eval_workflow_step("run_evaluations", "4/7") as op_id:
                     try:
-                        results = await self._run_evaluations(dataset, metrics_response.metrics_configuration)
+                        results, evaluation_stats = await self._run_evaluations(dataset, metrics_response.metrics_configuration)
                         
-                        # Count successful evaluations and collect failure details
-                        successful_evaluations = 0
-                        failed_evaluations = 0
-                        total_scores = 0
-                        failed_metrics_details = []
-                        
-                        for item_result in results:
-                            for score in item_result.metric_scores:
-                                total_scores += 1
-                                if score.score is not None and score.score > 0:
-                                    successful_evaluations += 1
-                                else:
-                                    failed_evaluations += 1
-                                    # Collect details of failed metrics
-                                    if score.metric_name not in [f['metric_name'] for f in failed_metrics_details]:
-                                        failed_metrics_details.append({
-                                            'metric_name': score.metric_name,
-                                            'failure_reason': score.reason,
-                                            'failure_count': 1
-                                        })
-                                    else:
-                                        # Increment count for existing failed metric
-                                        for failed_metric in failed_metrics_details:
-                                            if failed_metric['metric_name'] == score.metric_name:
-                                                failed_metric['failure_count'] += 1
-                                                break
+                        # Successful/failed counts and failure details were accumulated while scoring
+                        successful_evaluations = evaluation_stats['successful_evaluations']
+                        failed_evaluations = evaluation_stats['failed_evaluations']
+                        total_scores = evaluation_stats['total_scores']
+                        failed_metrics_details = list(evaluation_stats['failed_by_name'].values())
                         
                         # Determine if step should be marked as successful
                         # Step fails only if ALL metrics failed (no successful evaluations)
@@ -518,7 +712,7 @@ class EvaluationEngine:
                             log_eval_run(
                                 logger,
                                 logging.INFO,
-                                f"Evaluation execution completed successfully - at least one metric succeeded",
+                                "Evaluation execution completed successfully - at least one metric succeeded",
                                 step_number=4,
                                 total_items_processed=len(results),
                                 total_scores_computed=total_scores,
@@ -544,7 +738,7 @@ class EvaluationEngine:
                             log_eval_run(
                                 logger,
                                 logging.ERROR,
-                                f"Evaluation execution failed - ALL metrics failed",
+                                "Evaluation execution failed - ALL metrics failed",
                                 step_number=4,
                                 total_items_processed=len(results),
                                 total_scores_computed=total_scores,
@@ -581,15 +775,17 @@ class EvaluationEngine:
                             items_to_evaluate=len(dataset.items),
                             metrics_to_run=len(metrics_response.metrics_configuration),
                             error_details=str(e),
-                            stack_trace=traceback.format_exc()
+                            stack_trace=lazy_traceback(e)
                         )
                         raise
                 
                 # Step 5: Generate summary
                 with eval_workflow_step("generate_summary", "5/7") as op_id:
                     try:
-                        execution_time = time.time() - start_time
-                        summary = self._generate_summary(
+                        execution_time = time.perf_counter() - start_time
+                        # Large runs take a while to summarize; keep the event loop serving other runs
+                        summary = await asyncio.to_thread(
+                            self._generate_summary,
                             queue_message, 
                             results, 
                             metrics_response.metrics_configuration,
@@ -601,7 +797,7 @@ class EvaluationEngine:
                         log_eval_run(
                             logger,
                             logging.INFO,
-                            f"Successfully generated evaluation summary",
+                            "Successfully generated evaluation summary",
                             step_number=5,
                             execution_time_seconds=execution_time,
                             summary_metrics_count=len(summary.metric_summaries),
@@ -626,7 +822,7 @@ class EvaluationEngine:
                             step_number=5,
                             step_name="generate_summary",
                             error_details=str(e),
-                            stack_trace=traceback.format_exc()
+                            stack_trace=lazy_traceback(e)
                         )
                         raise
                 
@@ -646,7 +842,7 @@ class EvaluationEngine:
                         log_eval_run(
                             logger,
                             logging.INFO,
-                            f"Successfully posted evaluation results to API",
+                            "Successfully posted evaluation results to API",
                             step_number=6,
                             agent_id=summary.agent_id,
                             results_count=len(results),
@@ -672,12 +868,15 @@ class EvaluationEngine:
                             step_name="post_results",
                             agent_id=summary.agent_id,
                             error_details=str(e),
-                            stack_trace=traceback.format_exc()
+                            stack_trace=lazy_traceback(e)
                         )
                         raise
                 
                 # Step 7: Update status to completed
                 with eval_workflow_step("update_status_completed", "7/7") as op_id:
+                    if await started_status_task:
+                        steps_completed.append("update_status_started")
+                    
                     try:
                         await self._fetch_with_retry(
                             self._update_evaluation_status,
@@ -710,13 +909,13 @@ class EvaluationEngine:
                             error_details=str(e),
                             severity="warning",
                             continue_processing=True,
-                            stack_trace=traceback.format_exc(),
+                            stack_trace=lazy_traceback(e),
                             retry_attempts_made=True,
                             all_retries_failed=True
                         )
                 
                 # All steps completed - wrap up the evaluation
-                execution_time = time.time() - start_time
+                execution_time = time.perf_counter() - start_time
                 
                 # Return True only if all critical steps completed (status update is not critical)
                 critical_steps = ["fetch_data", "parse_data", "run_evaluations", "generate_summary", "post_results"]
@@ -741,7 +940,7 @@ class EvaluationEngine:
                     log_operation_error(
                         logger,
                         "evaluation_processing", 
-                        Exception(f"Not all critical steps completed"),
+                        Exception("Not all critical steps completed"),
                         eval_run_id=eval_run_id,
                         completed_steps=steps_completed,
                         missing_critical_steps=missing_steps,
@@ -756,18 +955,21 @@ class EvaluationEngine:
                 
                 # Handle any unhandled exceptions to ensure we always return a boolean
                 eval_run_id = getattr(queue_message, 'eval_run_id', 'unknown')
-                logger.error(f"[ERROR] Unhandled exception in process_queue_message for {eval_run_id}: {str(e)}")
-                logger.error(f"Exception type: {type(e).__name__}")
-                logger.error(f"Stack trace: {traceback.format_exc()}")
+                error_type = type(e).__name__
+                error_message = str(e)
+                stack_trace = lazy_traceback(e)
+                logger.error("[ERROR] Unhandled exception in process_queue_message for %s: %s", eval_run_id, error_message)
+                logger.error("Exception type: %s", error_type)
+                logger.error("Stack trace: %s", stack_trace)
                 
                 # Log structured error for debugging
                 log_eval_run(
                     logger,
                     logging.ERROR,
-                    f"Unhandled exception in evaluation processing",
-                    errorType=type(e).__name__,
-                    errorMessage=str(e),
-                    stackTrace=traceback.format_exc(),
+                    "Unhandled exception in evaluation processing",
+                    errorType=error_type,
+                    errorMessage=error_message,
+                    stackTrace=stack_trace,
                     criticalFailure=True
                 )
                 
@@ -775,6 +977,12 @@ class EvaluationEngine:
                 return False
             
             finally:
+                # A run that failed before Step 7 no longer needs its EvalRunStarted update
+                if started_status_task is not None and not started_status_task.done():
+                    started_status_task.cancel()
+                
+                flush_workflow_timeline(logger, evalRunId=eval_run_id)
+                
                 # Always clear eval run context when processing completes
                 clear_eval_run_context()
     
@@ -782,163 +990,221 @@ class EvaluationEngine:
         self, 
         dataset: Dataset, 
         metrics_config: List
-    ) -> List[DatasetItemResult]:
+    ) -> Tuple[List[DatasetItemResult], Dict[str, Any]]:
         """
         Run evaluations for all dataset items and metrics concurrently.
         
+        Every (item, metric) pair is a unit of work on a queue drained by a fixed pool of workers,
+        so a slow metric only holds its own slot instead of blocking the rest of its item. Locally
+        computed metrics use a separate queue and pool (max_parallel_local_metrics).
+        
         Args:
             dataset: Dataset to evaluate
             metrics_config: List of metric configurations
             
         Returns:
-            List of evaluation results per dataset item
+            Tuple of (evaluation results per dataset item, score statistics). Each item's
+            metric_scores follow the order of metrics_config. The statistics
+            are accumulated as scores are produced and contain successful_evaluations,
+            failed_evaluations, total_scores and failed_by_name (failure details keyed by metric name).
         """
         # Get available metrics from registry
-        available_metrics = registry.get_all_metrics_flat()
+        available_metrics = self._get_available_metrics()
         
-        logger.info(f"Available metrics: {list(available_metrics.keys())}")
-        logger.info(f"Processing {len(dataset.items)} dataset items with {len(metrics_config)} metrics each")
+        # Resolve each configured metric once per run rather than once per (item, metric) pair
+        resolved_metrics = self._resolve_metrics(metrics_config, available_metrics)
         
-        # Process dataset items concurrently with controlled concurrency
-        dataset_semaphore = asyncio.Semaphore(app_settings.evaluation.max_parallel_prompts)  # Use configured max parallel prompts
+        items = dataset.items
+        logger.info("Available metrics: %s", list(available_metrics.keys()))
+        logger.info("Processing %s dataset items with %s metrics each", len(items), len(metrics_config))
         
-        async def process_dataset_item(i, item):
-            async with dataset_semaphore:
-                logger.debug(f"Processing dataset item {i+1}/{len(dataset.items)}")
-                
-                # Run metrics for this item
-                metric_scores = await self._evaluate_item_metrics(item, metrics_config, available_metrics)
-                
-                # Create result
-                return DatasetItemResult(
-                    prompt=item.prompt,
-                    ground_truth=item.ground_truth,
-                    actual_response=item.actual_response,
-                    context=item.context,
-                    metric_scores=metric_scores
+        stats: Dict[str, Any] = {
+            'successful_evaluations': 0,
+            'failed_evaluations': 0,
+            'total_scores': 0,
+            'failed_by_name': {}
+        }
+        failed_by_name = stats['failed_by_name']
+        
+        def tally_score(score: MetricScore) -> None:
+            # Count scores as they are produced so Step 4 doesn't rescan the results
+            stats['total_scores'] += 1
+            value = score.score
+            if value is not None and value > 0:
+                stats['successful_evaluations'] += 1
+            else:
+                stats['failed_evaluations'] += 1
+                metric_name = score.metric_name
+                entry = failed_by_name.get(metric_name)
+                if entry is None:
+                    failed_by_name[metric_name] = {
+                        'metric_name': metric_name,
+                        'failure_reason': score.reason,
+                        'failure_count': 1
+                    }
+                else:
+                    entry['failure_count'] += 1
+        
+        # Scores are written into their (item, metric) slot so results keep the configured order
+        score_matrix: List[List[Optional[MetricScore]]] = [[None] * len(metrics_config) for _ in items]
+        
+        # Metrics missing from the registry fail the same way for every item - score them here
+        # instead of scheduling a coroutine per item that would only discover the miss
+        valid_metric_indexes = []
+        available_metric_names = list(available_metrics.keys())
+        for metric_index, config in enumerate(metrics_config):
+            metric_name, metric = resolved_metrics[config.metric_name]
+            if metric:
+                valid_metric_indexes.append(metric_index)
+                continue
+            logger.warning("Metric '%s' (normalized to '%s') not found in registry", config.metric_name, metric_name)
+            for item_scores in score_matrix:
+                score = self._metric_not_found_score(config.metric_name, metric_name, available_metric_names)
+                item_scores[metric_index] = score
+                tally_score(score)
+        
+        # Items whose evaluation inputs are identical to an earlier item reuse that item's scores
+        source_indexes = list(range(len(items)))
+        if app_settings.evaluation.deduplicate_items:
+            first_index_by_key: Dict[bytes, int] = {}
+            for item_index, item in enumerate(items):
+                source_indexes[item_index] = first_index_by_key.setdefault(self._item_evaluation_key(item), item_index)
+        unique_item_indexes = [item_index for item_index, source in enumerate(source_indexes) if source == item_index]
+        if len(unique_item_indexes) < len(items):
+            logger.info("Reusing scores for %s duplicate dataset items", len(items) - len(unique_item_indexes))
+        
+        # Local metrics and model-backed metrics drain separate queues with their own worker
+        # limits, so fast local scores don't wait behind slow model calls and vice versa
+        local_queue: asyncio.Queue = asyncio.Queue()
+        remote_queue: asyncio.Queue = asyncio.Queue()
+        for metric_index in valid_metric_indexes:
+            metric = resolved_metrics[metrics_config[metric_index].metric_name][1]
+            work_queue = local_queue if getattr(metric, 'category', None) in _LOCAL_METRIC_CATEGORIES else remote_queue
+            for item_index in unique_item_indexes:
+                work_queue.put_nowait((item_index, metric_index))
+        
+        async def worker(work_queue: asyncio.Queue) -> None:
+            while True:
+                try:
+                    item_index, metric_index = work_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                score = await self._evaluate_metric_safely(
+                    items[item_index], metrics_config[metric_index], available_metrics, resolved_metrics
                 )
+                score_matrix[item_index][metric_index] = score
+                tally_score(score)
         
-        # Create tasks for all dataset items
-        tasks = [process_dataset_item(i, item) for i, item in enumerate(dataset.items)]
+        # Model-backed pool sized like the previous nested limits (parallel prompts x parallel metrics per prompt)
+        eval_settings = app_settings.evaluation
+        remote_workers = min(eval_settings.max_parallel_prompts * eval_settings.max_parallel_metrics, remote_queue.qsize())
+        local_workers = min(eval_settings.max_parallel_local_metrics, local_queue.qsize())
+        await asyncio.gather(
+            *(worker(remote_queue) for _ in range(remote_workers)),
+            *(worker(local_queue) for _ in range(local_workers))
+        )
         
-        # Execute all dataset items concurrently
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for item_index, source in enumerate(source_indexes):
+            if source != item_index:
+                for metric_index in valid_metric_indexes:
+                    score = score_matrix[source][metric_index]
+                    score_matrix[item_index][metric_index] = score
+                    tally_score(score)
         
-        # Handle any exceptions from dataset item processing
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Error processing dataset item {i+1}: {str(result)}")
-                # Create a failure result for this item
-                item = dataset.items[i]
-                failure_scores = []
-                for config in metrics_config:
-                    failure_scores.append(MetricScore(
-                        metric_name=config.metric_name,
-                        score=0.0,
-                        reason=f"Dataset item processing failed: {str(result)}",
-                        passed=False,
-                        details={
-                            'error_type': type(result).__name__,
-                            'error_message': str(result),
-                            'failure_category': 'dataset_item_processing_error',
-                            'evaluation_attempted': False
-                        }
-                    ))
-                
-                processed_results.append(DatasetItemResult(
-                    prompt=item.prompt,
-                    ground_truth=item.ground_truth,
-                    actual_response=item.actual_response,
-                    context=item.context,
-                    metric_scores=failure_scores
-                ))
-            else:
-                processed_results.append(result)
+        results = [
+            DatasetItemResult(
+                prompt=item.prompt,
+                ground_truth=item.ground_truth,
+                actual_response=item.actual_response,
+                context=item.context,
+                metric_scores=item_scores
+            )
+            for item, item_scores in zip(items, score_matrix)
+        ]
         
-        return processed_results
+        return results, stats
     
-    async def _evaluate_item_metrics(
+    async def _evaluate_metric_safely(
         self, 
         item: DatasetItem, 
-        metrics_config: List,
-        available_metrics: Dict[str, Any]
-    ) -> List[MetricScore]:
+        config,
+        available_metrics: Dict[str, Any],
+        resolved_metrics: Optional[Dict[str, Tuple[str, Any]]] = None
+    ) -> MetricScore:
         """
-        Evaluate all configured metrics for a single dataset item concurrently.
+        Evaluate one metric for one dataset item, turning timeouts and errors into failure scores.
         
         Args:
             item: Dataset item to evaluate
-            metrics_config: List of metric configurations
+            config: Metric configuration
             available_metrics: Available metric instances
+            resolved_metrics: Metric instances resolved once per run (see _resolve_metrics)
             
         Returns:
-            List of metric scores
+            Metric score (a failed score if the evaluation timed out or raised)
         """
-        # Run metrics in parallel with optimized concurrency
-        # Higher concurrency for metrics since they're typically I/O bound
-        semaphore = asyncio.Semaphore(app_settings.evaluation.max_parallel_metrics)  # Use configured max parallel metrics
-        
-        async def evaluate_metric_with_timeout(config):
-            async with semaphore:
-                try:
-                    # Add timeout to prevent hanging metrics
-                    return await asyncio.wait_for(
-                        self._evaluate_single_metric(item, config, available_metrics),
-                        timeout=30.0  # 30 second timeout per metric
-                    )
-                except asyncio.TimeoutError:
-                    logger.warning(f"Metric {config.metric_name} evaluation timed out after 30 seconds")
-                    return MetricScore(
-                        metric_name=config.metric_name,
-                        score=0.0,
-                        reason="Evaluation timed out after 30 seconds",
-                        passed=False,
-                        details={
-                            'error_type': 'TimeoutError',
-                            'error_message': 'Metric evaluation exceeded 30 second timeout',
-                            'evaluation_attempted': True,
-                            'failure_category': 'metric_timeout_error',
-                            'timeout_seconds': 30.0
-                        }
-                    )
-        
-        # Create tasks for all metrics
-        tasks = [evaluate_metric_with_timeout(config) for config in metrics_config]
-        
-        # Execute all metrics concurrently
-        scores = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Process results and collect detailed failure information
-        metric_scores = []
-        for i, score in enumerate(scores):
-            if isinstance(score, Exception):
-                metric_name = metrics_config[i].metric_name
-                error_details = {
-                    'error_type': type(score).__name__,
-                    'error_message': str(score),
-                    'metric_name': metric_name
+        try:
+            # _run_metric_in_thread enforces the per-metric timeout once the metric starts running
+            return await self._evaluate_single_metric(item, config, available_metrics, resolved_metrics)
+        except EvaluationTimeoutError:
+            logger.warning("Metric %s evaluation timed out after 30 seconds", config.metric_name)
+            return MetricScore(
+                metric_name=config.metric_name,
+                score=0.0,
+                reason="Evaluation timed out after 30 seconds",
+                passed=False,
+                details=dict(_METRIC_TIMEOUT_DETAILS)
+            )
+        except Exception as e:
+            metric_name = config.metric_name
+            error_type = type(e).__name__
+            error_message = str(e)
+            error_details = {
+                'error_type': error_type,
+                'error_message': error_message,
+                'metric_name': metric_name
+            }
+            
+            logger.error("Error evaluating metric %s: %s", metric_name, error_message, extra=error_details)
+            
+            # Create detailed failure score
+            return MetricScore(
+                metric_name=metric_name,
+                score=0.0,
+                reason=f"Evaluation failed ({error_type}): {error_message}",
+                passed=False,
+                details={
+                    **_METRIC_EXECUTION_ERROR_DETAILS,
+                    'error_type': error_type,
+                    'error_message': error_message
                 }
-                
-                logger.error(f"Error evaluating metric {metric_name}: {str(score)}", extra=error_details)
-                
-                # Create detailed failure score
-                metric_scores.append(MetricScore(
-                    metric_name=metric_name,
-                    score=0.0,
-                    reason=f"Evaluation failed ({type(score).__name__}): {str(score)}",
-                    passed=False,
-                    details={
-                        'error_type': type(score).__name__,
-                        'error_message': str(score),
-                        'evaluation_attempted': True,
-                        'failure_category': 'metric_execution_error'
-                    }
-                ))
-            else:
-                metric_scores.append(score)
+            )
+    
+    def _get_available_metrics(self) -> Dict[str, Any]:
+        """Get the flat registry of metric instances, rebuilt only when the registry changes."""
+        version = registry.version
+        cached = self._available_metrics_cache
+        if cached is None or cached[0] != version:
+            cached = (version, registry.get_all_metrics_flat())
+            self._available_metrics_cache = cached
+        return cached[1]
+    
+    def _resolve_metrics(self, metrics_config: List, available_metrics: Dict[str, Any]) -> Dict[str, Tuple[str, Any]]:
+        """
+        Resolve configured metric names to registry instances.
         
-        return metric_scores
+        Args:
+            metrics_config: List of metric configurations
+            available_metrics: Available metric instances
+            
+        Returns:
+            Dictionary of configured metric name to (normalized name, metric instance or None)
+        """
+        resolved_metrics = {}
+        for config in metrics_config:
+            metric_name = self._normalize_metric_name(config.metric_name, available_metrics)
+            resolved_metrics[config.metric_name] = (metric_name, available_metrics.get(metric_name))
+        return resolved_metrics
     
     def _normalize_metric_name(self, metric_name: str, available_metrics: Dict[str, Any]) -> str:
         """
@@ -963,12 +1229,59 @@ class EvaluationEngine:
         
         # Return original name if no mapping found
         return metric_name
+    
+    @staticmethod
+    def _item_evaluation_key(item: DatasetItem) -> bytes:
+        """
+        Digest of every dataset item field the evaluators read, used to detect duplicate items.
+        
+        Args:
+            item: Dataset item
+            
+        Returns:
+            16-byte digest that is equal for items with identical evaluation inputs
+        """
+        payload = json.dumps(
+            [item.prompt, item.ground_truth, item.actual_response, item.expected_response, item.context, item.metadata],
+            sort_keys=True,
+            default=str,
+            ensure_ascii=False
+        )
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).digest()
+    
+    @staticmethod
+    def _metric_not_found_score(original_metric_name: str, metric_name: str, available_metric_names: List[str]) -> MetricScore:
+        """
+        Build the failed score for a configured metric that is not in the registry.
+        
+        Args:
+            original_metric_name: Metric name from configuration
+            metric_name: Normalized metric name that was looked up
+            available_metric_names: Names of the available metrics
+            
+        Returns:
+            Failed metric score marked as not attempted
+        """
+        return MetricScore(
+            metric_name=original_metric_name,  # Keep original name in result
+            score=0.0,
+            reason=f"Metric '{original_metric_name}' not available in registry",
+            passed=False,
+            details={
+                'original_name': original_metric_name,
+                'normalized_name': metric_name,
+                'available_metrics': available_metric_names,
+                'failure_category': 'metric_not_found',
+                'evaluation_attempted': False
+            }
+        )
 
     async def _evaluate_single_metric(
         self, 
         item: DatasetItem, 
         config, 
-        available_metrics: Dict[str, Any]
+        available_metrics: Dict[str, Any],
+        resolved_metrics: Optional[Dict[str, Tuple[str, Any]]] = None
     ) -> MetricScore:
         """
         Evaluate a single metric for a dataset item.
@@ -977,6 +1290,7 @@ class EvaluationEngine:
             item: Dataset item to evaluate
             config: Metric configuration
             available_metrics: Available metric instances
+            resolved_metrics: Metric instances resolved once per run (see _resolve_metrics)
             
         Returns:
             Metric score with pass/fail determination
@@ -984,31 +1298,24 @@ class EvaluationEngine:
         original_metric_name = config.metric_name
         threshold = config.threshold
         
-        # Normalize metric name to handle naming variations
-        metric_name = self._normalize_metric_name(original_metric_name, available_metrics)
+        resolved = resolved_metrics.get(original_metric_name) if resolved_metrics else None
+        if resolved is not None:
+            metric_name, metric = resolved
+        else:
+            # Normalize metric name to handle naming variations
+            metric_name = self._normalize_metric_name(original_metric_name, available_metrics)
+            
+            # Find metric instance
+            metric = available_metrics.get(metric_name)
         
-        # Find metric instance
-        metric = available_metrics.get(metric_name)
         if not metric:
-            logger.warning(f"Metric '{original_metric_name}' (normalized to '{metric_name}') not found in registry")
-            logger.debug(f"Available metrics: {list(available_metrics.keys())}")
-            return MetricScore(
-                metric_name=original_metric_name,  # Keep original name in result
-                score=0.0,
-                reason=f"Metric '{original_metric_name}' not available in registry",
-                passed=False,
-                details={
-                    'original_name': original_metric_name,
-                    'normalized_name': metric_name,
-                    'available_metrics': list(available_metrics.keys()),
-                    'failure_category': 'metric_not_found',
-                    'evaluation_attempted': False
-                }
-            )
+            logger.warning("Metric '%s' (normalized to '%s') not found in registry", original_metric_name, metric_name)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Available metrics: %s", list(available_metrics.keys()))
+            return self._metric_not_found_score(original_metric_name, metric_name, list(available_metrics.keys()))
         
         try:
-            # Run metric evaluation
-            score = metric.evaluate(item)
+            score = await self._run_metric_in_thread(metric, item)
             
             # Trust the evaluator's own passed determination - don't override!
             # Different evaluator types use different threshold logic:
@@ -1030,26 +1337,71 @@ class EvaluationEngine:
                 }
             )
             
+        except EvaluationTimeoutError:
+            raise
         except Exception as e:
             error_type = type(e).__name__
             error_message = str(e)
-            logger.error(f"Error evaluating metric {original_metric_name} (normalized to {metric_name}): {error_message}")
+            logger.error("Error evaluating metric %s (normalized to %s): %s", original_metric_name, metric_name, error_message)
             return MetricScore(
                 metric_name=original_metric_name,  # Keep original name in result
                 score=0.0,
                 reason=f"Evaluation error ({error_type}): {error_message}",
                 passed=False,
                 details={
+                    **_METRIC_EVALUATION_ERROR_DETAILS,
                     'original_name': original_metric_name,
                     'normalized_name': metric_name,
                     'error_type': error_type,
                     'error_message': error_message,
-                    'threshold': threshold,
-                    'failure_category': 'metric_evaluation_error',
-                    'evaluation_attempted': True
+                    'threshold': threshold
                 }
             )
     
+    async def _run_metric_in_thread(self, metric, item: DatasetItem) -> MetricScore:
+        """
+        Run a synchronous metric on the metric thread pool, keeping the eval run logging context.
+        
+        The timeout starts when a thread picks the metric up, so time spent queued behind
+        other metrics does not count against it.
+        
+        Args:
+            metric: Metric instance to evaluate
+            item: Dataset item to evaluate
+            
+        Returns:
+            The metric's own score
+            
+        Raises:
+            EvaluationTimeoutError: If the metric runs longer than _METRIC_TIMEOUT_SECONDS
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.create_future()
+        context = contextvars.copy_context()
+        
+        def run() -> MetricScore:
+            loop.call_soon_threadsafe(started.set_result, None)
+            return context.run(metric.evaluate, item)
+        
+        job = loop.run_in_executor(self._metric_executor, run)
+        try:
+            # A job cancelled by close() never starts, so also wake up when the job finishes
+            await asyncio.wait((started, job), return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            job.cancel()
+            raise
+        
+        try:
+            async with asyncio.timeout(_METRIC_TIMEOUT_SECONDS) as deadline:
+                return await job
+        except asyncio.TimeoutError:
+            # A TimeoutError raised by the metric itself is an evaluation error, not a timeout
+            if deadline.expired():
+                raise EvaluationTimeoutError(
+                    f"Metric evaluation exceeded {_METRIC_TIMEOUT_SECONDS:g} second timeout"
+                ) from None
+            raise
+    
     def _generate_summary(
         self,
         queue_message: QueueMessage,
@@ -1070,27 +1422,26 @@ class EvaluationEngine:
         Returns:
             Evaluation summary
         """
+        # _run_evaluations stores each item's scores in metrics_config order, so a metric's scores
+        # are read by position. A metric configured twice uses its first position, as before.
+        first_position: Dict[str, int] = {}
+        
         # Calculate per-metric summaries
         metric_summaries = []
         
-        for config in metrics_config:
+        for position, config in enumerate(metrics_config):
             metric_name = config.metric_name
-            
-            # Collect scores for this metric across all items
-            scores = []
-            passed_count = 0
-            
-            for result in results:
-                for score in result.metric_scores:
-                    if score.metric_name == metric_name:
-                        scores.append(score.score)
-                        if score.passed:
-                            passed_count += 1
-                        break
+            position = first_position.setdefault(metric_name, position)
+            item_scores = [result.metric_scores[position] for result in results]
+            scores = [score.score for score in item_scores]
+            passed_count = sum(1 for score in item_scores if score.passed)
             
             if scores:
-                average_score = sum(scores) / len(scores)
                 total_count = len(scores)
+                if NUMPY_AVAILABLE and total_count >= _NUMPY_MIN_SCORES:
+                    average_score = float(np.fromiter(scores, dtype=np.float64, count=total_count).mean())
+                else:
+                    average_score = sum(scores) / total_count
                 failed_count = total_count - passed_count
                 pass_percentage = (passed_count / total_count) * 100 if total_count > 0 else 0
             else:
@@ -1152,38 +1503,80 @@ class EvaluationEngine:
             # Prepare results data for API according to swagger specification
             # The C# API expects JsonElement types, which means we need to send actual JSON objects, not strings
             
+            # Validate the data before converting anything
+            if not results:
+                raise ValueError("Detailed results list is empty")
             summary_dict = summary.to_dict()
-            detailed_results = [result.to_dict() for result in results]
-            
-            # Validate the data before sending
             if not summary_dict:
                 raise ValueError("Summary dictionary is empty")
-            if not detailed_results:
-                raise ValueError("Detailed results list is empty")
             
-            # Send JSON objects directly (not JSON strings) as required by JsonElement
+            # Send JSON objects directly (not JSON strings) as required by JsonElement.
+            # Item dictionaries are cached on the results, so retried posts reuse them.
             results_data = {
                 'evaluationResultSummary': summary_dict,  # Send as dict/object, not string
-                'evaluationResultDataset': detailed_results  # Send as list/array, not string
+                'evaluationResultDataset': [result.to_dict() for result in results]  # Send as list/array, not string
             }
             
-            logger.info(f"Prepared results data: summary_keys={list(summary_dict.keys())}, dataset_items={len(detailed_results)}")
-            
             # Post results to API
-            logger.info(f"Posting evaluation results to API. Summary dict with {len(summary_dict)} keys, Dataset with {len(detailed_results)} items")
+            logger.info("Posting evaluation results to API: summary_keys=%s, dataset_items=%s", list(summary_dict.keys()), len(results))
             success = await self.api_client.post_evaluation_results(eval_run_id, results_data)
             
             if success:
-                logger.info(f"Successfully posted evaluation results to API for eval run: {eval_run_id}")
+                logger.info("Successfully posted evaluation results to API for eval run: %s", eval_run_id)
                 return True
             else:
-                logger.error(f"API call returned False - check API response logs above for details")
+                logger.error("API call returned False - check API response logs above for details")
                 raise Exception("Failed to post evaluation results to API")
             
         except Exception as e:
-            logger.error(f"Error posting results to API: {str(e)}")
+            logger.error("Error posting results to API: %s", e)
             raise
 
+    async def _mark_run_started(self, eval_run_id: str) -> bool:
+        """
+        Update the eval run status to EvalRunStarted without failing the run.
+        
+        Args:
+            eval_run_id: Evaluation run ID
+            
+        Returns:
+            bool: True if the status was updated, False if all retries failed
+        """
+        try:
+            await self._fetch_with_retry(
+                self._update_evaluation_status,
+                eval_run_id,
+                "EvalRunStarted",
+                operation_name="update_status_started",
+                eval_run_id_for_logging=eval_run_id
+            )
+            
+            log_operation_success(
+                logger, 
+                "update_status_started_step", 
+                eval_run_id=eval_run_id, 
+                step_number=3,
+                status_updated_to="EvalRunStarted"
+            )
+            return True
+            
+        except Exception as e:
+            # The started status is informational - the run continues and Step 7 still reports completion
+            log_operation_error(
+                logger,
+                "update_status_started_step",
+                e,
+                eval_run_id=eval_run_id,
+                step_number=3,
+                step_name="update_status_started",
+                target_status="EvalRunStarted",
+                error_details=str(e),
+                severity="warning",
+                continue_processing=True,
+                stack_trace=lazy_traceback(e)
+            )
+            return False
+    
     async def _update_evaluation_status(self, eval_run_id: str, status: str) -> bool:
         """
         Update evaluation run status via API.
@@ -1198,13 +1591,13 @@ class EvaluationEngine:
         try:
             success = await self.api_client.update_evaluation_status(eval_run_id, status)
             if success:
-                logger.info(f"Successfully updated status to '{status}' for eval run: {eval_run_id}")
+                logger.info("Successfully updated status to '%s' for eval run: %s", status, eval_run_id)
                 return True
             else:
-                logger.warning(f"Failed to update status for eval run: {eval_run_id}")
+                logger.warning("Failed to update status for eval run: %s", eval_run_id)
                 raise Exception(f"Failed to update status to '{status}' for eval run: {eval_run_id}")
         except Exception as e:
-            logger.error(f"Error updating evaluation status: {str(e)}")
+            logger.error("Error updating evaluation status: %s", e)
             raise
 
 
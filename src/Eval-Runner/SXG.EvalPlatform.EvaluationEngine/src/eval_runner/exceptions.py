@@ -38,6 +38,14 @@ class ApiClientError(EvaluationEngineError):
     """Raised when there's an issue with API client operations."""
     pass
 
+class ApiHttpError(ApiClientError, ValueError):
+    """Raised when an API call returns an unexpected HTTP status code."""
+    
+    def __init__(self, message: str, status_code: int, response_text: str = ""):
+        super().__init__(message)
+        self.status_code = status_code
+        self.response_text = response_text
+
 class EvaluationTimeoutError(EvaluationEngineError):
     """Raised when an evaluation operation times out."""
     pass
@@ -108,13 +108,21 @@ class AzureAIMetricsRegistry:
     def __init__(self):
         """Initialize the registry."""
         self._metrics: Dict[str, Dict[str, MetricAdapter]] = {}
+        # Incremented on every registration so callers can tell when cached lookups are stale
+        self._version = 0
         self._load_all_metrics()
     
+    @property
+    def version(self) -> int:
+        """Registration counter; changes whenever a metric is registered."""
+        return self._version
+    
     def register_metric(self, metric_adapter: MetricAdapter) -> None:
         """Register a metric adapter in the registry."""
         if metric_adapter.category not in self._metrics:
             self._metrics[metric_adapter.category] = {}
         self._metrics[metric_adapter.category][metric_adapter.name] = metric_adapter
+        self._version += 1
     
     def get_metric(self, category: str, name: str) -> Optional[MetricAdapter]:
         """Get a specific metric by category and name."""
@@ -108,7 +108,7 @@ class BaseAzureEvaluator(ABC):
         Returns:
             Evaluation result with score and reasoning
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         
         with tracer.start_as_current_span(
             f"evaluator.{self.name}.evaluate",
@@ -129,7 +129,7 @@ class BaseAzureEvaluator(ABC):
                 score, reasoning, passed = self._extract_result(azure_result)
                 
                 # Calculate duration
-                duration = time.time() - start_time
+                duration = time.monotonic() - start_time
                 
                 # Record success metrics
                 evaluator_success_counter.add(
@@ -158,20 +158,23 @@ class BaseAzureEvaluator(ABC):
                     "evaluator.result.status": "success"
                 })
                 
-                # Structured logging for success
-                logger.info(
-                    f"Evaluator success: {self.name}",
-                    extra={
-                        "evaluator_name": self.name,
-                        "evaluator_type": self.__class__.__bases__[0].__name__,
-                        "score": score,
-                        "threshold": self.threshold,
-                        "passed": passed,
-                        "duration_seconds": duration,
-                        "reasoning_length": len(reasoning),
-                        "azure_result_keys": list(azure_result.keys()) if azure_result else []
-                    }
-                )
+                # Structured logging for success - runs once per (item, metric), so skip
+                # building the extra properties when INFO is disabled
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Evaluator success: %s",
+                        self.name,
+                        extra={
+                            "evaluator_name": self.name,
+                            "evaluator_type": self.__class__.__bases__[0].__name__,
+                            "score": score,
+                            "threshold": self.threshold,
+                            "passed": passed,
+                            "duration_seconds": duration,
+                            "reasoning_length": len(reasoning),
+                            "azure_result_keys": list(azure_result.keys()) if azure_result else []
+                        }
+                    )
                 
                 details = {
                     "threshold": self.threshold,
@@ -188,7 +191,7 @@ class BaseAzureEvaluator(ABC):
                 
             except Exception as e:
                 # Calculate duration for failed evaluation
-                duration = time.time() - start_time
+                duration = time.monotonic() - start_time
                 
                 # Determine error type for better categorization
                 error_type = type(e).__name__
@@ -378,7 +381,7 @@ class ModelBasedEvaluator(BaseAzureEvaluator):
         # Use Microsoft's standard: score >= threshold for Likert scale evaluators
         passed = score >= self.threshold
         
-        logger.debug(f"{self.name}: score={score}, threshold={self.threshold}, passed={passed}")
+        logger.debug("%s: score=%s, threshold=%s, passed=%s", self.name, score, self.threshold, passed)
         
         return score, reasoning, passed
 
@@ -470,7 +473,7 @@ class SafetyEvaluator(BaseAzureEvaluator):
                 "very high": 7.0  # Azure AI: highest severity
             }
             raw_score = severity_mapping.get(raw_score_value.lower(), 7.0)
-            logger.info(f"{self.name} evaluation: '{raw_score_value}' mapped to Azure AI score {raw_score}")
+            logger.info("%s evaluation: '%s' mapped to Azure AI score %s", self.name, raw_score_value, raw_score)
         else:
             raw_score = float(raw_score_value)
         
@@ -482,7 +485,10 @@ class SafetyEvaluator(BaseAzureEvaluator):
         # Higher normalized score = safer content (inverted from Azure's 0-7 scale)
         normalized_score = max(0.0, (7.0 - raw_score) / 7.0)
         
-        logger.debug(f"{self.name}: raw_score={raw_score}, threshold={self.threshold}, passed={passed}, normalized={normalized_score:.3f}")
+        logger.debug(
+            "%s: raw_score=%s, threshold=%s, passed=%s, normalized=%.3f",
+            self.name, raw_score, self.threshold, passed, normalized_score
+        )
         
         return normalized_score, reasoning, passed
 
@@ -396,7 +396,7 @@ class EvaluationConfig:
             dataset=dataset
         )
 
-@dataclass
+@dataclass(slots=True)
 class MetricScore:
     """Score result for a single metric on a dataset item."""
     metric_name: str
@@ -404,18 +404,21 @@ class MetricScore:
     reason: str
     passed: bool = False
     details: Dict[str, Any] = field(default_factory=dict)
+    _cached_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            'metricName': self.metric_name,
-            'score': self.score,
-            'reason': self.reason,
-            'passed': self.passed,
-            'details': self.details
-        }
+        """Convert to dictionary for JSON serialization (built once and reused)."""
+        if self._cached_dict is None:
+            self._cached_dict = {
+                'metricName': self.metric_name,
+                'score': self.score,
+                'reason': self.reason,
+                'passed': self.passed,
+                'details': self.details
+            }
+        return self._cached_dict
 
-@dataclass
+@dataclass(slots=True)
 class DatasetItemResult:
     """Evaluation result for a single dataset item."""
     prompt: str
@@ -423,16 +426,24 @@ class DatasetItemResult:
     actual_response: str
     context: List[str]
     metric_scores: List[MetricScore]
+    _cached_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            'prompt': self.prompt,
-            'groundTruth': self.ground_truth,
-            'actualResponse': self.actual_response,
-            'context': self.context,
-            'metricScores': [score.to_dict() for score in self.metric_scores]
-        }
+        """
+        Convert to dictionary for JSON serialization.
+        
+        The dictionary is built on first use and reused, so retried result posts don't
+        convert every item again. Results are not modified once evaluation has finished.
+        """
+        if self._cached_dict is None:
+            self._cached_dict = {
+                'prompt': self.prompt,
+                'groundTruth': self.ground_truth,
+                'actualResponse': self.actual_response,
+                'context': self.context,
+                'metricScores': [score.to_dict() for score in self.metric_scores]
+            }
+        return self._cached_dict
 
 @dataclass
 class MetricSummary:
@@ -127,8 +127,14 @@ class AuthTokenProvider:
         Raises:
             ClientAuthenticationError: If authentication fails
         """
+        # Fast path: a valid cached token can be returned without taking the lock
+        cached_token = self._cached_token
+        if self.enable_caching and cached_token is not None and not self._is_token_expired(cached_token):
+            logger.debug("Using cached token")
+            return cached_token.token
+        
         async with self._token_lock:
-            # Check if we have a valid cached token
+            # Check again - another task may have refreshed the token while we waited
             if (self.enable_caching and self._cached_token is not None and 
                 not self._is_token_expired(self._cached_token)):
                 logger.debug("Using cached token")
@@ -136,7 +142,7 @@ class AuthTokenProvider:
             
             # Need to acquire new token
             logger.info("Acquiring new access token...")
-            start_time = time.time()
+            start_time = time.monotonic()
             
             try:
                 credential = self._get_credential()
@@ -145,7 +151,7 @@ class AuthTokenProvider:
                 logger.info(f"Requesting token for scope: {self.scope}")
                 token = await credential.get_token(self.scope)
                 
-                elapsed_time = time.time() - start_time
+                elapsed_time = time.monotonic() - start_time
                 
                 # Calculate token lifetime
                 token_lifetime = token.expires_on - datetime.now().timestamp()
@@ -120,309 +120,369 @@ class AzureQueueService:
             
         logger.info("Starting queue message listener...")
         
-        while True:
-            try:
-                # Receive messages from queue
-                messages = self.queue_client.receive_messages(
-                    max_messages=1,
-                    visibility_timeout=app_settings.evaluation.queue_visibility_timeout_seconds
-                )
+        # Messages being processed; each one is dispatched as soon as it is received
+        in_flight: set = set()
+        
+        try:
+            while True:
+                try:
+                    # Only take messages that can start right away - a received message that waits for
+                    # a free slot could outlive its visibility timeout and be delivered a second time
+                    free_slots = app_settings.evaluation.max_concurrent_evaluations - len(in_flight)
+                    if free_slots <= 0:
+                        await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                        continue
+                    
+                    received_count = await self._receive_and_dispatch(
+                        min(app_settings.evaluation.queue_batch_size, free_slots), message_handler, in_flight
+                    )
+                    
+                    # Log message count after dispatching all messages of this poll
+                    logger.info(f"Received {received_count} message(s) from queue {self.queue_name}")
+                            
+                except Exception as e:
+                    logger.error(f"Error receiving messages: {str(e)}")
+                    
+                # Wait before polling again
+                await asyncio.sleep(app_settings.evaluation.queue_polling_interval_seconds)
+        finally:
+            # Let messages that were already dispatched finish and be acknowledged
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+    
+    async def _receive_and_dispatch(
+        self,
+        max_messages: int,
+        message_handler: Callable[[QueueMessage], Any],
+        in_flight: set
+    ) -> int:
+        """
+        Receive up to max_messages messages and start processing each one as it arrives.
+        
+        Every message of a received page is dispatched, since it is already invisible to other
+        consumers. Further pages are only requested until QueueBatchTimeoutMs has passed since
+        the first message arrived.
+        
+        Args:
+            max_messages: Maximum number of messages to receive
+            message_handler: Function to handle received messages
+            in_flight: Processing tasks of this listener; dispatched tasks are added and remove themselves when done
+            
+        Returns:
+            Number of messages received
+        """
+        # Without messages_per_page the SDK fetches one message per service call
+        messages = self.queue_client.receive_messages(
+            max_messages=max_messages,
+            messages_per_page=max_messages,
+            visibility_timeout=app_settings.evaluation.queue_visibility_timeout_seconds
+        )
+        
+        loop = asyncio.get_running_loop()
+        deadline = None
+        received_count = 0
+        async for page in messages.by_page():
+            async for message in page:
+                if deadline is None:
+                    deadline = loop.time() + app_settings.evaluation.queue_batch_timeout_ms / 1000
+                received_count += 1
+                task = asyncio.create_task(self._process_received_message(message, message_handler))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            if received_count >= max_messages or (deadline is not None and loop.time() >= deadline):
+                break
+        return received_count
+    
+    async def _process_received_message(self, message: Any, message_handler: Callable[[QueueMessage], Any]) -> None:
+        """
+        Parse, process and acknowledge a single received queue message.
+        
+        Args:
+            message: Raw message received from the queue
+            message_handler: Function to handle the parsed message
+        """
+        queue_message = None
+        try:
+            # Parse message content and log complete message to telemetry
+            from ..utils.logging_helper import log_structured
+            
+            # Log complete raw message for telemetry and debugging
+            log_structured(
+                logger,
+                logging.INFO,
+                f"Received queue message from Azure Storage",
+                raw_message_content=message.content,
+                message_content_type=type(message.content).__name__,
+                message_content_length=len(str(message.content)),
+                message_id=getattr(message, 'id', 'unknown'),
+                message_pop_receipt=getattr(message, 'pop_receipt', 'unknown'),
+                message_dequeue_count=getattr(message, 'dequeue_count', 0),
+                message_insertion_time=str(getattr(message, 'insertion_time', 'unknown')),
+                message_expiration_time=str(getattr(message, 'expiration_time', 'unknown')),
+                queue_name=self.queue_name
+            )
+            
+            # Try to handle potential double-JSON encoding issues and other corruptions
+            message_content = message.content
+            recovery_attempted = False
+            
+            if isinstance(message_content, str):
+                # Method 1: Check if the content looks like double-encoded JSON
+                if message_content.startswith('"') and message_content.endswith('"'):
+                    try:
+                        # Attempt to decode once more in case of double-encoding
+                        message_content = json.loads(message_content)
+                        logger.warning(f"[WARNING]  Detected and fixed double-encoded JSON message for dequeue_count: {getattr(message, 'dequeue_count', 0)}")
+                        recovery_attempted = True
+                    except json.JSONDecodeError:
+                        # If that fails, use original content
+                        pass
                 
-                # Count messages received
-                message_count = 0
-                async for message in messages:
-                    message_count += 1
-                    queue_message = None
+                # Method 2: Check if content appears to be base64 encoded
+                elif len(message_content) > 50 and message_content.replace('+', '').replace('/', '').replace('=', '').isalnum():
                     try:
-                        # Parse message content and log complete message to telemetry
-                        from ..utils.logging_helper import log_structured
-                        
-                        # Log complete raw message for telemetry and debugging
-                        log_structured(
-                            logger,
-                            logging.INFO,
-                            f"Received queue message from Azure Storage",
-                            raw_message_content=message.content,
-                            message_content_type=type(message.content).__name__,
-                            message_content_length=len(str(message.content)),
-                            message_id=getattr(message, 'id', 'unknown'),
-                            message_pop_receipt=getattr(message, 'pop_receipt', 'unknown'),
-                            message_dequeue_count=getattr(message, 'dequeue_count', 0),
-                            message_insertion_time=str(getattr(message, 'insertion_time', 'unknown')),
-                            message_expiration_time=str(getattr(message, 'expiration_time', 'unknown')),
-                            queue_name=self.queue_name
-                        )
-                        
-                        # Try to handle potential double-JSON encoding issues and other corruptions
-                        message_content = message.content
-                        recovery_attempted = False
-                        
-                        if isinstance(message_content, str):
-                            # Method 1: Check if the content looks like double-encoded JSON
-                            if message_content.startswith('"') and message_content.endswith('"'):
-                                try:
-                                    # Attempt to decode once more in case of double-encoding
-                                    message_content = json.loads(message_content)
-                                    logger.warning(f"[WARNING]  Detected and fixed double-encoded JSON message for dequeue_count: {getattr(message, 'dequeue_count', 0)}")
-                                    recovery_attempted = True
-                                except json.JSONDecodeError:
-                                    # If that fails, use original content
-                                    pass
-                            
-                            # Method 2: Check if content appears to be base64 encoded
-                            elif len(message_content) > 50 and message_content.replace('+', '').replace('/', '').replace('=', '').isalnum():
-                                try:
-                                    import base64
-                                    decoded = base64.b64decode(message_content).decode('utf-8')
-                                    json.loads(decoded)  # Test if it's valid JSON
-                                    message_content = decoded
-                                    logger.warning(f"[WARNING]  Detected and fixed base64-encoded message for dequeue_count: {getattr(message, 'dequeue_count', 0)}")
-                                    recovery_attempted = True
-                                except:
-                                    # If base64 decoding fails, use original content
-                                    pass
-                        
-                        queue_message = QueueMessage.from_json(message_content)
-                        
-                        # Log parsed message details
-                        log_structured(
-                            logger,
-                            logging.INFO,
-                            f"Successfully parsed queue message for evaluation",
-                            eval_run_id=queue_message.eval_run_id,
-                            metrics_configuration_id=queue_message.metrics_configuration_id,
-                            requested_at=str(queue_message.requested_at),
-                            priority=queue_message.priority
-                        )
-                        
-                        # Process message and check if all steps completed successfully
-                        processing_successful_raw = await message_handler(queue_message)
-                        
-                        # Debug logging for processing result
-                        log_structured(
-                            logger,
-                            logging.INFO,
-                            f"Message processing result received",
-                            eval_run_id=queue_message.eval_run_id,
-                            processing_successful_raw=processing_successful_raw,
-                            processing_successful_raw_type=type(processing_successful_raw).__name__,
-                            processing_result_is_none=processing_successful_raw is None,
-                            processing_result_is_bool=isinstance(processing_successful_raw, bool)
-                        )
-                        
-                        # Force conversion to boolean to handle any null/None cases
-                        if processing_successful_raw is None:
-                            logger.error(f"[ERROR] CRITICAL: Message handler returned None for {queue_message.eval_run_id}! Forcing to False.")
-                            processing_successful = False
-                        elif isinstance(processing_successful_raw, bool):
-                            processing_successful = processing_successful_raw
-                        else:
-                            logger.warning(f"[WARNING]  Message handler returned non-boolean type {type(processing_successful_raw).__name__}: {processing_successful_raw}. Converting to boolean.")
-                            processing_successful = bool(processing_successful_raw)
-                        
-                        # Final validation logging
-                        log_structured(
-                            logger,
-                            logging.INFO,
-                            f"Final message processing result after validation",
-                            eval_run_id=queue_message.eval_run_id,
-                            processing_successful=processing_successful,
-                            processing_successful_type=type(processing_successful).__name__,
-                            processing_result_is_none=processing_successful is None,
-                            processing_result_is_bool=isinstance(processing_successful, bool),
-                            conversion_occurred=processing_successful != processing_successful_raw
-                        )
-                        
-                        if processing_successful:
-                            # Log success to the success queue
-                            await self.log_success_message(queue_message, message.content, {
-                                "processing_time": datetime.utcnow().isoformat(),
-                                "message_dequeue_count": getattr(message, 'dequeue_count', 1),
-                                "processing_result": processing_successful_raw
-                            })
-                            
-                            # Delete message only after ALL steps completed successfully
-                            await self.queue_client.delete_message(message)
-                            logger.info(f"[SUCCESS] All steps completed successfully. Deleted message: {queue_message.eval_run_id}")
-                        else:
-                            # Check message dequeue count to prevent infinite retries
-                            dequeue_count = getattr(message, 'dequeue_count', 1)
-                            max_retries = getattr(app_settings.evaluation, 'max_message_retries', 3)
-                            
-                            if dequeue_count is not None and dequeue_count >= max_retries:
-                                # Maximum retries exhausted - update status to failed and log failure
-                                await self._handle_final_failure(queue_message, {
-                                    "failure_reason": "exceeded_max_retries",
-                                    "max_retries": max_retries,
-                                    "final_dequeue_count": dequeue_count,
-                                    "processing_result": processing_successful_raw,
-                                    "failure_time": datetime.utcnow().isoformat()
-                                })
-                                
-                                # Move to poison message handling - delete to prevent infinite loop
-                                logger.error(f"  Message {queue_message.eval_run_id} exceeded max retries ({max_retries}). Deleting poison message.")
-                                await self.queue_client.delete_message(message)
-                            else:
-                                # Keep message in queue for retry (will become visible again after visibility timeout)
-                                logger.warning(f"[WARNING]  Processing failed for {queue_message.eval_run_id}. Message kept in queue for retry (attempt {dequeue_count}/{max_retries}).")
-                        
-                    except KeyError as e:
-                        # Enhanced KeyError handling - analyze what fields are available vs missing
-                        from ..utils.logging_helper import log_structured
-                        
-                        # Try to parse the JSON to see what fields are available
-                        try:
-                            if isinstance(message.content, str):
-                                parsed_data = json.loads(message.content)
-                            else:
-                                parsed_data = message.content
-                            available_keys = list(parsed_data.keys()) if isinstance(parsed_data, dict) else []
-                        except:
-                            parsed_data = message.content
-                            available_keys = []
-                        
-                        log_structured(
-                            logger,
-                            logging.ERROR,
-                            f"Queue message missing required field - analyzing message structure",
-                            error_type="KeyError",
-                            missing_field=str(e),
-                            available_keys=available_keys,
-                            raw_message_content=str(message.content)[:500] if len(str(message.content)) > 500 else message.content,
-                            parsed_message_type=type(parsed_data).__name__,
-                            message_id=getattr(message, 'id', 'unknown'),
-                            message_dequeue_count=getattr(message, 'dequeue_count', 0),
-                            action_taken="message_kept_for_retry"
-                        )
-                        
-                        # Log to failure queue if we can't parse after max retries
-                        dequeue_count = getattr(message, 'dequeue_count', 1)
-                        max_retries = getattr(app_settings.evaluation, 'max_message_retries', 3)
-                        if dequeue_count >= max_retries:
-                            try:
-                                # Handle final failure with status update
-                                await self._handle_final_failure(queue_message, {
-                                    "failure_reason": "missing_required_field",
-                                    "missing_field": str(e),
-                                    "available_keys": available_keys,
-                                    "dequeue_count": dequeue_count,
-                                    "eval_run_id": "unknown"  # Add eval_run_id to failure details
-                                })
-                                    
-                                # Delete the malformed message after max retries
-                                await self.queue_client.delete_message(message)
-                                logger.warning(f"   Deleted malformed message after max retries: {getattr(message, 'id', 'unknown')}")
-                                
-                            except Exception as log_error:
-                                logger.error(f"Failed to log KeyError failure: {log_error}")
-                        else:
-                            logger.warning(f"[WARNING]  Missing required field {e} for message (attempt {dequeue_count}/{max_retries}). Will retry after visibility timeout.")
-                        
-                        # Don't delete message - invalid format might be temporary issue
-                    except json.JSONDecodeError as e:
-                        # Enhanced JSON parsing error handling
-                        dequeue_count = getattr(message, 'dequeue_count', 1)
-                        recovery_attempted = False  # Initialize recovery tracking variable
-                        
-                        # Log detailed JSON parsing error with content analysis
-                        from ..utils.logging_helper import log_structured
-                        
-                        # Try to detect common corruption patterns
-                        content_str = str(message.content)
-                        is_double_encoded = content_str.startswith('"') and content_str.endswith('"') and '\\' in content_str
-                        looks_like_base64 = len(content_str) > 50 and content_str.replace('+', '').replace('/', '').replace('=', '').isalnum()
-                        
-                        log_structured(
-                            logger,
-                            logging.ERROR,
-                            f"Queue message JSON parsing failed - analyzing content corruption",
-                            error_type="JSONDecodeError",
-                            error_message=str(e),
-                            error_line_number=getattr(e, 'lineno', 'unknown'),
-                            error_column=getattr(e, 'colno', 'unknown'),
-                            raw_message_content=message.content,
-                            raw_message_content_type=type(message.content).__name__,
-                            raw_message_content_length=len(content_str),
-                            content_starts_with_quote=content_str.startswith('"'),
-                            content_ends_with_quote=content_str.endswith('"'),
-                            content_has_backslashes=('\\' in content_str),
-                            appears_double_encoded=is_double_encoded,
-                            appears_base64_encoded=looks_like_base64,
-                            content_first_100_chars=content_str[:100] if len(content_str) > 100 else content_str,
-                            content_last_50_chars=content_str[-50:] if len(content_str) > 50 else content_str,
-                            message_id=getattr(message, 'id', 'unknown'),
-                            message_dequeue_count=dequeue_count,
-                            action_taken="message_kept_for_retry"
-                        )
-                        
-                        # Log to failure queue if we can't parse after max retries
-                        dequeue_count = getattr(message, 'dequeue_count', 1)
-                        max_retries = getattr(app_settings.evaluation, 'max_message_retries', 3)
-                        
-                        if dequeue_count >= max_retries:
-                            try:
-                                # Handle final failure with status update
-                                await self._handle_final_failure(queue_message, {
-                                    "failure_reason": "json_parsing_failed_max_retries",
-                                    "error_message": str(e),
-                                    "dequeue_count": dequeue_count,
-                                    "recovery_attempted": recovery_attempted,
-                                    "eval_run_id": "unknown"  # Add eval_run_id to failure details
-                                })
-                                    
-                                # Delete the corrupted message to prevent infinite retry loops
-                                await self.queue_client.delete_message(message)
-                                logger.warning(f"   Deleted corrupted message after max retries: {getattr(message, 'id', 'unknown')}")
-                                
-                            except Exception as log_error:
-                                logger.error(f"Failed to log JSON parsing failure: {log_error}")
-                        else:
-                            logger.warning(f"[WARNING]  JSON parsing failed for message (attempt {dequeue_count}/{max_retries}). Will retry after visibility timeout.")
-                    except Exception as e:
-                        eval_run_id = queue_message.eval_run_id if queue_message else "unknown"
-                        # Import log_structured for this scope
-                        from ..utils.logging_helper import log_structured
-                        # Log detailed unexpected error with full context
-                        log_structured(
-                            logger,
-                            logging.ERROR,
-                            f"Unexpected error processing queue message",
-                            error_type=type(e).__name__,
-                            error_message=str(e),
-                            eval_run_id=eval_run_id,
-                            raw_message_content=message.content if queue_message is None else "parsed_successfully",
-                            message_id=getattr(message, 'id', 'unknown'),
-                            message_dequeue_count=getattr(message, 'dequeue_count', 0),
-                            action_taken="message_kept_for_retry"
-                        )
-                        
-                        # Log to failure queue if we can't process after max retries
-                        dequeue_count = getattr(message, 'dequeue_count', 1)
-                        max_retries = getattr(app_settings.evaluation, 'max_message_retries', 3)
-                        if dequeue_count >= max_retries:
-                            try:
-                                # Handle final failure with status update
-                                await self._handle_final_failure(queue_message, {
-                                    "failure_reason": "processing_error",
-                                    "error_type": type(e).__name__,
-                                    "error_message": str(e),
-                                    "eval_run_id": eval_run_id,
-                                    "dequeue_count": dequeue_count
-                                })
-                            except Exception as log_error:
-                                logger.error(f"Failed to handle final processing failure: {log_error}")
-                        
-                        # Don't delete message - let it retry after visibility timeout
+                        import base64
+                        decoded = base64.b64decode(message_content).decode('utf-8')
+                        json.loads(decoded)  # Test if it's valid JSON
+                        message_content = decoded
+                        logger.warning(f"[WARNING]  Detected and fixed base64-encoded message for dequeue_count: {getattr(message, 'dequeue_count', 0)}")
+                        recovery_attempted = True
+                    except:
+                        # If base64 decoding fails, use original content
+                        pass
+            
+            queue_message = QueueMessage.from_json(message_content)
+            
+            # Log parsed message details
+            log_structured(
+                logger,
+                logging.INFO,
+                f"Successfully parsed queue message for evaluation",
+                eval_run_id=queue_message.eval_run_id,
+                metrics_configuration_id=queue_message.metrics_configuration_id,
+                requested_at=str(queue_message.requested_at),
+                priority=queue_message.priority
+            )
+            
+            # Process message and check if all steps completed successfully
+            processing_successful_raw = await message_handler(queue_message)
+            
+            # Debug logging for processing result
+            log_structured(
+                logger,
+                logging.INFO,
+                f"Message processing result received",
+                eval_run_id=queue_message.eval_run_id,
+                processing_successful_raw=processing_successful_raw,
+                processing_successful_raw_type=type(processing_successful_raw).__name__,
+                processing_result_is_none=processing_successful_raw is None,
+                processing_result_is_bool=isinstance(processing_successful_raw, bool)
+            )
+            
+            # Force conversion to boolean to handle any null/None cases
+            if processing_successful_raw is None:
+                logger.error(f"[ERROR] CRITICAL: Message handler returned None for {queue_message.eval_run_id}! Forcing to False.")
+                processing_successful = False
+            elif isinstance(processing_successful_raw, bool):
+                processing_successful = processing_successful_raw
+            else:
+                logger.warning(f"[WARNING]  Message handler returned non-boolean type {type(processing_successful_raw).__name__}: {processing_successful_raw}. Converting to boolean.")
+                processing_successful = bool(processing_successful_raw)
+            
+            # Final validation logging
+            log_structured(
+                logger,
+                logging.INFO,
+                f"Final message processing result after validation",
+                eval_run_id=queue_message.eval_run_id,
+                processing_successful=processing_successful,
+                processing_successful_type=type(processing_successful).__name__,
+                processing_result_is_none=processing_successful is None,
+                processing_result_is_bool=isinstance(processing_successful, bool),
+                conversion_occurred=processing_successful != processing_successful_raw
+            )
+            
+            if processing_successful:
+                # Log success to the success queue
+                await self.log_success_message(queue_message, message.content, {
+                    "processing_time": datetime.utcnow().isoformat(),
+                    "message_dequeue_count": getattr(message, 'dequeue_count', 1),
+                    "processing_result": processing_successful_raw
+                })
+                
+                # Delete message only after ALL steps completed successfully
+                await self.queue_client.delete_message(message)
+                logger.info(f"[SUCCESS] All steps completed successfully. Deleted message: {queue_message.eval_run_id}")
+            else:
+                # Check message dequeue count to prevent infinite retries
+                dequeue_count = getattr(message, 'dequeue_count', 1)
+                max_retries = getattr(app_settings.evaluation, 'max_message_retries', 3)
+                
+                if dequeue_count is not None and dequeue_count >= max_retries:
+                    # Maximum retries exhausted - update status to failed and log failure
+                    await self._handle_final_failure(queue_message, {
+                        "failure_reason": "exceeded_max_retries",
+                        "max_retries": max_retries,
+                        "final_dequeue_count": dequeue_count,
+                        "processing_result": processing_successful_raw,
+                        "failure_time": datetime.utcnow().isoformat()
+                    })
+                    
+                    # Move to poison message handling - delete to prevent infinite loop
+                    logger.error(f"  Message {queue_message.eval_run_id} exceeded max retries ({max_retries}). Deleting poison message.")
+                    await self.queue_client.delete_message(message)
+                else:
+                    # Keep message in queue for retry (will become visible again after visibility timeout)
+                    logger.warning(f"[WARNING]  Processing failed for {queue_message.eval_run_id}. Message kept in queue for retry (attempt {dequeue_count}/{max_retries}).")
+            
+        except KeyError as e:
+            # Enhanced KeyError handling - analyze what fields are available vs missing
+            from ..utils.logging_helper import log_structured
+            
+            # Try to parse the JSON to see what fields are available
+            try:
+                if isinstance(message.content, str):
+                    parsed_data = json.loads(message.content)
+                else:
+                    parsed_data = message.content
+                available_keys = list(parsed_data.keys()) if isinstance(parsed_data, dict) else []
+            except:
+                parsed_data = message.content
+                available_keys = []
+            
+            log_structured(
+                logger,
+                logging.ERROR,
+                f"Queue message missing required field - analyzing message structure",
+                error_type="KeyError",
+                missing_field=str(e),
+                available_keys=available_keys,
+                raw_message_content=str(message.content)[:500] if len(str(message.content)) > 500 else message.content,
+                parsed_message_type=type(parsed_data).__name__,
+                message_id=getattr(message, 'id', 'unknown'),
+                message_dequeue_count=getattr(message, 'dequeue_count', 0),
+                action_taken="message_kept_for_retry"
+            )
+            
+            # Log to failure queue if we can't parse after max retries
+            dequeue_count = getattr(message, 'dequeue_count', 1)
+            max_retries = getattr(app_settings.evaluation, 'max_message_retries', 3)
+            if dequeue_count >= max_retries:
+                try:
+                    # Handle final failure with status update
+                    await self._handle_final_failure(queue_message, {
+                        "failure_reason": "missing_required_field",
+                        "missing_field": str(e),
+                        "available_keys": available_keys,
+                        "dequeue_count": dequeue_count,
+                        "eval_run_id": "unknown"  # Add eval_run_id to failure details
+                    })
                         
-                # Log message count after processing all messages in this batch
-                logger.info(f"Received {message_count} message(s) from queue {self.queue_name}")
+                    # Delete the malformed message after max retries
+                    await self.queue_client.delete_message(message)
+                    logger.warning(f"   Deleted malformed message after max retries: {getattr(message, 'id', 'unknown')}")
+                    
+                except Exception as log_error:
+                    logger.error(f"Failed to log KeyError failure: {log_error}")
+            else:
+                logger.warning(f"[WARNING]  Missing required field {e} for message (attempt {dequeue_count}/{max_retries}). Will retry after visibility timeout.")
+            
+            # Don't delete message - invalid format might be temporary issue
+        except json.JSONDecodeError as e:
+            # Enhanced JSON parsing error handling
+            dequeue_count = getattr(message, 'dequeue_count', 1)
+            recovery_attempted = False  # Initialize recovery tracking variable
+            
+            # Log detailed JSON parsing error with content analysis
+            from ..utils.logging_helper import log_structured
+            
+            # Try to detect common corruption patterns
+            content_str = str(message.content)
+            is_double_encoded = content_str.startswith('"') and content_str.endswith('"') and '\\' in content_str
+            looks_like_base64 = len(content_str) > 50 and content_str.replace('+', '').replace('/', '').replace('=', '').isalnum()
+            
+            log_structured(
+                logger,
+                logging.ERROR,
+                f"Queue message JSON parsing failed - analyzing content corruption",
+                error_type="JSONDecodeError",
+                error_message=str(e),
+                error_line_number=getattr(e, 'lineno', 'unknown'),
+                error_column=getattr(e, 'colno', 'unknown'),
+                raw_message_content=message.content,
+                raw_message_content_type=type(message.content).__name__,
+                raw_message_content_length=len(content_str),
+                content_starts_with_quote=content_str.startswith('"'),
+                content_ends_with_quote=content_str.endswith('"'),
+                content_has_backslashes=('\\' in content_str),
+                appears_double_encoded=is_double_encoded,
+                appears_base64_encoded=looks_like_base64,
+                content_first_100_chars=content_str[:100] if len(content_str) > 100 else content_str,
+                content_last_50_chars=content_str[-50:] if len(content_str) > 50 else content_str,
+                message_id=getattr(message, 'id', 'unknown'),
+                message_dequeue_count=dequeue_count,
+                action_taken="message_kept_for_retry"
+            )
+            
+            # Log to failure queue if we can't parse after max retries
+            dequeue_count = getattr(message, 'dequeue_count', 1)
+            max_retries = getattr(app_settings.evaluation, 'max_message_retries', 3)
+            
+            if dequeue_count >= max_retries:
+                try:
+                    # Handle final failure with status update
+                    await self._handle_final_failure(queue_message, {
+                        "failure_reason": "json_parsing_failed_max_retries",
+                        "error_message": str(e),
+                        "dequeue_count": dequeue_count,
+                        "recovery_attempted": recovery_attempted,
+                        "eval_run_id": "unknown"  # Add eval_run_id to failure details
+                    })
                         
-            except Exception as e:
-                logger.error(f"Error receiving messages: {str(e)}")
-                
-            # Wait before polling again
-            await asyncio.sleep(app_settings.evaluation.queue_polling_interval_seconds)
-    
+                    # Delete the corrupted message to prevent infinite retry loops
+                    await self.queue_client.delete_message(message)
+                    logger.warning(f"   Deleted corrupted message after max retries: {getattr(message, 'id', 'unknown')}")
+                    
+                except Exception as log_error:
+                    logger.error(f"Failed to log JSON parsing failure: {log_error}")
+            else:
+                logger.warning(f"[WARNING]  JSON parsing failed for message (attempt {dequeue_count}/{max_retries}). Will retry after visibility timeout.")
+        except Exception as e:
+            eval_run_id = queue_message.eval_run_id if queue_message else "unknown"
+            # Import log_structured for this scope
+            from ..utils.logging_helper import log_structured
+            # Log detailed unexpected error with full context
+            log_structured(
+                logger,
+                logging.ERROR,
+                f"Unexpected error processing queue message",
+                error_type=type(e).__name__,
+                error_message=str(e),
+                eval_run_id=eval_run_id,
+                raw_message_content=message.content if queue_message is None else "parsed_successfully",
+                message_id=getattr(message, 'id', 'unknown'),
+                message_dequeue_count=getattr(message, 'dequeue_count', 0),
+                action_taken="message_kept_for_retry"
+            )
+            
+            # Log to failure queue if we can't process after max retries
+            dequeue_count = getattr(message, 'dequeue_count', 1)
+            max_retries = getattr(app_settings.evaluation, 'max_message_retries', 3)
+            if dequeue_count >= max_retries:
+                try:
+                    # Handle final failure with status update
+                    await self._handle_final_failure(queue_message, {
+                        "failure_reason": "processing_error",
+                        "error_type": type(e).__name__,
+                        "error_message": str(e),
+                        "eval_run_id": eval_run_id,
+                        "dequeue_count": dequeue_count
+                    })
+                except Exception as log_error:
+                    logger.error(f"Failed to handle final processing failure: {log_error}")
+            
+            # Don't delete message - let it retry after visibility timeout
+        
     async def log_success_message(self, queue_message: QueueMessage, raw_original_message: str, processing_result: Optional[Dict[str, Any]] = None) -> None:
         """
         Log successfully processed message to the success queue.
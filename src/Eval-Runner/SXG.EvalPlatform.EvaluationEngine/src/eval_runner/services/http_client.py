@@ -8,13 +8,45 @@ import logging
 import time
 from typing import Optional, Dict, Any, List
 from ..config.settings import app_settings
+from ..exceptions import ApiHttpError
 from .auth_token_provider import AuthTokenProvider
+from ..utils.json_helper import dumps_bytes, loads as json_loads
+from ..utils.logging_helper import lazy_traceback
 
 logger = logging.getLogger(__name__)
 
+# Characters of the raw response body kept for log previews
+_RAW_PREVIEW_CHARS = 500
+
+
+class ApiJsonObject(dict):
+    """Parsed JSON object that remembers the size and a preview of the raw response body."""
+    __slots__ = ('raw_size', 'raw_preview')
+
+
+class ApiJsonArray(list):
+    """Parsed JSON array that remembers the size and a preview of the raw response body."""
+    __slots__ = ('raw_size', 'raw_preview')
+
+
+def _attach_raw_metadata(data: Any, response_text: str) -> Any:
+    """
+    Wrap a parsed top-level JSON container so callers can log the response size and a
+    preview without stringifying the parsed structure again.
+    """
+    if isinstance(data, dict):
+        data = ApiJsonObject(data)
+    elif isinstance(data, list):
+        data = ApiJsonArray(data)
+    else:
+        return data
+    data.raw_size = len(response_text)
+    data.raw_preview = response_text[:_RAW_PREVIEW_CHARS]
+    return data
+
 
 class EvaluationApiClient:
-    """Simple client for calling existing evaluation platform APIs with per-request sessions."""
+    """Simple client for calling existing evaluation platform APIs over a pooled keep-alive session."""
     
     def __init__(self):
         """Initialize the API client using app settings."""
@@ -27,6 +59,11 @@ class EvaluationApiClient:
             sock_read=60.0  # 60 second read timeout
         )
         
+        # Shared session reused across requests so calls skip the TCP/TLS handshake.
+        # It is bound to the event loop that created it (see _get_shared_session).
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        
         # Authentication configuration and provider
         auth_config = app_settings.api_authentication
         self._authentication_enabled = auth_config.enable_authentication
@@ -67,11 +104,37 @@ class EvaluationApiClient:
             logger.error(f"Auth error type: {type(e).__name__}")
             raise
     
+    def _get_shared_session(self) -> Optional[aiohttp.ClientSession]:
+        """
+        Get the pooled session for the running event loop, creating it on first use.
+        
+        Returns:
+            The shared session, or None when called from a different event loop than the one
+            that owns it (e.g. diagnostics run in a helper thread), in which case the caller
+            should use a per-request session.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed:
+            return self._session if self._session_loop is loop else None
+        
+        connector = aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=32,
+            ttl_dns_cache=300,
+            use_dns_cache=True,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True
+        )
+        self._session = aiohttp.ClientSession(timeout=self.timeout, connector=connector)
+        self._session_loop = loop
+        logger.debug("Created pooled HTTP session for API calls")
+        return self._session
+    
     async def _make_request(self, method: str, url: str, **kwargs) -> tuple:
-        """Make HTTP request with a fresh session and connector for each request.
+        """Make HTTP request over the pooled keep-alive session.
         
-        This approach creates completely fresh HTTP infrastructure per request
-        to avoid any session timeout/closure issues that can occur with connection reuse.
+        Requests made from an event loop other than the one owning the pooled session
+        fall back to a fresh session and connector for that request.
         
         Args:
             method: HTTP method (get, post, put, etc.)
@@ -85,7 +148,17 @@ class EvaluationApiClient:
             aiohttp.ClientError: On HTTP errors
             asyncio.TimeoutError: On timeout
         """
-        # Create completely fresh connector and session for each request
+        session = self._get_shared_session()
+        if session is not None:
+            try:
+                async with getattr(session, method)(url, **kwargs) as response:
+                    response_text = await response.text()
+                    return response_text, response.status, dict(response.headers)
+            except Exception as e:
+                logger.debug(f"HTTP request failed: {method.upper()} {url} - {type(e).__name__}: {str(e)}")
+                raise
+        
+        # Create a fresh connector and session for requests from other event loops
         connector = aiohttp.TCPConnector(
             limit=10,  # Smaller pool for per-request usage
             limit_per_host=5,
@@ -115,7 +188,16 @@ class EvaluationApiClient:
             except Exception as e:
                 logger.warning(f"Error closing authentication provider: {e}")
         
-        # No need to manage connector since we create fresh ones per request
+        # Close the pooled session (and its connector) if it belongs to this event loop
+        if self._session is not None and not self._session.closed:
+            if self._session_loop is asyncio.get_running_loop():
+                try:
+                    await self._session.close()
+                    logger.debug("Closed pooled HTTP session")
+                except Exception as e:
+                    logger.warning(f"Error closing pooled HTTP session: {e}")
+            self._session = None
+            self._session_loop = None
         
     async def fetch_enriched_dataset(self, eval_run_id: str) -> Dict[str, Any]:
         """
@@ -137,7 +219,7 @@ class EvaluationApiClient:
         url = f"{self.base_url}{endpoint}"
         
         # Start telemetry timing
-        start_time = time.time()
+        start_time = time.monotonic()
         
         # Enhanced telemetry - log request details
         logger.info(f"[API_REQUEST] Starting API call: fetch_enriched_dataset")
@@ -166,7 +248,7 @@ class EvaluationApiClient:
         try:
             # Make request with lock held for entire HTTP operation
             response_text, status, response_headers = await self._make_request('get', url, headers=headers)
-            response_time = time.time() - start_time
+            response_time = time.monotonic() - start_time
             
             # Enhanced telemetry - log response details
             logger.info(f"[API_RESPONSE_STATUS] {status}")
@@ -182,12 +264,11 @@ class EvaluationApiClient:
                 logger.error(f"[API_ERROR_STATUS] {status}")
                 logger.error(f"[API_ERROR_RESPONSE] {response_text}")
                 logger.error(f"[API_ERROR_HEADERS] {response_headers}")
-                raise ValueError(f"{error_msg}: {response_text}")
+                raise ApiHttpError(f"{error_msg}: {response_text}", status, response_text)
             
             # Parse JSON response
-            import json
             try:
-                data = json.loads(response_text)
+                data = json_loads(response_text)
             except Exception as parse_error:
                 logger.error(f"[API_ERROR] JSON parsing failed: {str(parse_error)}")
                 logger.error(f"[API_ERROR_URL] {url}")
@@ -224,10 +305,10 @@ class EvaluationApiClient:
             logger.info(f"[API_SUCCESS_RESPONSE_KEYS] {list(data.keys())}")
             logger.info(f"[API_SUCCESS_DURATION] {response_time:.3f}s")
             
-            return data
+            return _attach_raw_metadata(data, response_text)
                     
         except asyncio.TimeoutError:
-            response_time = time.time() - start_time
+            response_time = time.monotonic() - start_time
             logger.error(f"[API_TIMEOUT] Request timed out after {response_time:.3f}s")
             logger.error(f"[API_TIMEOUT_URL] {url}")
             logger.error(f"[API_TIMEOUT_DURATION] {response_time:.3f}s")
@@ -237,14 +318,13 @@ class EvaluationApiClient:
             # Re-raise ValueError (validation errors)
             raise
         except Exception as e:
-            response_time = time.time() - start_time
+            response_time = time.monotonic() - start_time
             logger.error(f"[API_EXCEPTION] Unexpected error: {str(e)}")
             logger.error(f"[API_EXCEPTION_URL] {url}")
             logger.error(f"[API_EXCEPTION_TYPE] {type(e).__name__}")
             logger.error(f"[API_EXCEPTION_DURATION] {response_time:.3f}s")
             logger.error(f"[API_EXCEPTION_PARAMETER] eval_run_id={eval_run_id}")
-            import traceback
-            logger.error(f"[API_EXCEPTION_TRACE] {traceback.format_exc()}")
+            logger.error("[API_EXCEPTION_TRACE] %s", lazy_traceback(e))
             raise
     
     async def fetch_metrics_configuration(self, metrics_configuration_id: str) -> Any:
@@ -267,7 +347,7 @@ class EvaluationApiClient:
         url = f"{self.base_url}{endpoint}"
         
         # Start telemetry timing
-        start_time = time.time()
+        start_time = time.monotonic()
         
         # Enhanced telemetry - log request details
         logger.info(f"[API_REQUEST] Starting API call: fetch_metrics_configuration")
@@ -296,7 +376,7 @@ class EvaluationApiClient:
         try:
             # Make request with lock held for entire HTTP operation
             response_text, status, response_headers = await self._make_request('get', url, headers=headers)
-            response_time = time.time() - start_time
+            response_time = time.monotonic() - start_time
             
             # Enhanced telemetry - log response details
             logger.info(f"[API_RESPONSE_STATUS] {status}")
@@ -312,12 +392,11 @@ class EvaluationApiClient:
                 logger.error(f"[API_ERROR_STATUS] {status}")
                 logger.error(f"[API_ERROR_RESPONSE] {response_text}")
                 logger.error(f"[API_ERROR_HEADERS] {response_headers}")
-                raise ValueError(f"{error_msg}: {response_text}")
+                raise ApiHttpError(f"{error_msg}: {response_text}", status, response_text)
             
             # Parse JSON response
-            import json
             try:
-                data = json.loads(response_text)
+                data = json_loads(response_text)
             except Exception as parse_error:
                 logger.error(f"[API_ERROR] JSON parsing failed: {str(parse_error)}")
                 logger.error(f"[API_ERROR_URL] {url}")
@@ -369,10 +448,10 @@ class EvaluationApiClient:
                 logger.info(f"[API_SUCCESS_RESPONSE_KEYS] {list(data.keys())}")
             
             logger.info(f"[API_SUCCESS_DURATION] {response_time:.3f}s")
-            return data
+            return _attach_raw_metadata(data, response_text)
                         
         except asyncio.TimeoutError as timeout_error:
-            response_time = time.time() - start_time
+            response_time = time.monotonic() - start_time
             logger.error(f"[API_TIMEOUT] Request timed out after {response_time:.3f}s")
             logger.error(f"[API_TIMEOUT_URL] {url}")
             logger.error(f"[API_TIMEOUT_DURATION] {response_time:.3f}s")
@@ -382,14 +461,13 @@ class EvaluationApiClient:
             # Re-raise ValueError (validation errors)
             raise
         except Exception as e:
-            response_time = time.time() - start_time
+            response_time = time.monotonic() - start_time
             logger.error(f"[API_EXCEPTION] Unexpected error: {str(e)}")
             logger.error(f"[API_EXCEPTION_URL] {url}")
             logger.error(f"[API_EXCEPTION_TYPE] {type(e).__name__}")
             logger.error(f"[API_EXCEPTION_DURATION] {response_time:.3f}s")
             logger.error(f"[API_EXCEPTION_PARAMETER] metrics_configuration_id={metrics_configuration_id}")
-            import traceback
-            logger.error(f"[API_EXCEPTION_TRACE] {traceback.format_exc()}")
+            logger.error("[API_EXCEPTION_TRACE] %s", lazy_traceback(e))
             raise
     
     async def update_evaluation_status(self, eval_run_id: str, status: str) -> bool:
@@ -407,7 +485,7 @@ class EvaluationApiClient:
         url = f"{self.base_url}{endpoint}"
 
         payload = {"status": status}        # Start telemetry timing
-        start_time = time.time()
+        start_time = time.monotonic()
         
         logger.info(f"[WEB] Starting API call: update_evaluation_status")
         logger.info(f"[LOCATION] Endpoint: {endpoint}")
@@ -434,7 +512,7 @@ class EvaluationApiClient:
             
             # Make request with lock held for entire HTTP operation
             response_text, status, response_headers = await self._make_request('put', url, headers=headers, json=payload)
-            response_time = time.time() - start_time
+            response_time = time.monotonic() - start_time
             
             # Log response details
             logger.info(f"[INBOX] Response status: {status}")
@@ -467,14 +545,14 @@ class EvaluationApiClient:
                 return False
                         
         except asyncio.TimeoutError:
-            response_time = time.time() - start_time
+            response_time = time.monotonic() - start_time
             logger.error(f"[TIMEOUT] Timeout updating status - took {response_time:.3f}s")
             logger.error(f"[LINK] Timeout URL: {url}")
             logger.error(f"[CLIPBOARD] Eval Run ID: {eval_run_id}")
             logger.error(f"  Target Status: {status}")
             return False
         except Exception as e:
-            response_time = time.time() - start_time
+            response_time = time.monotonic() - start_time
             logger.error(f"[CRASH] Unexpected error updating status: {str(e)}")
             logger.error(f"[LINK] Error URL: {url}")
             logger.error(f"[CLIPBOARD] Eval Run ID: {eval_run_id}")
@@ -498,7 +576,7 @@ class EvaluationApiClient:
         url = f"{self.base_url}{endpoint}"
         
         # Start telemetry timing
-        start_time = time.time()
+        start_time = time.monotonic()
         
         logger.info(f"[WEB] Starting API call: post_evaluation_results")
         logger.info(f"[LOCATION] Endpoint: {endpoint}")
@@ -529,20 +607,17 @@ class EvaluationApiClient:
                 else:
                     logger.info(f"  {key}: {type(value).__name__} = {value}")
         
-        # CAPTURE EXACT REQUEST BODY FOR SWAGGER TESTING
-        import json
+        # Serialize the payload once; the same bytes are logged for swagger testing and sent as the body
         try:
-            exact_json_payload = json.dumps(results_data, indent=2)
-            logger.info(f"[MAGNIFY] EXACT REQUEST BODY FOR SWAGGER TESTING:")
-            logger.info(f"{'='*80}")
-            logger.info(exact_json_payload)
-            logger.info(f"{'='*80}")
-                
+            request_body = dumps_bytes(results_data)
         except Exception as json_error:
             logger.error(f"[ERROR] Could not serialize payload to JSON: {json_error}")
-            logger.debug(f"[OUTBOX] Raw payload: {results_data}")
+            return False
         
-        logger.debug(f"[OUTBOX] Request payload sample (first 500 chars): {str(results_data)[:500]}...")
+        logger.info(f"[OUTBOX] Request body size: {len(request_body)} bytes")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[MAGNIFY] EXACT REQUEST BODY FOR SWAGGER TESTING:")
+            logger.debug(request_body.decode('utf-8'))
         
         try:
             headers = {
@@ -561,8 +636,8 @@ class EvaluationApiClient:
             logger.debug(f"[OUTBOX] Request headers: {list(headers.keys())}")  # Log header keys only (don't log token)
             
             # Make request with lock held for entire HTTP operation
-            response_text, status, response_headers = await self._make_request('post', url, headers=headers, json=results_data)
-            response_time = time.time() - start_time
+            response_text, status, response_headers = await self._make_request('post', url, headers=headers, data=request_body)
+            response_time = time.monotonic() - start_time
             
             # Log response details
             logger.info(f"[INBOX] Response status: {status}")
@@ -598,13 +673,13 @@ class EvaluationApiClient:
                 return False
                         
         except asyncio.TimeoutError:
-            response_time = time.time() - start_time
+            response_time = time.monotonic() - start_time
             logger.error(f"[TIMEOUT] Timeout posting evaluation results - took {response_time:.3f}s")
             logger.error(f"[LINK] Timeout URL: {url}")
             logger.error(f"[CLIPBOARD] Eval Run ID: {eval_run_id}")
             return False
         except Exception as e:
-            response_time = time.time() - start_time
+            response_time = time.monotonic() - start_time
             logger.error(f"[CRASH] Unexpected error posting evaluation results: {str(e)}")
             logger.error(f"[LINK] Error URL: {url}")
             logger.error(f"[CLIPBOARD] Eval Run ID: {eval_run_id}")
@@ -622,7 +697,7 @@ class EvaluationApiClient:
         health_url = f"{self.base_url}/health"
         
         # Start telemetry timing
-        start_time = time.time()
+        start_time = time.monotonic()
         
         logger.info(f"[WEB] Starting API health check")
         logger.info(f"[LINK] Health check URL: {health_url}")
@@ -632,7 +707,7 @@ class EvaluationApiClient:
             timeout = aiohttp.ClientTimeout(total=10)
             async with aiohttp.ClientSession(timeout=timeout) as session:
                 async with session.get(health_url) as response:
-                    response_time = time.time() - start_time
+                    response_time = time.monotonic() - start_time
                     
                     logger.info(f"[INBOX] Health check response status: {response.status}")
                     logger.info(f"[TIMER] Health check response time: {response_time:.3f}s")
@@ -649,12 +724,12 @@ class EvaluationApiClient:
                     return is_healthy
                     
         except asyncio.TimeoutError:
-            response_time = time.time() - start_time
+            response_time = time.monotonic() - start_time
             logger.error(f"[TIMEOUT] API health check timeout after {response_time:.3f}s")
             logger.error(f"[LINK] Timeout URL: {health_url}")
             return False
         except Exception as e:
-            response_time = time.time() - start_time
+            response_time = time.monotonic() - start_time
             logger.error(f"[CRASH] API health check failed: {str(e)}")
             logger.error(f"[LINK] Error URL: {health_url}")
             logger.error(f"[TIMER] Failed after: {response_time:.3f}s")
@@ -0,0 +1,58 @@
+"""
+JSON serialization and parsing helpers for API payloads, using orjson when it is installed.
+"""
+
+import json
+from datetime import date, datetime
+from typing import Any, Union
+
+# Use orjson if available - it serializes large payloads several times faster than stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize dates as ISO 8601 strings; any other unsupported type is an error, not a silent str()."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_bytes(data: Any) -> bytes:
+    """
+    Serialize data to compact UTF-8 JSON bytes.
+
+    Args:
+        data: JSON-compatible data; datetime and date values are written as ISO 8601 strings
+
+    Returns:
+        Encoded JSON document
+
+    Raises:
+        TypeError: If data contains a value that can't be serialized (orjson's error type subclasses it)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=_json_default, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document.
+    
+    Args:
+        data: JSON text or UTF-8 encoded bytes
+        
+    Returns:
+        Parsed JSON value
+        
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON (orjson's error type subclasses it)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -4,8 +4,10 @@ Logging helper utilities for the evaluation runner with OpenTelemetry support.
 
 import logging
 import time
+import traceback
 import uuid
-from typing import Dict, Any, Optional
+from contextvars import ContextVar
+from typing import Dict, Any, List, Optional, Callable
 from contextlib import contextmanager
 
 # Import OpenTelemetry modules if available
@@ -50,10 +52,49 @@ except ImportError:
     StatusCode = MockStatusCode
     OPENTELEMETRY_AVAILABLE = False
 
-# Eval run context tracking
-_current_eval_run_id: Optional[str] = None
-_current_step_name: Optional[str] = None
-_current_operation_id: Optional[str] = None
+# Eval run context tracking (context variables so concurrent evaluations keep separate context)
+_current_eval_run_id: ContextVar[Optional[str]] = ContextVar('eval_run_id', default=None)
+_current_step_name: ContextVar[Optional[str]] = ContextVar('eval_step_name', default=None)
+_current_operation_id: ContextVar[Optional[str]] = ContextVar('eval_operation_id', default=None)
+# Step timings of the current eval run, emitted as one record by flush_workflow_timeline
+_workflow_timeline: ContextVar[Optional[List[Dict[str, Any]]]] = ContextVar('eval_workflow_timeline', default=None)
+
+class LazyValue:
+    """
+    Defers computing an expensive log property until the record is actually emitted.
+    
+    Usage: log_eval_run(logger, logging.INFO, "...", responseSize=LazyValue(lambda: len(str(data))))
+    """
+    __slots__ = ('_factory',)
+    
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+    
+    def __call__(self) -> Any:
+        return self._factory()
+    
+    def __str__(self) -> str:
+        return str(self._factory())
+
+
+def lazy_traceback(error: BaseException) -> LazyValue:
+    """
+    LazyValue for the formatted traceback of an exception. The traceback is formatted at most
+    once per exception, so every record that logs the same failure reuses the text.
+    """
+    def format_once() -> str:
+        formatted = getattr(error, '_formatted_traceback', None)
+        if formatted is None:
+            formatted = ''.join(traceback.format_exception(error))
+            try:
+                error._formatted_traceback = formatted
+            except AttributeError:
+                # Some exception types don't accept new attributes
+                pass
+        return formatted
+    
+    return LazyValue(format_once)
+
 
 def log_structured(logger: logging.Logger, level: int, message: str, **kwargs):
     """
@@ -63,15 +104,27 @@ def log_structured(logger: logging.Logger, level: int, message: str, **kwargs):
         logger: Logger instance
         level: Logging level (logging.INFO, logging.ERROR, etc.)
         message: Primary log message
-        **kwargs: Additional structured properties
+        **kwargs: Additional structured properties; LazyValue properties are only
+            computed when the level is enabled
     """
+    # Skip building properties for records the logger would discard
+    if not logger.isEnabledFor(level):
+        return
+    
+    for key, value in kwargs.items():
+        if isinstance(value, LazyValue):
+            kwargs[key] = value()
+    
     # Automatically add eval run context if available
-    if _current_eval_run_id:
-        kwargs.setdefault('evalRunId', _current_eval_run_id)
-    if _current_step_name:
-        kwargs.setdefault('stepName', _current_step_name)
-    if _current_operation_id:
-        kwargs.setdefault('operationId', _current_operation_id)
+    eval_run_id = _current_eval_run_id.get()
+    if eval_run_id:
+        kwargs.setdefault('evalRunId', eval_run_id)
+    step_name = _current_step_name.get()
+    if step_name:
+        kwargs.setdefault('stepName', step_name)
+    operation_id = _current_operation_id.get()
+    if operation_id:
+        kwargs.setdefault('operationId', operation_id)
     
     # Add OpenTelemetry trace context if available
     if OPENTELEMETRY_AVAILABLE:
@@ -92,58 +145,92 @@ def log_structured(logger: logging.Logger, level: int, message: str, **kwargs):
 
 # Eval run context management functions
 def set_eval_run_context(eval_run_id: str) -> None:
-    """Set the global eval run context for all subsequent logs."""
-    global _current_eval_run_id
-    _current_eval_run_id = eval_run_id
+    """Set the eval run context for all subsequent logs in the current task."""
+    _current_eval_run_id.set(eval_run_id)
 
 
 def clear_eval_run_context() -> None:
-    """Clear the global eval run context."""
-    global _current_eval_run_id, _current_step_name, _current_operation_id
-    _current_eval_run_id = None
-    _current_step_name = None
-    _current_operation_id = None
+    """Clear the eval run context of the current task."""
+    _current_eval_run_id.set(None)
+    _current_step_name.set(None)
+    _current_operation_id.set(None)
 
 
 def get_eval_run_context() -> Optional[str]:
     """Get the current eval run ID."""
-    return _current_eval_run_id
+    return _current_eval_run_id.get()
+
+
+def start_workflow_timeline() -> None:
+    """Start collecting workflow step timings for the eval run in the current task."""
+    _workflow_timeline.set([])
+
+
+def flush_workflow_timeline(logger: logging.Logger, **properties) -> None:
+    """
+    Emit all workflow steps recorded since start_workflow_timeline as a single record.
+    
+    Args:
+        logger: Logger instance
+        **properties: Additional structured properties (e.g. evalRunId when the context was cleared)
+    """
+    steps = _workflow_timeline.get()
+    if steps is None:
+        return
+    _workflow_timeline.set(None)
+    
+    failed_step = next((step['stepName'] for step in steps if step['stepStatus'] == 'failure'), None)
+    log_structured(
+        logger,
+        logging.ERROR if failed_step else logging.INFO,
+        f"{'❌' if failed_step else '✅'} [EVAL_WORKFLOW] - {len(steps)} step(s) {'failed at ' + failed_step if failed_step else 'completed'}",
+        workflowSteps=steps,
+        workflowDurationMs=round(sum(step['durationMs'] for step in steps), 3),
+        failedStep=failed_step,
+        **properties
+    )
 
 
 @contextmanager
 def eval_workflow_step(step_name: str, step_position: Optional[str] = None, operation_id: Optional[str] = None):
     """
     Context manager for tracking evaluation workflow steps.
-    Logs only once at the end with final status.
+    Inside a workflow timeline the step is only recorded and reported by flush_workflow_timeline
+    (per-step records are still logged at DEBUG); otherwise it logs once at the end with final status.
     
     Args:
         step_name: Name of the workflow step
         step_position: Position in workflow (e.g., "1/7")
         operation_id: Unique operation identifier
     """
-    global _current_step_name, _current_operation_id
-    
     # Generate operation ID if not provided
     if not operation_id:
         timestamp = time.strftime("%Y%m%d_%H%M%S")
         operation_id = f"op_{step_name}_{timestamp}_{uuid.uuid4().hex[:8]}"
     
-    # Store previous context
-    prev_step = _current_step_name
-    prev_op_id = _current_operation_id
-    
-    # Set new context
-    _current_step_name = step_name
-    _current_operation_id = operation_id
+    # Set new context, keeping tokens to restore the previous one
+    step_token = _current_step_name.set(step_name)
+    op_id_token = _current_operation_id.set(operation_id)
     
     logger = logging.getLogger(__name__)
+    timeline = _workflow_timeline.get()
     step_status = "Completed"
+    start = time.perf_counter()
     
     try:
         yield operation_id
         
     except Exception as e:
         step_status = "Failed"
+        if timeline is not None:
+            timeline.append({
+                'stepName': step_name,
+                'workflowPosition': step_position,
+                'stepStatus': 'failure',
+                'durationMs': round((time.perf_counter() - start) * 1000, 3),
+                'errorType': type(e).__name__,
+                'errorMessage': str(e)
+            })
         # Log step failure with icon and desired format
         log_structured(
             logger, 
@@ -158,10 +245,17 @@ def eval_workflow_step(step_name: str, step_position: Optional[str] = None, oper
         raise
         
     else:
+        if timeline is not None:
+            timeline.append({
+                'stepName': step_name,
+                'workflowPosition': step_position,
+                'stepStatus': 'success',
+                'durationMs': round((time.perf_counter() - start) * 1000, 3)
+            })
         # Log step success with icon and desired format
         log_structured(
             logger, 
-            logging.INFO, 
+            logging.DEBUG if timeline is not None else logging.INFO, 
             f"✅ [EVAL_WORKFLOW_STEP] - {step_name}: {step_status}",
             stepStatus="success",
             workflowPosition=step_position,
@@ -170,8 +264,8 @@ def eval_workflow_step(step_name: str, step_position: Optional[str] = None, oper
         
     finally:
         # Restore previous context
-        _current_step_name = prev_step
-        _current_operation_id = prev_op_id
+        _current_step_name.reset(step_token)
+        _current_operation_id.reset(op_id_token)
 
 
 def log_eval_run(logger: logging.Logger, level: int, message: str, **kwargs):
@@ -179,6 +273,9 @@ def log_eval_run(logger: logging.Logger, level: int, message: str, **kwargs):
     Convenience function for logging with [EVAL_RUN] prefix.
     Automatically includes evalRunId in custom dimensions.
     """
+    if not logger.isEnabledFor(level):
+        return
+    
     if not message.startswith("[EVAL_RUN]"):
         message = f"[EVAL_RUN] {message}"
     
@@ -186,6 +283,9 @@ def log_eval_run(logger: logging.Logger, level: int, message: str, **kwargs):
 
 def log_operation_start(logger: logging.Logger, operation_name: str, **properties):
     """Log the start of an operation with tracking properties."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     log_structured(
         logger, 
         logging.INFO, 
@@ -197,6 +297,9 @@ def log_operation_start(logger: logging.Logger, operation_name: str, **propertie
 
 def log_operation_success(logger: logging.Logger, operation_name: str, duration_ms: Optional[float] = None, **properties):
     """Log the successful completion of an operation."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     props = {
         'operation_name': operation_name,
         'operation_status': 'completed',
@@ -215,14 +318,18 @@ def log_operation_success(logger: logging.Logger, operation_name: str, duration_
 
 def log_operation_error(logger: logging.Logger, operation_name: str, error: Exception, **properties):
     """Log an operation error with structured error details."""
+    if not logger.isEnabledFor(logging.ERROR):
+        return
+    
+    error_message = str(error)
     log_structured(
         logger, 
         logging.ERROR, 
-        f"Operation failed: {operation_name} - {str(error)}",
+        f"Operation failed: {operation_name} - {error_message}",
         operation_name=operation_name,
         operation_status="failed",
         error_type=type(error).__name__,
-        error_message=str(error),
+        error_message=error_message,
         **properties
     )
 
@@ -349,6 +456,8 @@ def performance_timer(logger: logging.Logger, operation_name: str, **context):
         **context: Additional context to include in performance logs
     """
     start_time = time.time()
+    # Durations use the monotonic clock so wall-clock adjustments can't skew them
+    start_monotonic = time.monotonic()
     
     # Log operation start
     log_structured(
@@ -363,8 +472,8 @@ def performance_timer(logger: logging.Logger, operation_name: str, **context):
     try:
         yield start_time
     finally:
-        end_time = time.time()
-        duration_ms = (end_time - start_time) * 1000
+        duration_seconds = time.monotonic() - start_monotonic
+        duration_ms = duration_seconds * 1000
         
         # Determine log level based on duration
         if duration_ms > 10000:  # > 10 seconds
@@ -385,7 +494,7 @@ def performance_timer(logger: logging.Logger, operation_name: str, **context):
             operation=operation_name,
             measurement_type="performance_complete",
             duration_ms=duration_ms,
-            duration_seconds=end_time - start_time,
+            duration_seconds=duration_seconds,
             performance_category=performance_category,
             **context
         )
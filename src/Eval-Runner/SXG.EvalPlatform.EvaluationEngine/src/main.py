@@ -17,6 +17,7 @@ from eval_runner.config.settings import app_settings
 from eval_runner.core.evaluation_engine import evaluation_engine
 from eval_runner.core.diagnostics import get_diagnostics_service, HealthStatus
 from eval_runner.services.azure_storage import get_queue_service
+from eval_runner.services.http_client import get_api_client
 from eval_runner.models.eval_models import QueueMessage
 
 logger = logging.getLogger(__name__)
@@ -116,7 +117,10 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
                     logger.error(f"[DIAGNOSTICS_THREAD] Error in diagnostics sync wrapper: {e}")
                     raise
             
-            diagnostics_result = run_diagnostics_sync()
+            # Serve the background snapshot when available; run checks only before the first one exists
+            diagnostics_result = self.app_instance.diagnostics_service.get_latest()
+            if diagnostics_result is None:
+                diagnostics_result = run_diagnostics_sync()
             
             import time
             # Convert diagnostics result to JSON-serializable format
@@ -188,7 +192,8 @@ class EvaluationApp:
         """Initialize the application."""
         self.queue_service = get_queue_service()
         self.evaluation_engine = evaluation_engine
-        self.diagnostics_service = get_diagnostics_service()  # Keep for /diagnostics endpoint only
+        # Share the application's API client; it is closed in stop() with the other services
+        self.diagnostics_service = get_diagnostics_service(http_client=get_api_client())
         self.running = False
         self._shutdown_event = asyncio.Event()
         self.health_server = None
@@ -237,6 +242,9 @@ class EvaluationApp:
             logger.warning("[STARTUP_DIAGNOSTICS] Monitor application behavior closely for issues")
             # Continue startup instead of crashing - telemetry preservation is critical
         
+        # Keep a fresh diagnostics snapshot for the /diagnostics endpoint
+        await self.diagnostics_service.start()
+        
         # Initialize services (now that we know dependencies are healthy)
         logger.info("Initializing application services...")
         await self.queue_service.initialize()
@@ -271,13 +279,14 @@ class EvaluationApp:
         
         try:
             # Log operation start with structured data
-            log_operation_start(
-                logger, 
-                "process_evaluation_message",
-                eval_run_id=message.eval_run_id,
-                metrics_configuration_id=message.metrics_configuration_id,
-                priority=message.priority
-            )
+            if app_settings.logging.log_operation_start:
+                log_operation_start(
+                    logger, 
+                    "process_evaluation_message",
+                    eval_run_id=message.eval_run_id,
+                    metrics_configuration_id=message.metrics_configuration_id,
+                    priority=message.priority
+                )
             
             # Process the evaluation
             processing_successful = await self.evaluation_engine.process_queue_message(message)
@@ -374,10 +383,16 @@ class EvaluationApp:
             # Stop health server
             self._stop_health_server()
             
+            # Stop background diagnostics updates
+            await self.diagnostics_service.stop()
+            
             # Close HTTP client connections
             from eval_runner.services.http_client import api_client
             await api_client.close()
             
+            # Shut down the metric evaluation threads
+            self.evaluation_engine.close()
+            
             # Cleanup handled by individual services
             await self.queue_service.close()
             logger.info("Application stopped successfully.")
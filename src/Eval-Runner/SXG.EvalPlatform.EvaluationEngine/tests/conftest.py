@@ -0,0 +1,11 @@
+"""
+Shared pytest configuration for the evaluation engine tests.
+"""
+
+import sys
+from pathlib import Path
+
+# Make the eval_runner package importable without installing it
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
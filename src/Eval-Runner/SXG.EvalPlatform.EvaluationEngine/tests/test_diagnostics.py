@@ -0,0 +1,106 @@
+"""
+Tests for the diagnostics service's token sharing and configuration checks.
+"""
+
+import asyncio
+import logging
+
+from eval_runner.config.settings import app_settings
+from eval_runner.core.diagnostics import (
+    DiagnosticResult, DiagnosticSummary, DiagnosticsService, HealthStatus, _RunToken
+)
+
+
+class FakeAuthProvider:
+    """Auth provider whose token requests complete when released."""
+
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def get_token(self):
+        self.calls += 1
+        await self.release.wait()
+        return "token-" + "x" * 60
+
+
+async def test_checks_of_one_run_share_one_acquisition():
+    auth_provider = FakeAuthProvider()
+    run_token = _RunToken()
+
+    first = asyncio.ensure_future(run_token.get(auth_provider))
+    second = asyncio.ensure_future(run_token.get(auth_provider))
+    await asyncio.sleep(0)
+    auth_provider.release.set()
+
+    assert await first == await second
+    assert auth_provider.calls == 1
+    run_token.discard()
+
+
+async def test_ending_one_run_does_not_cancel_another_runs_token():
+    auth_provider = FakeAuthProvider()
+    finished_run = _RunToken()
+    running_run = _RunToken()
+
+    abandoned = asyncio.ensure_future(finished_run.get(auth_provider))
+    waiting = asyncio.ensure_future(running_run.get(auth_provider))
+    await asyncio.sleep(0)
+
+    # The first run ends while both acquisitions are still pending
+    finished_run.discard()
+    auth_provider.release.set()
+
+    assert (await waiting).startswith("token-")
+    abandoned.cancel()
+    running_run.discard()
+
+
+async def test_config_check_is_rerun_after_a_checked_setting_changes(monkeypatch):
+    monkeypatch.setattr(app_settings.azure_openai, 'endpoint', "https://example.openai.azure.com/")
+    monkeypatch.setattr(app_settings.azure_openai, 'deployment_name', "gpt-4o")
+    monkeypatch.setattr(app_settings.azure_openai, 'resource_name', "example")
+    service = DiagnosticsService(auth_provider=FakeAuthProvider(), http_client=object())
+
+    first = await service._check_azure_openai_config()
+    assert first.status == HealthStatus.HEALTHY
+    assert await service._check_azure_openai_config() is first
+
+    monkeypatch.setattr(app_settings.azure_openai, 'endpoint', "")
+    assert (await service._check_azure_openai_config()).status == HealthStatus.UNHEALTHY
+
+
+
+class CountingMessage:
+    """Check message that records how often it was formatted."""
+
+    def __init__(self, text):
+        self.text = text
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return self.text
+
+
+def test_summary_skips_healthy_lines_when_info_is_disabled(caplog):
+    service = DiagnosticsService(auth_provider=FakeAuthProvider(), http_client=object())
+    healthy_message = CountingMessage("ok")
+    summary = DiagnosticSummary(
+        overall_status=HealthStatus.UNHEALTHY,
+        checks=[
+            DiagnosticResult(service_name="Configuration", status=HealthStatus.HEALTHY, message=healthy_message),
+            DiagnosticResult(service_name="Storage", status=HealthStatus.UNHEALTHY, message="down"),
+        ],
+        total_duration_ms=3.0,
+        healthy_count=1,
+        unhealthy_count=1,
+        timestamp=0.0,
+    )
+
+    with caplog.at_level(logging.WARNING, logger="eval_runner.core.diagnostics"):
+        service._log_summary(summary)
+
+    assert healthy_message.formatted == 0
+    assert [record.levelno for record in caplog.records] == [logging.ERROR]
+    assert "Storage: down" in caplog.records[0].getMessage()
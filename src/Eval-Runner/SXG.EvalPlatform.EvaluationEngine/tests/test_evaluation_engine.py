@@ -0,0 +1,252 @@
+"""
+Tests for the evaluation engine's metrics configuration cache, fetch retries and metric scoring.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from eval_runner.config.settings import app_settings
+from eval_runner.core import evaluation_engine as evaluation_engine_module
+from eval_runner.core.evaluation_engine import EvaluationEngine
+from eval_runner.exceptions import ApiHttpError
+from eval_runner.models.eval_models import Dataset, DatasetItem, MetricConfig, MetricScore
+
+
+@pytest.fixture
+def engine():
+    engine = EvaluationEngine()
+    yield engine
+    engine.close()
+
+
+class CountingFetch:
+    """Replacement for _fetch_with_retry that counts calls and can be held open."""
+
+    def __init__(self, result="raw-config"):
+        self.result = result
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self, fetch_function, *args, **kwargs):
+        self.calls += 1
+        await self.release.wait()
+        return self.result
+
+
+class FakeMetric:
+    """Synchronous metric that records how often it was evaluated."""
+
+    def __init__(self, duration_seconds=0.0):
+        self.calls = 0
+        self.duration_seconds = duration_seconds
+        self._lock = threading.Lock()
+
+    def evaluate(self, item):
+        with self._lock:
+            self.calls += 1
+        if self.duration_seconds:
+            time.sleep(self.duration_seconds)
+        return MetricScore(metric_name="fake_metric", score=0.9, reason="ok", passed=True)
+
+
+def _dataset_with_duplicate() -> Dataset:
+    return Dataset(items=[
+        DatasetItem(prompt="What is 2+2?", ground_truth="4", actual_response="4"),
+        DatasetItem(prompt="What is 2+2?", ground_truth="4", actual_response="4"),
+        DatasetItem(prompt="What is 3+3?", ground_truth="6", actual_response="6"),
+    ])
+
+
+@pytest.fixture
+def fake_metric(engine, monkeypatch):
+    metric = FakeMetric()
+    monkeypatch.setattr(engine, '_get_available_metrics', lambda: {"fake_metric": metric})
+    return metric
+
+
+# Metrics configuration cache
+
+async def test_fresh_cached_config_skips_fetch(engine, monkeypatch):
+    fetch = CountingFetch()
+    monkeypatch.setattr(engine, '_fetch_with_retry', fetch)
+    engine._cache_metrics_config("cfg", "raw", "parsed")
+
+    assert await engine._get_metrics_config("cfg", "run-1") == ("raw", "parsed")
+    assert fetch.calls == 0
+
+
+async def test_expired_cached_config_is_fetched_again(engine, monkeypatch):
+    fetch = CountingFetch()
+    monkeypatch.setattr(engine, '_fetch_with_retry', fetch)
+    engine._cache_metrics_config("cfg", "raw", "parsed")
+    _, raw_data, parsed = engine._metrics_cfg_cache["cfg"]
+    engine._metrics_cfg_cache["cfg"] = (0.0, raw_data, parsed)
+
+    assert await engine._get_metrics_config("cfg", "run-1") == ("raw-config", None)
+    assert fetch.calls == 1
+    assert "cfg" not in engine._metrics_cfg_cache
+
+
+def test_cache_disabled_when_ttl_is_zero(engine, monkeypatch):
+    monkeypatch.setattr(app_settings.evaluation, 'metrics_config_cache_ttl_seconds', 0)
+    engine._cache_metrics_config("cfg", "raw", "parsed")
+
+    assert not engine._metrics_cfg_cache
+
+
+async def test_cache_evicts_least_recently_used_config(engine, monkeypatch):
+    monkeypatch.setattr(app_settings.evaluation, 'metrics_config_cache_size', 2)
+    monkeypatch.setattr(engine, '_fetch_with_retry', CountingFetch())
+    engine._cache_metrics_config("a", "raw-a", "parsed-a")
+    engine._cache_metrics_config("b", "raw-b", "parsed-b")
+
+    # Reading "a" makes "b" the least recently used entry
+    await engine._get_metrics_config("a", "run-1")
+    engine._cache_metrics_config("c", "raw-c", "parsed-c")
+
+    assert list(engine._metrics_cfg_cache) == ["a", "c"]
+
+
+async def test_concurrent_cache_misses_share_one_fetch(engine, monkeypatch):
+    fetch = CountingFetch()
+    fetch.release.clear()
+    monkeypatch.setattr(engine, '_fetch_with_retry', fetch)
+
+    first = asyncio.ensure_future(engine._get_metrics_config("cfg", "run-1"))
+    second = asyncio.ensure_future(engine._get_metrics_config("cfg", "run-2"))
+    await asyncio.sleep(0)
+    fetch.release.set()
+
+    assert await first == ("raw-config", None)
+    assert await second == ("raw-config", None)
+    assert fetch.calls == 1
+    assert not engine._metrics_cfg_inflight
+
+
+async def test_cancelled_waiter_does_not_cancel_shared_fetch(engine, monkeypatch):
+    fetch = CountingFetch()
+    fetch.release.clear()
+    monkeypatch.setattr(engine, '_fetch_with_retry', fetch)
+
+    cancelled = asyncio.ensure_future(engine._get_metrics_config("cfg", "run-1"))
+    waiting = asyncio.ensure_future(engine._get_metrics_config("cfg", "run-2"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    fetch.release.set()
+
+    assert await waiting == ("raw-config", None)
+    assert fetch.calls == 1
+
+
+# Fetch retries
+
+async def test_retryable_status_is_retried(engine):
+    calls = 0
+
+    async def fetch_flaky():
+        nonlocal calls
+        calls += 1
+        if calls < 3:
+            raise ApiHttpError("Service unavailable", 503)
+        return "payload"
+
+    result = await engine._fetch_with_retry(
+        fetch_flaky, operation_name="fetch_test", eval_run_id_for_logging="run-1", max_retries=3, base_delay=0
+    )
+    assert result == "payload"
+    assert calls == 3
+
+
+def test_retry_delay_caps_double_from_base_delay():
+    assert EvaluationEngine._retry_delay_caps(3, 60) == [60, 120, 240]
+
+
+async def test_non_retryable_status_fails_without_retrying(engine):
+    calls = 0
+
+    async def fetch_not_found():
+        nonlocal calls
+        calls += 1
+        raise ApiHttpError("Metrics configuration not found", 404, "not found")
+
+    with pytest.raises(ApiHttpError):
+        await engine._fetch_with_retry(
+            fetch_not_found, operation_name="fetch_test", eval_run_id_for_logging="run-1", base_delay=0
+        )
+    assert calls == 1
+
+
+# Metric scoring
+
+async def test_missing_metric_is_scored_without_evaluating(engine, fake_metric, monkeypatch):
+    monkeypatch.setattr(app_settings.evaluation, 'deduplicate_items', False)
+    metrics_config = [
+        MetricConfig(metric_name="fake_metric", category_name=None, threshold=0.5),
+        MetricConfig(metric_name="unknown_metric", category_name=None, threshold=0.5),
+    ]
+
+    results, stats = await engine._run_evaluations(_dataset_with_duplicate(), metrics_config)
+
+    assert fake_metric.calls == 3
+    assert [score.metric_name for score in results[0].metric_scores] == ["fake_metric", "unknown_metric"]
+    assert results[0].metric_scores[1].details['failure_category'] == 'metric_not_found'
+    assert stats['failed_by_name']['unknown_metric']['failure_count'] == 3
+
+
+async def test_duplicate_items_are_scored_once_when_enabled(engine, fake_metric, monkeypatch):
+    monkeypatch.setattr(app_settings.evaluation, 'deduplicate_items', True)
+    metrics_config = [MetricConfig(metric_name="fake_metric", category_name=None, threshold=0.5)]
+
+    results, stats = await engine._run_evaluations(_dataset_with_duplicate(), metrics_config)
+
+    assert fake_metric.calls == 2
+    assert len(results) == 3
+    assert results[1].metric_scores[0] is results[0].metric_scores[0]
+    assert stats['total_scores'] == 3
+    assert stats['successful_evaluations'] == 3
+
+
+async def test_duplicate_items_are_scored_independently_when_disabled(engine, fake_metric, monkeypatch):
+    monkeypatch.setattr(app_settings.evaluation, 'deduplicate_items', False)
+    metrics_config = [MetricConfig(metric_name="fake_metric", category_name=None, threshold=0.5)]
+
+    results, stats = await engine._run_evaluations(_dataset_with_duplicate(), metrics_config)
+
+    assert fake_metric.calls == 3
+    assert results[1].metric_scores[0] is not results[0].metric_scores[0]
+    assert stats['total_scores'] == 3
+
+
+async def test_metric_timeout_excludes_time_queued_for_a_thread(engine, monkeypatch):
+    monkeypatch.setattr(evaluation_engine_module, '_METRIC_TIMEOUT_SECONDS', 0.5)
+    engine._metric_executor.shutdown(wait=False)
+    engine._metric_executor = ThreadPoolExecutor(max_workers=1)
+    metric = FakeMetric(duration_seconds=0.3)
+    monkeypatch.setattr(engine, '_get_available_metrics', lambda: {"fake_metric": metric})
+    metrics_config = [MetricConfig(metric_name="fake_metric", category_name=None, threshold=0.5)] * 3
+    dataset = Dataset(items=[DatasetItem(prompt="p", ground_truth="g", actual_response="a")])
+
+    # The pairs share one thread, so the last one waits 0.6s before it starts - longer than the timeout
+    results, stats = await engine._run_evaluations(dataset, metrics_config)
+
+    assert metric.calls == 3
+    assert [score.score for score in results[0].metric_scores] == [0.9, 0.9, 0.9]
+    assert stats['failed_evaluations'] == 0
+
+
+async def test_metric_running_past_timeout_fails(engine, monkeypatch):
+    monkeypatch.setattr(evaluation_engine_module, '_METRIC_TIMEOUT_SECONDS', 0.1)
+    metric = FakeMetric(duration_seconds=0.3)
+    monkeypatch.setattr(engine, '_get_available_metrics', lambda: {"fake_metric": metric})
+    metrics_config = [MetricConfig(metric_name="fake_metric", category_name=None, threshold=0.5)]
+    dataset = Dataset(items=[DatasetItem(prompt="p", ground_truth="g", actual_response="a")])
+
+    results, stats = await engine._run_evaluations(dataset, metrics_config)
+
+    assert results[0].metric_scores[0].details['failure_category'] == 'metric_timeout_error'
+    assert stats['failed_evaluations'] == 1
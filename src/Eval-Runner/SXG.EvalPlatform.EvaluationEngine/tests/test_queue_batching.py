@@ -0,0 +1,186 @@
+"""
+Tests for how the queue listener receives and dispatches messages.
+"""
+
+import asyncio
+
+import pytest
+
+from eval_runner.config.settings import app_settings
+from eval_runner.services.azure_storage import AzureQueueService
+
+
+class FakePage:
+    """One page of received messages."""
+
+    def __init__(self, messages):
+        self._messages = messages
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for message in self._messages:
+            yield message
+
+
+class FakePagedMessages:
+    """Stand-in for the MessagesPaged returned by QueueClient.receive_messages, with the SDK's paging rules."""
+
+    def __init__(self, service, messages_per_page, max_messages):
+        self._service = service
+        self._messages_per_page = messages_per_page
+        self._max_messages = max_messages
+
+    def by_page(self):
+        return self._iterate_pages()
+
+    async def _iterate_pages(self):
+        while True:
+            # Like the SDK: one message per call unless messages_per_page is set, never beyond max_messages
+            page_size = self._messages_per_page or 1
+            if self._max_messages is not None:
+                if self._max_messages < 1:
+                    return
+                page_size = min(page_size, self._max_messages)
+            page = self._service.fetch(page_size)
+            if not page:
+                return
+            if self._max_messages is not None:
+                self._max_messages -= len(page)
+            yield FakePage(page)
+
+
+class FakeQueueClient:
+    """Queue client backed by a list of service responses, one per receive call to the service."""
+
+    def __init__(self, responses=None):
+        self._responses = [list(response) for response in responses or []]
+        self.receive_calls = []
+        self.service_calls = []
+
+    def receive_messages(self, *, messages_per_page=None, visibility_timeout=None, max_messages=None, **kwargs):
+        if max_messages is not None and messages_per_page is not None and max_messages < messages_per_page:
+            raise ValueError("max_messages must be greater or equal to messages_per_page")
+        self.receive_calls.append({"max_messages": max_messages, "messages_per_page": messages_per_page})
+        return FakePagedMessages(self, messages_per_page, max_messages)
+
+    def fetch(self, number_of_messages):
+        """Return up to number_of_messages from the next service response, leaving the rest visible."""
+        self.service_calls.append(number_of_messages)
+        if not self._responses:
+            return []
+        response = self._responses.pop(0)
+        page, rest = response[:number_of_messages], response[number_of_messages:]
+        if rest:
+            self._responses.insert(0, rest)
+        return page
+
+
+@pytest.fixture
+def queue_service():
+    return AzureQueueService()
+
+
+async def test_dispatches_whole_page_after_batch_deadline(queue_service, monkeypatch):
+    monkeypatch.setattr(app_settings.evaluation, 'queue_batch_timeout_ms', 0)
+    queue_client = FakeQueueClient(responses=[["m1", "m2", "m3"], ["m4"]])
+    queue_service.queue_client = queue_client
+    processed = []
+
+    async def fake_process(message, message_handler):
+        processed.append(message)
+
+    monkeypatch.setattr(queue_service, '_process_received_message', fake_process)
+    in_flight = set()
+
+    received = await queue_service._receive_and_dispatch(8, None, in_flight)
+    await asyncio.gather(*in_flight)
+
+    # The deadline passed during the first page, but every message already received is processed
+    assert received == 3
+    assert processed == ["m1", "m2", "m3"]
+    assert queue_client.receive_calls == [{"max_messages": 8, "messages_per_page": 8}]
+    assert queue_client.service_calls == [8]
+
+
+async def test_requests_more_pages_before_batch_deadline(queue_service, monkeypatch):
+    monkeypatch.setattr(app_settings.evaluation, 'queue_batch_timeout_ms', 60_000)
+    queue_client = FakeQueueClient(responses=[["m1"], ["m2", "m3"]])
+    queue_service.queue_client = queue_client
+    processed = []
+
+    async def fake_process(message, message_handler):
+        processed.append(message)
+
+    monkeypatch.setattr(queue_service, '_process_received_message', fake_process)
+    in_flight = set()
+
+    received = await queue_service._receive_and_dispatch(8, None, in_flight)
+    await asyncio.gather(*in_flight)
+
+    assert received == 3
+    assert processed == ["m1", "m2", "m3"]
+    # Each further page only asks for the messages still missing from the batch
+    assert queue_client.service_calls == [8, 7, 5]
+
+
+async def test_batch_is_received_in_one_service_call(queue_service, monkeypatch):
+    monkeypatch.setattr(app_settings.evaluation, 'queue_batch_timeout_ms', 60_000)
+    queue_client = FakeQueueClient(responses=[["m1", "m2", "m3", "m4", "m5"]])
+    queue_service.queue_client = queue_client
+    processed = []
+
+    async def fake_process(message, message_handler):
+        processed.append(message)
+
+    monkeypatch.setattr(queue_service, '_process_received_message', fake_process)
+    in_flight = set()
+
+    received = await queue_service._receive_and_dispatch(3, None, in_flight)
+    await asyncio.gather(*in_flight)
+
+    assert received == 3
+    assert processed == ["m1", "m2", "m3"]
+    assert queue_client.service_calls == [3]
+
+
+async def test_listener_only_requests_free_evaluation_slots(queue_service, monkeypatch):
+    monkeypatch.setattr(app_settings.evaluation, 'max_concurrent_evaluations', 2)
+    monkeypatch.setattr(app_settings.evaluation, 'queue_batch_size', 8)
+    monkeypatch.setattr(app_settings.evaluation, 'queue_polling_interval_seconds', 0)
+    queue_client = FakeQueueClient(responses=[["m1", "m2"]])
+    queue_service.queue_client = queue_client
+    started = []
+    release = asyncio.Event()
+
+    async def fake_process(message, message_handler):
+        started.append(message)
+        await release.wait()
+
+    monkeypatch.setattr(queue_service, '_process_received_message', fake_process)
+    listener = asyncio.create_task(queue_service.listen_for_messages(None))
+    try:
+        for _ in range(100):
+            if len(started) == 2:
+                break
+            await asyncio.sleep(0)
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        # Both slots are busy, so the listener waits instead of taking more messages
+        assert started == ["m1", "m2"]
+        assert queue_client.receive_calls == [{"max_messages": 2, "messages_per_page": 2}]
+
+        release.set()
+        for _ in range(100):
+            if len(queue_client.receive_calls) > 1:
+                break
+            await asyncio.sleep(0)
+
+        # Once the messages finish, polling resumes with the slots that became free
+        assert queue_client.receive_calls[1] == {"max_messages": 2, "messages_per_page": 2}
+    finally:
+        listener.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await listener